@@ -1,5 +1,6 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
+import json
 import sys
 import os
 
@@ -7,44 +8,71 @@ sys.path.append(os.getcwd())
 
 from Run.UrlPatternMatcher import UrlPatternMatcher
 from Run.GameRegistry import GameRegistry
+from Run.BatchSolver import BatchSolver
 from Run.GameComponentFactory import GameComponentFactory
+from Run.JobQueue import JobQueue, JobQueueFullError
+from Run.SolutionCache import SolutionCache
+from Run.SolverConfiguration import SolverConfiguration
 from Domain.Board.Grid import Grid
+from Domain.Board.GridSymmetry import GridSymmetry
 
 app = Flask(__name__)
 CORS(app)
 
 # Initialize registry to register all games
 UrlPatternMatcher()
+solution_cache = SolutionCache.from_environment()
+job_queue = JobQueue.from_environment()
+batch_solver = BatchSolver.from_environment()
 
 @app.route('/api/patterns', methods=['GET'])
 def get_patterns():
     """Returns the list of registered URL patterns."""
-    patterns = list(GameRegistry.get_all_patterns().keys())
+    patterns = GameRegistry.get_all_patterns()
     return jsonify({"patterns": patterns})
 
-@app.route('/api/solve', methods=['POST'])
-def solve_puzzle():
-    data = request.json
-    if not data or 'url' not in data:
-        return jsonify({"error": "Missing 'url' in request body"}), 400
+class SolveRequestError(Exception):
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
 
-    url = data['url']
-    grid_matrix = data.get('grid')
-    raw_data = data.get('data')
-    extra_data = data.get('extra_data', [])
+class SolveRequest:
+    def __init__(self, data: dict, solver_classes: dict[str, type] | None = None):
+        if not isinstance(data, dict) or 'url' not in data:
+            raise SolveRequestError("Missing 'url' in request body", 400)
 
-    if grid_matrix is None and raw_data is None:
-        return jsonify({"error": "Missing 'grid' or 'data' in request body"}), 400
+        grid_matrix = data.get('grid')
+        raw_data = data.get('data')
+        extra_data = data.get('extra_data', [])
+        if grid_matrix is None and raw_data is None:
+            raise SolveRequestError("Missing 'grid' or 'data' in request body", 400)
 
-    try:
         try:
-            components = GameRegistry.get_components_for_url(url)
-            solver_class = components[0]
-        except ValueError:
-             return jsonify({"error": "Unknown URL pattern or puzzle type"}), 404
+            self.configuration = SolverConfiguration.from_environment().merged_with(data.get('solver_config'))
+        except (TypeError, ValueError) as e:
+            raise SolveRequestError(f"Invalid 'solver_config': {e}", 400)
+
+        url = data['url']
+        if solver_classes is not None and url in solver_classes:
+            self.solver_class = solver_classes[url]
+        else:
+            try:
+                self.solver_class = GameRegistry.get_components_for_url(url)[0]
+            except ValueError:
+                raise SolveRequestError("Unknown URL pattern or puzzle type", 404)
+            if solver_classes is not None:
+                solver_classes[url] = self.solver_class
+
+        self.use_cache = data.get('use_cache', True)
+        cache_input = raw_data if raw_data is not None else grid_matrix
+        self.symmetry = None
+        if raw_data is None and GameRegistry.is_symmetry_invariant(self.solver_class) and not any(isinstance(item, list) for item in extra_data):
+            canonical_grid, self.symmetry = Grid(grid_matrix).canonical_form()
+            cache_input = canonical_grid.matrix
+        self.cache_key = SolutionCache.key(self.solver_class, cache_input, extra_data)
 
         if raw_data is not None:
-            game_data = raw_data
+            self.game_data = raw_data
         else:
             grid = Grid(grid_matrix)
             if extra_data:
@@ -54,34 +82,174 @@ def solve_puzzle():
                         processed_extra_data.append(Grid(item))
                     else:
                         processed_extra_data.append(item)
-                game_data = (grid, *processed_extra_data)
+                self.game_data = (grid, *processed_extra_data)
             else:
-                game_data = grid
+                self.game_data = grid
 
-        solver = GameComponentFactory.create_solver(solver_class, game_data)
-        solution = solver.get_solution()
-        if solution is None:
-             return jsonify({"status": "no_solution"}), 200
+    def cached_response(self) -> dict | None:
+        if not self.use_cache:
+            return None
+        cached_response = solution_cache.get(self.cache_key)
+        if cached_response is None:
+            return None
+        return transform_solution_response(cached_response, self.symmetry.inverse if self.symmetry else None)
 
-        if hasattr(solution, 'is_empty') and solution.is_empty():
-            return jsonify({"status": "no_solution"}), 200
+    def store_response(self, response: dict):
+        if self.use_cache and response["status"] == "solved":
+            solution_cache.put(self.cache_key, transform_solution_response(response, self.symmetry))
 
-        if hasattr(solution, 'matrix'):
-            return jsonify({
-                "status": "solved",
-                "solution": solution.matrix
-            })
-        else:
-            return jsonify({
-                "status": "solved",
-                "solution": str(solution)
-            })
+def solution_response(solution) -> dict:
+    if solution is None:
+        return {"status": "no_solution"}
+    if hasattr(solution, 'is_empty') and solution.is_empty():
+        return {"status": "no_solution"}
+    if hasattr(solution, 'matrix'):
+        return {
+            "status": "solved",
+            "solution": solution.matrix
+        }
+    return {
+        "status": "solved",
+        "solution": str(solution)
+    }
 
+@app.route('/api/solve', methods=['POST'])
+def solve_puzzle():
+    try:
+        solve_request = SolveRequest(request.json)
+        cached_response = solve_request.cached_response()
+        if cached_response is not None:
+            return jsonify(cached_response)
+
+        solver = GameComponentFactory.create_solver(solve_request.solver_class, solve_request.game_data, solve_request.configuration)
+        response = solution_response(solver.get_solution())
+        solve_request.store_response(response)
+        return jsonify(response)
+
+    except SolveRequestError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except Exception as e:
         print(f"Error solving puzzle: {e}")
         import traceback
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/solve/batch', methods=['POST'])
+def solve_batch():
+    try:
+        items = parse_batch_items(request.get_data(as_text=True))
+    except ValueError as e:
+        return jsonify({"error": f"Invalid batch: {e}"}), 400
+
+    def generate():
+        solve_requests = {}
+        solver_classes = {}
+        tasks = []
+        for index, item in enumerate(items):
+            try:
+                if isinstance(item, Exception):
+                    raise SolveRequestError(f"Invalid JSON: {item}", 400)
+                solve_request = SolveRequest(item, solver_classes)
+                cached_response = solve_request.cached_response()
+            except Exception as e:
+                yield batch_line(index, item, {"status": "error", "error": str(e)}, 0.0)
+                continue
+            if cached_response is not None:
+                yield batch_line(index, item, cached_response, 0.0)
+                continue
+            solve_requests[index] = solve_request
+            tasks.append((index, solve_request.solver_class, solve_request.game_data, solve_request.configuration))
+
+        for index, solution, error, seconds in batch_solver.solve(tasks):
+            if error is not None:
+                response = {"status": "error", "error": error}
+            else:
+                response = solution_response(solution)
+                solve_requests[index].store_response(response)
+            yield batch_line(index, items[index], response, seconds)
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+def parse_batch_items(body: str) -> list:
+    stripped_body = body.strip()
+    if stripped_body.startswith('['):
+        items = json.loads(stripped_body)
+        if not isinstance(items, list):
+            raise ValueError("expected a JSON array")
+        return items
+    items = []
+    for line in stripped_body.splitlines():
+        if not line.strip():
+            continue
+        try:
+            items.append(json.loads(line))
+        except json.JSONDecodeError as e:
+            items.append(e)
+    return items
+
+def batch_line(index: int, item, response: dict, seconds: float) -> str:
+    item_id = item.get('id') if isinstance(item, dict) else None
+    return json.dumps({"index": index, "id": item_id, **response, "time": seconds}) + "\n"
+
+def transform_solution_response(response: dict, symmetry: GridSymmetry | None) -> dict:
+    if symmetry is None or not isinstance(response.get("solution"), list):
+        return response
+    return {**response, "solution": Grid(response["solution"]).transformed(symmetry).matrix}
+
+@app.route('/api/cache/stats', methods=['GET'])
+def get_cache_stats():
+    return jsonify(solution_cache.stats())
+
+@app.route('/api/cache', methods=['DELETE'])
+def clear_cache():
+    solution_cache.clear()
+    return jsonify({"status": "cleared"})
+
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    data = request.json
+    try:
+        solve_request = SolveRequest(data)
+        timeout = data.get('timeout')
+        cached_response = solve_request.cached_response()
+        if cached_response is not None:
+            job = job_queue.add_finished(cached_response)
+        else:
+            job = job_queue.submit(
+                solve_request.solver_class, solve_request.game_data, solve_request.configuration,
+                timeout=float(timeout) if timeout is not None else None,
+                on_success=lambda solution: solve_request.store_response(solution_response(solution)))
+    except SolveRequestError as e:
+        return jsonify({"error": str(e)}), e.status_code
+    except JobQueueFullError as e:
+        return jsonify({"error": str(e)}), 503
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": f"Invalid 'timeout': {e}"}), 400
+    return jsonify(job_response(job)), 202
+
+@app.route('/api/jobs/metrics', methods=['GET'])
+def get_job_metrics():
+    return jsonify(job_queue.metrics())
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+    return jsonify(job_response(job))
+
+@app.route('/api/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    job = job_queue.cancel(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+    return jsonify(job_response(job))
+
+def job_response(job) -> dict:
+    response = job.to_dict()
+    if job.status == job.SUCCEEDED:
+        response["result"] = job.result if isinstance(job.result, dict) else solution_response(job.result)
+    return response
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
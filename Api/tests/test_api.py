@@ -2,6 +2,7 @@ import unittest
 import json
 import sys
 import os
+import time
 
 sys.path.append(os.getcwd())
 
@@ -87,5 +88,134 @@ class TestApi(unittest.TestCase):
         data = json.loads(response.data)
         self.assertIn("Initial numbers must be different", data["error"])
 
+    def test_solve_with_solver_config(self):
+        payload = {
+            "url": "https://www.puzzle-sudoku.com/",
+            "grid": [[-1] * 4 for _ in range(4)],
+            "solver_config": {"num_workers": 2, "max_time_in_seconds": 10, "random_seed": 1}
+        }
+        response = self.app.post('/api/solve',
+                                 data=json.dumps(payload),
+                                 content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data)["status"], "solved")
+
+    def test_solve_with_invalid_solver_config(self):
+        payload = {
+            "url": "https://www.puzzle-sudoku.com/",
+            "grid": [[-1] * 4 for _ in range(4)],
+            "solver_config": {"profile": "unknown"}
+        }
+        response = self.app.post('/api/solve',
+                                 data=json.dumps(payload),
+                                 content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("solver_config", json.loads(response.data)["error"])
+
+    def test_repeated_solve_is_served_from_cache(self):
+        self.app.delete('/api/cache')
+        initial_stats = json.loads(self.app.get('/api/cache/stats').data)
+        payload = {
+            "url": "https://www.puzzle-sudoku.com/",
+            "grid": [[1, -1, -1, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, -1, -1, 2]]
+        }
+        first_response = self.app.post('/api/solve', data=json.dumps(payload), content_type='application/json')
+        second_response = self.app.post('/api/solve', data=json.dumps(payload), content_type='application/json')
+        self.assertEqual(json.loads(first_response.data), json.loads(second_response.data))
+
+        stats = json.loads(self.app.get('/api/cache/stats').data)
+        self.assertEqual(initial_stats["hits"] + 1, stats["hits"])
+        self.assertEqual(initial_stats["misses"] + 1, stats["misses"])
+        self.assertEqual(initial_stats["stores"] + 1, stats["stores"])
+
+    def test_rotated_puzzle_is_served_from_cache(self):
+        self.app.delete('/api/cache')
+        grid_matrix = [
+            [-1, 1, 1, 0, 0, -1],
+            [0, -1, 1, 0, -1, 0],
+            [1, 0, -1, -1, 1, 0],
+            [1, 0, -1, -1, 0, 1],
+            [0, -1, 0, 1, -1, 0],
+            [-1, 0, 0, 1, 0, -1]
+        ]
+        rotated_grid_matrix = [list(row) for row in zip(*grid_matrix[::-1])]
+        first_response = self.app.post('/api/solve', data=json.dumps({"url": "https://www.puzzle-binairo.com/", "grid": grid_matrix}), content_type='application/json')
+        initial_stats = json.loads(self.app.get('/api/cache/stats').data)
+        rotated_response = self.app.post('/api/solve', data=json.dumps({"url": "https://www.puzzle-binairo.com/", "grid": rotated_grid_matrix}), content_type='application/json')
+
+        stats = json.loads(self.app.get('/api/cache/stats').data)
+        self.assertEqual(initial_stats["hits"] + 1, stats["hits"])
+        solution = json.loads(first_response.data)["solution"]
+        self.assertEqual([list(row) for row in zip(*solution[::-1])], json.loads(rotated_response.data)["solution"])
+
+    def test_job_is_solved_asynchronously(self):
+        grid_matrix = [
+            [-1, 3, -1, 4],
+            [2, -1, 1, -1],
+            [-1, 2, -1, 1],
+            [3, -1, 4, -1]
+        ]
+        payload = {"url": "https://www.puzzle-sudoku.com/", "grid": grid_matrix, "use_cache": False, "timeout": 20}
+        response = self.app.post('/api/jobs', data=json.dumps(payload), content_type='application/json')
+        self.assertEqual(202, response.status_code)
+        job_id = json.loads(response.data)["id"]
+
+        deadline = time.monotonic() + 20
+        job = json.loads(self.app.get(f'/api/jobs/{job_id}').data)
+        while job["status"] in ("queued", "running") and time.monotonic() < deadline:
+            time.sleep(0.05)
+            job = json.loads(self.app.get(f'/api/jobs/{job_id}').data)
+        self.assertEqual("succeeded", job["status"])
+        self.assertEqual({"status": "solved", "solution": [[1, 3, 2, 4], [2, 4, 1, 3], [4, 2, 3, 1], [3, 1, 4, 2]]}, job["result"])
+
+        metrics = json.loads(self.app.get('/api/jobs/metrics').data)
+        self.assertGreaterEqual(metrics["finished"]["succeeded"], 1)
+        self.assertIn("queue_depth", metrics)
+
+    def test_unknown_job(self):
+        self.assertEqual(404, self.app.get('/api/jobs/unknown').status_code)
+        self.assertEqual(404, self.app.delete('/api/jobs/unknown').status_code)
+
+    def test_job_with_invalid_timeout(self):
+        payload = {"url": "https://www.puzzle-sudoku.com/", "grid": [[-1]], "timeout": -1}
+        response = self.app.post('/api/jobs', data=json.dumps(payload), content_type='application/json')
+        self.assertEqual(400, response.status_code)
+
+    def test_solve_batch_streams_ndjson(self):
+        grid_matrix = [
+            [-1, 3, -1, 4],
+            [2, -1, 1, -1],
+            [-1, 2, -1, 1],
+            [3, -1, 4, -1]
+        ]
+        items = [
+            {"id": "first", "url": "https://www.puzzle-sudoku.com/", "grid": grid_matrix, "use_cache": False},
+            {"id": "unknown", "url": "https://invalid-url.com", "grid": grid_matrix},
+            {"id": "second", "url": "https://www.puzzle-sudoku.com/", "grid": grid_matrix, "use_cache": False},
+        ]
+        body = "\n".join(json.dumps(item) for item in items) + "\nnot json\n"
+        response = self.app.post('/api/solve/batch', data=body, content_type='application/x-ndjson')
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('application/x-ndjson', response.mimetype)
+        results = {line["index"]: line for line in map(json.loads, response.get_data(as_text=True).splitlines())}
+        self.assertEqual({0, 1, 2, 3}, set(results))
+        self.assertEqual(("first", "solved", [1, 3, 2, 4]), (results[0]["id"], results[0]["status"], results[0]["solution"][0]))
+        self.assertEqual(("second", "solved"), (results[2]["id"], results[2]["status"]))
+        self.assertEqual(("unknown", "error"), (results[1]["id"], results[1]["status"]))
+        self.assertEqual("error", results[3]["status"])
+        self.assertIn("time", results[0])
+
+    def test_solve_batch_accepts_json_array(self):
+        items = [{"url": "https://www.puzzle-sudoku.com/", "grid": [[-1, 3, -1, 4], [2, -1, 1, -1], [-1, 2, -1, 1], [3, -1, 4, -1]]}]
+        response = self.app.post('/api/solve/batch', data=json.dumps(items), content_type='application/json')
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertEqual(1, len(lines))
+        self.assertEqual("solved", json.loads(lines[0])["status"])
+
+    def test_solve_batch_rejects_malformed_array(self):
+        response = self.app.post('/api/solve/batch', data='[{"url": ', content_type='application/json')
+        self.assertEqual(400, response.status_code)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,171 @@
+from typing import Any, FrozenSet, Generator, Sequence
+
+import numpy as np
+
+from Domain.Board.Grid import Grid
+from Domain.Board.GridBase import GridBase
+from Domain.Board.GridConnectivity import GridConnectivity
+from Domain.Board.Position import Position
+
+
+class ArrayGrid(Grid):
+    """Numeric or boolean grid stored in a 2D ndarray, with vectorized region, count and connectivity queries."""
+
+    def __init__(self, matrix: np.ndarray | Sequence[Sequence]):
+        array = np.asarray(matrix)
+        if array.ndim != 2:
+            raise ValueError(f"ArrayGrid needs a 2D matrix, got {array.ndim} dimension(s)")
+        if array.dtype.kind not in 'biuf':
+            raise ValueError(f"ArrayGrid only stores numeric or boolean values, got {array.dtype}")
+        self._array = array
+        super().__init__(array)
+
+    @classmethod
+    def from_grid(cls, grid: GridBase, dtype=None) -> 'ArrayGrid':
+        array_grid = cls(np.array(grid.matrix, dtype=dtype))
+        array_grid.set_walls(set(grid.walls))
+        return array_grid
+
+    @classmethod
+    def from_solver_values(cls, values: Sequence[int], variable_indexes: np.ndarray, dtype=None) -> 'ArrayGrid':
+        """Grid of the values at `variable_indexes` (a 2D array of variable indexes) in a solver's flat solution vector."""
+        return cls(np.asarray(values, dtype=dtype)[variable_indexes])
+
+    def __getitem__(self, key):
+        if isinstance(key, Position):
+            return self._array[key.r, key.c].item()
+        if isinstance(key, tuple):
+            return self._array[key].item()
+        return self._array[key]
+
+    def __setitem__(self, key, value):
+        if isinstance(key, Position):
+            self._array[key.r, key.c] = value
+        else:
+            self._array[key] = value
+
+    def __eq__(self, other):
+        if isinstance(other, ArrayGrid):
+            return np.array_equal(self._array, other._array)
+        if not issubclass(type(other), GridBase):
+            return False
+        return self.matrix == other.matrix
+
+    def __iter__(self) -> Generator[tuple[Position, Any], None, None]:
+        for positions, row in zip(self._positions_by_row(), self._array.tolist()):
+            yield from zip(positions, row)
+
+    def __repr__(self) -> str:
+        return repr(Grid(self.matrix))
+
+    def __hash__(self):
+        return hash((self._array.shape, self._array.dtype.str, self._array.tobytes()))
+
+    @property
+    def matrix(self) -> list[list]:
+        return self._array.tolist()
+
+    @property
+    def array(self) -> np.ndarray:
+        return self._array
+
+    def value(self, r_or_position, c=None):
+        if isinstance(r_or_position, Position):
+            return self._array[r_or_position.r, r_or_position.c].item()
+        return self._array[r_or_position, c].item()
+
+    def is_empty(self):
+        return self._array.size == 0
+
+    def to_console_string(self, police_color_grid=None, back_ground_color_grid=None, interline=False):
+        return Grid(self.matrix).to_console_string(police_color_grid, back_ground_color_grid, interline)
+
+    def min_value(self) -> float:
+        return float(np.nanmin(self._array))
+
+    def max_value(self) -> float:
+        return float(np.nanmax(self._array))
+
+    def count(self, value) -> int:
+        return int(np.count_nonzero(self._array == value))
+
+    def count_by_value(self) -> dict[Any, int]:
+        values, counts = np.unique(self._array, return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist()))
+
+    def get_regions(self) -> dict[Any, FrozenSet[Position]]:
+        values, inverse = np.unique(self._array, return_inverse=True)
+        return dict(zip(values.tolist(), self._group_positions(inverse.reshape(-1), len(values), 0)))
+
+    def label(self, value=True, mode='orthogonal') -> tuple[np.ndarray, int]:
+        """Connected components of the cells equal to `value`, numbered from 1 in row-major order of their first cell; 0 elsewhere."""
+        mask = (self._array == value).reshape(-1)
+        parents = np.arange(mask.size)
+        sources, targets = self._adjacent_pairs(mask, mode)
+        while True:
+            source_roots, target_roots = parents[sources], parents[targets]
+            merging = source_roots != target_roots
+            if not merging.any():
+                break
+            np.minimum.at(parents, np.maximum(source_roots, target_roots)[merging], np.minimum(source_roots, target_roots)[merging])
+            while True:
+                grand_parents = parents[parents]
+                if np.array_equal(grand_parents, parents):
+                    break
+                parents = grand_parents
+        labels = np.zeros(mask.size, dtype=np.int64)
+        roots, component_indexes = np.unique(parents[mask], return_inverse=True)
+        labels[mask] = component_indexes + 1
+        return labels.reshape(self._array.shape), len(roots)
+
+    def are_cells_connected(self, value=True, mode='orthogonal') -> bool:
+        return self.label(value, mode)[1] == 1
+
+    def get_all_shapes(self, value=True, mode='orthogonal') -> set[FrozenSet[Position]]:
+        labels, components_count = self.label(value, mode)
+        return set(self._group_positions(labels.reshape(-1), components_count, 1))
+
+    def different_neighbors_mask(self) -> np.ndarray:
+        """True on the cells having at least one orthogonal neighbor of a different value (walls are ignored)."""
+        mask = np.zeros(self._array.shape, dtype=bool)
+        horizontal = self._array[:, :-1] != self._array[:, 1:]
+        vertical = self._array[:-1, :] != self._array[1:, :]
+        mask[:, :-1] |= horizontal
+        mask[:, 1:] |= horizontal
+        mask[:-1, :] |= vertical
+        mask[1:, :] |= vertical
+        return mask
+
+    def find_different_neighbors_positions(self) -> list[tuple[Position, Position]]:
+        positions = self.get_positions()
+        flat = self._array.reshape(-1)
+        sources, targets = self._adjacent_pairs(np.ones(flat.size, dtype=bool), 'orthogonal')
+        different = flat[sources] != flat[targets]
+        return [(positions[source], positions[target]) for source, target in zip(sources[different].tolist(), targets[different].tolist())]
+
+    def _adjacent_pairs(self, mask: np.ndarray, mode: str) -> tuple[np.ndarray, np.ndarray]:
+        rows_number, columns_number = self._array.shape
+        indexes = np.arange(mask.size).reshape(rows_number, columns_number)
+        mask = mask.reshape(rows_number, columns_number)
+        sources, targets = [], []
+        if mode not in GridConnectivity.NEIGHBOR_OFFSETS:
+            raise ValueError(f"Invalid mode: {mode}")
+        for dr, dc in GridConnectivity.NEIGHBOR_OFFSETS[mode]:
+            source_slice = (slice(0, rows_number - dr), slice(max(0, -dc), columns_number - max(0, dc)))
+            target_slice = (slice(dr, rows_number), slice(max(0, dc), columns_number - max(0, -dc)))
+            both = mask[source_slice] & mask[target_slice]
+            sources.append(indexes[source_slice][both])
+            targets.append(indexes[target_slice][both])
+        sources, targets = np.concatenate(sources), np.concatenate(targets)
+        if not self._walls:
+            return sources, targets
+        walls = {tuple(sorted(position.r * columns_number + position.c for position in wall)) for wall in self._walls}
+        open_pairs = np.array([(source, target) not in walls for source, target in zip(sources.tolist(), targets.tolist())], dtype=bool)
+        return sources[open_pairs], targets[open_pairs]
+
+    def _group_positions(self, groups: np.ndarray, groups_count: int, first_group: int) -> list[FrozenSet[Position]]:
+        positions = self.get_positions()
+        order = np.argsort(groups, kind='stable')
+        bounds = np.searchsorted(groups[order], np.arange(first_group, first_group + groups_count + 1)).tolist()
+        order = order.tolist()
+        return [frozenset(positions[index] for index in order[bounds[group]:bounds[group + 1]]) for group in range(groups_count)]
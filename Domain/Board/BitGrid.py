@@ -0,0 +1,262 @@
+from typing import Any, Callable, Generator, Iterable, Sequence
+
+from Domain.Board.Grid import Grid
+from Domain.Board.GridBase import GridBase
+from Domain.Board.Position import Position
+
+
+class BitGrid:
+    """Immutable boolean grid packed in a Python int, bit `r * columns_number + c` holding cell (r, c)."""
+
+    __slots__ = ('rows_number', 'columns_number', 'bits', '_full_mask', '_not_first_column', '_not_last_column')
+
+    def __init__(self, rows_number: int, columns_number: int, bits: int = 0):
+        if rows_number < 0 or columns_number < 0:
+            raise ValueError(f"BitGrid dimensions must be positive, got {rows_number}x{columns_number}")
+        self.rows_number = rows_number
+        self.columns_number = columns_number
+        self._full_mask = (1 << (rows_number * columns_number)) - 1
+        if bits & ~self._full_mask:
+            raise ValueError(f"BitGrid bits exceed a {rows_number}x{columns_number} grid")
+        self.bits = bits
+        first_column = sum(1 << (r * columns_number) for r in range(rows_number))
+        self._not_first_column = self._full_mask & ~first_column
+        self._not_last_column = self._full_mask & ~(first_column << (columns_number - 1)) if columns_number else 0
+
+    @classmethod
+    def from_values(cls, rows_number: int, columns_number: int, values: Iterable[Any]) -> 'BitGrid':
+        """Grid of the truthiness of `values`, given in row-major order."""
+        digits = ''.join('1' if value else '0' for value in values)
+        if len(digits) != rows_number * columns_number:
+            raise ValueError(f"BitGrid needs {rows_number * columns_number} values, got {len(digits)}")
+        return cls(rows_number, columns_number, int(digits[::-1], 2) if digits else 0)
+
+    @classmethod
+    def from_solver_values(cls, rows_number: int, columns_number: int, values: Sequence[int], variable_indexes: Sequence[int]) -> 'BitGrid':
+        """Grid of the values at the row-major `variable_indexes` in a solver's flat solution vector."""
+        return cls.from_values(rows_number, columns_number, (values[index] for index in variable_indexes))
+
+    @classmethod
+    def from_matrix(cls, matrix: Sequence[Sequence[Any]], predicate: Callable[[Any], bool] = bool) -> 'BitGrid':
+        columns_number = len(matrix[0]) if matrix else 0
+        return cls.from_values(len(matrix), columns_number, (predicate(value) for row in matrix for value in row))
+
+    @classmethod
+    def from_grid(cls, grid: GridBase, predicate: Callable[[Any], bool] = bool) -> 'BitGrid':
+        return cls.from_matrix(grid.matrix, predicate)
+
+    @classmethod
+    def from_positions(cls, rows_number: int, columns_number: int, positions: Iterable[Position]) -> 'BitGrid':
+        bits = 0
+        for position in positions:
+            bits |= 1 << (position.r * columns_number + position.c)
+        return cls(rows_number, columns_number, bits)
+
+    @classmethod
+    def from_hex(cls, rows_number: int, columns_number: int, text: str) -> 'BitGrid':
+        return cls(rows_number, columns_number, int(text, 16))
+
+    def to_hex(self) -> str:
+        return format(self.bits, 'x')
+
+    def to_matrix(self, true_value: Any = True, false_value: Any = False) -> list[list[Any]]:
+        digits = format(self.bits, f'0{self.rows_number * self.columns_number}b')[::-1] if self.columns_number else ''
+        return [[true_value if digit == '1' else false_value for digit in digits[r * self.columns_number:(r + 1) * self.columns_number]] for r in range(self.rows_number)]
+
+    def to_grid(self, true_value: Any = True, false_value: Any = False) -> Grid:
+        if self.is_empty():
+            return Grid.empty()
+        return Grid(self.to_matrix(true_value, false_value))
+
+    @property
+    def matrix(self) -> list[list[bool]]:
+        return self.to_matrix()
+
+    def is_empty(self) -> bool:
+        return self.rows_number == 0 or self.columns_number == 0
+
+    def _with_bits(self, bits: int) -> 'BitGrid':
+        bit_grid = object.__new__(BitGrid)
+        bit_grid.rows_number = self.rows_number
+        bit_grid.columns_number = self.columns_number
+        bit_grid.bits = bits
+        bit_grid._full_mask = self._full_mask
+        bit_grid._not_first_column = self._not_first_column
+        bit_grid._not_last_column = self._not_last_column
+        return bit_grid
+
+    def _bits_of(self, other: 'BitGrid | int') -> int:
+        if isinstance(other, BitGrid):
+            if (other.rows_number, other.columns_number) != (self.rows_number, self.columns_number):
+                raise ValueError(f"BitGrid sizes differ: {self.rows_number}x{self.columns_number} and {other.rows_number}x{other.columns_number}")
+            return other.bits
+        return other
+
+    def __and__(self, other: 'BitGrid | int') -> 'BitGrid':
+        return self._with_bits(self.bits & self._bits_of(other))
+
+    def __or__(self, other: 'BitGrid | int') -> 'BitGrid':
+        return self._with_bits((self.bits | self._bits_of(other)) & self._full_mask)
+
+    def __xor__(self, other: 'BitGrid | int') -> 'BitGrid':
+        return self._with_bits((self.bits ^ self._bits_of(other)) & self._full_mask)
+
+    def __sub__(self, other: 'BitGrid | int') -> 'BitGrid':
+        return self._with_bits(self.bits & ~self._bits_of(other))
+
+    def __invert__(self) -> 'BitGrid':
+        return self._with_bits(~self.bits & self._full_mask)
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BitGrid):
+            return False
+        return (self.rows_number, self.columns_number, self.bits) == (other.rows_number, other.columns_number, other.bits)
+
+    def __hash__(self) -> int:
+        return hash((self.rows_number, self.columns_number, self.bits))
+
+    def __getitem__(self, position: Position) -> bool:
+        if not (0 <= position.r < self.rows_number and 0 <= position.c < self.columns_number):
+            raise IndexError(f"{position} is outside a {self.rows_number}x{self.columns_number} BitGrid")
+        return bool(self.bits >> (position.r * self.columns_number + position.c) & 1)
+
+    def __iter__(self) -> Generator[tuple[Position, bool], None, None]:
+        for index, row in enumerate(self.to_matrix()):
+            for c, value in enumerate(row):
+                yield Position(index, c), value
+
+    def __repr__(self) -> str:
+        return f"BitGrid({self.rows_number}, {self.columns_number}, 0x{self.to_hex()})"
+
+    def __str__(self) -> str:
+        return '\n'.join(''.join('1' if value else '0' for value in row) for row in self.to_matrix())
+
+    def with_position(self, position: Position, value: bool = True) -> 'BitGrid':
+        bit = 1 << (position.r * self.columns_number + position.c)
+        return self._with_bits(self.bits | bit if value else self.bits & ~bit)
+
+    def indexes(self) -> Generator[int, None, None]:
+        bits = self.bits
+        while bits:
+            lowest = bits & -bits
+            yield lowest.bit_length() - 1
+            bits ^= lowest
+
+    def positions(self) -> Generator[Position, None, None]:
+        for index in self.indexes():
+            yield Position(*divmod(index, self.columns_number))
+
+    def row_mask(self, r: int) -> int:
+        return ((1 << self.columns_number) - 1) << (r * self.columns_number)
+
+    def column_mask(self, c: int) -> int:
+        return (self._full_mask & ~self._not_first_column) << c
+
+    def region_mask(self, positions: Iterable[Position]) -> int:
+        return BitGrid.from_positions(self.rows_number, self.columns_number, positions).bits
+
+    def count(self, mask: int | None = None) -> int:
+        return (self.bits if mask is None else self.bits & mask).bit_count()
+
+    def row_counts(self) -> list[int]:
+        row_bits = (1 << self.columns_number) - 1
+        return [(self.bits >> (r * self.columns_number) & row_bits).bit_count() for r in range(self.rows_number)]
+
+    def column_counts(self) -> list[int]:
+        return [(self.bits & self.column_mask(c)).bit_count() for c in range(self.columns_number)]
+
+    def region_counts(self, region_masks: dict[Any, int]) -> dict[Any, int]:
+        return {key: (self.bits & mask).bit_count() for key, mask in region_masks.items()}
+
+    def shift(self, dr: int, dc: int) -> 'BitGrid':
+        """Grid where cell (r, c) holds cell (r - dr, c - dc); cells shifted off the grid are dropped."""
+        return self._with_bits(self._shift_bits(self.bits, dr, dc))
+
+    def _shift_bits(self, bits: int, dr: int, dc: int) -> int:
+        for _ in range(abs(dc)):
+            bits = (bits & self._not_last_column) << 1 if dc > 0 else (bits & self._not_first_column) >> 1
+        offset = dr * self.columns_number
+        bits = bits << offset if offset >= 0 else bits >> -offset
+        return bits & self._full_mask
+
+    def up(self) -> 'BitGrid':
+        return self.shift(-1, 0)
+
+    def down(self) -> 'BitGrid':
+        return self.shift(1, 0)
+
+    def left(self) -> 'BitGrid':
+        return self.shift(0, -1)
+
+    def right(self) -> 'BitGrid':
+        return self.shift(0, 1)
+
+    def neighbors(self, mode: str = 'orthogonal') -> 'BitGrid':
+        """Cells adjacent to at least one set cell, in the neighbour modes of Grid.neighbors_positions."""
+        return self._with_bits(self._neighbor_bits(self.bits, mode))
+
+    def _neighbor_bits(self, bits: int, mode: str) -> int:
+        if mode not in ('orthogonal', 'diagonal', 'all', 'diagonal_only'):
+            raise ValueError(f"Unknown neighbors mode: {mode}")
+        horizontal = (bits & self._not_first_column) >> 1 | (bits & self._not_last_column) << 1
+        vertical_source = bits if mode == 'orthogonal' else horizontal if mode == 'diagonal_only' else bits | horizontal
+        vertical = (vertical_source << self.columns_number | vertical_source >> self.columns_number) & self._full_mask
+        return vertical if mode == 'diagonal_only' else (horizontal | vertical) & self._full_mask
+
+    def runs(self, length: int, dr: int, dc: int) -> 'BitGrid':
+        """First cells of runs of at least `length` set cells going in direction (dr, dc)."""
+        starts = self
+        step = self
+        for _ in range(length - 1):
+            step = step.shift(-dr, -dc)
+            starts = starts & step
+        return starts
+
+    def has_run(self, length: int, mode: str = 'orthogonal') -> bool:
+        directions = [(0, 1), (1, 0)] if mode == 'orthogonal' else [(0, 1), (1, 0), (1, 1), (1, -1)]
+        return any(self.runs(length, dr, dc) for dr, dc in directions)
+
+    def has_adjacent(self, mode: str = 'orthogonal') -> bool:
+        return bool(self & self.neighbors(mode))
+
+    def blocks_2x2(self) -> 'BitGrid':
+        """Top-left cells of fully set 2x2 blocks."""
+        horizontal = self & self.left()
+        return horizontal & horizontal.up()
+
+    def has_2x2_block(self) -> bool:
+        return bool(self.blocks_2x2())
+
+    def flood_fill(self, seeds: 'BitGrid | int', mode: str = 'orthogonal') -> 'BitGrid':
+        """Set cells connected to `seeds` through set cells."""
+        filled = self.bits & self._bits_of(seeds)
+        while True:
+            grown = filled | (self._neighbor_bits(filled, mode) & self.bits)
+            if grown == filled:
+                return self._with_bits(filled)
+            filled = grown
+
+    def components(self, mode: str = 'orthogonal') -> list['BitGrid']:
+        components = []
+        remaining = self
+        while remaining:
+            component = remaining.flood_fill(remaining.bits & -remaining.bits, mode)
+            components.append(component)
+            remaining = remaining - component
+        return components
+
+    def is_connected(self, mode: str = 'orthogonal') -> bool:
+        if not self:
+            return True
+        return self.flood_fill(self.bits & -self.bits, mode) == self
+
+    def shapes(self, mode: str = 'orthogonal') -> set[frozenset[Position]]:
+        return {frozenset(component.positions()) for component in self.components(mode)}
+
+    def exclusion_literals(self, variables: Iterable[Any], negate: Callable[[Any], Any]) -> list[Any]:
+        """Literals, one per row-major variable, of which at least one holds in any other assignment."""
+        bits = self.bits
+        return [negate(variable) if bits >> index & 1 else variable for index, variable in enumerate(variables)]
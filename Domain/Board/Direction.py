@@ -1,27 +1,26 @@
 ﻿class Direction:
-    def __init__(self, value):
+    __slots__ = ('_value',)
+    _instances: dict[int, 'Direction'] = {}
+    _names = {'down': 1, 'right': 2, 'up': 3, 'left': 4}
+
+    def __new__(cls, value):
+        if isinstance(value, Direction):
+            return value
         if isinstance(value, str):
-            if value == 'down':
-                self._value = Direction._DOWN
-                return
-            if value == 'right':
-                self._value = Direction._RIGHT
-                return
-            if value == 'up':
-                self._value = Direction._UP
-                return
-            if value == 'left':
-                self._value = Direction._LEFT
-                return
-            else:
+            if value not in Direction._names:
                 raise ValueError(f"Unknown direction {value}")
-        if value not in Direction._orthogonal_directions_values() and value != Direction._NONE:
-            raise ValueError(f"Unknown direction {value}")
-        self._value = value
+            value = Direction._names[value]
+        try:
+            return Direction._instances[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"Unknown direction {value}") from None
+
+    def __reduce__(self):
+        return Direction, (self._value,)
 
     @staticmethod
     def orthogonal_directions():
-        return [Direction.up(), Direction.left(), Direction.down(), Direction.right()]
+        return [_UP, _LEFT, _DOWN, _RIGHT]
 
     @staticmethod
     def _orthogonal_directions_values():
@@ -29,35 +28,27 @@
 
     @staticmethod
     def up():
-        return Direction(Direction._UP)
+        return _UP
 
     @staticmethod
     def down():
-        return Direction(Direction._DOWN)
+        return _DOWN
 
     @staticmethod
     def right():
-        return Direction(Direction._RIGHT)
+        return _RIGHT
 
     @staticmethod
     def left():
-        return Direction(Direction._LEFT)
+        return _LEFT
 
     @staticmethod
     def none():
-        return Direction(Direction._NONE)
+        return _NONE
 
     @property
     def opposite(self):
-        if self.value == Direction._DOWN:
-            return Direction.up()
-        if self.value == Direction._UP:
-            return Direction.down()
-        if self.value == Direction._RIGHT:
-            return Direction.left()
-        if self.value == Direction._LEFT:
-            return Direction.right()
-        return Direction(Direction._NONE)
+        return _OPPOSITES[self._value]
 
     @property
     def value(self):
@@ -75,12 +66,14 @@
         return 'x'
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, Direction):
-            return self.value == other.value
+            return self._value == other._value
         if isinstance(other, str):
             return self.__str__() == other
         if isinstance(other, int):
-            return self.value == other
+            return self._value == other
         return False
 
     def __repr__(self):
@@ -94,3 +87,18 @@
     _RIGHT = 2
     _UP = 3
     _LEFT = 4
+
+
+def _create_direction(value: int) -> Direction:
+    direction = object.__new__(Direction)
+    direction._value = value
+    Direction._instances[value] = direction
+    return direction
+
+
+_NONE = _create_direction(Direction._NONE)
+_DOWN = _create_direction(Direction._DOWN)
+_RIGHT = _create_direction(Direction._RIGHT)
+_UP = _create_direction(Direction._UP)
+_LEFT = _create_direction(Direction._LEFT)
+_OPPOSITES = {Direction._NONE: _NONE, Direction._DOWN: _UP, Direction._UP: _DOWN, Direction._RIGHT: _LEFT, Direction._LEFT: _RIGHT}
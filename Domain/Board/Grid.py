@@ -18,13 +18,6 @@ class Grid[T](GridBase[T]):
     def __init__(self, matrix: list[list[T]]):
         super().__init__(matrix)
 
-    def __getitem__(self, key) -> T:
-        if isinstance(key, Position):
-            return self._matrix[key.r][key.c]
-        if isinstance(key, tuple):
-            return self._matrix[key[0]][key[1]]
-        return self._matrix[key]
-
     def __repr__(self) -> str:
         if self.is_empty():
             return 'Grid.empty()'
@@ -32,9 +25,6 @@ class Grid[T](GridBase[T]):
             return '\n'.join(''.join(str(cell) for cell in row) for row in self._matrix)
         return '\n'.join(' '.join(str(cell) for cell in row) for row in self._matrix)
 
-    def __hash__(self):
-        return hash(str(self._matrix))
-
     @property
     def values(self) -> Iterable[T]:
         return (self[position] for position, _ in self)
@@ -60,10 +50,6 @@ class Grid[T](GridBase[T]):
             return Island.from_str(Position(row, column), grid_element)
         raise ValueError(f"Unsupported element type: {element_type}")
 
-    @property
-    def matrix(self):
-        return self._matrix
-
     @staticmethod
     def empty() -> 'Grid':
         return Grid([[]])
@@ -74,6 +60,7 @@ class Grid[T](GridBase[T]):
         return self._matrix[r_or_position][c]
 
     def set_value(self, position: Position, value):
+        self._hash = None
         self._matrix[position.r][position.c] = value
 
     def to_console_string(self, police_color_grid=None, back_ground_color_grid=None, interline=False):
@@ -112,13 +99,6 @@ class Grid[T](GridBase[T]):
                 regions[self._matrix[r][c]].add(Position(r, c))
         return {key: frozenset(value) for key, value in regions.items()} if regions else {}
 
-    def are_cells_connected(self, value: T = True, mode='orthogonal') -> bool:
-        position = self._get_cell_of_value(value)
-        if position is None:
-            return False
-        visited = self._depth_first_search(position, value, mode)
-        return len(visited) == sum(cell == value for row in self._matrix for cell in row)
-
     def get_connected_positions(self, value_to_search: T = True) -> list[set[Position]]:
         total_positions = self.columns_number * self.rows_number
         visited_list: list[set[Position]] = []
@@ -130,69 +110,11 @@ class Grid[T](GridBase[T]):
             visited_flat.update(visited_in_this_pass)
         return visited_list
 
-    def get_all_shapes(self, value=True, mode='orthogonal') -> set[frozenset[Position]]:
-        excluded = []
-        shapes = set()
-        while True:
-            position = self._get_cell_of_value(value, excluded)
-            if position is None:
-                break
-            if any(position in shape for shape in shapes):
-                excluded.append(position)
-                continue
-            visited = self._depth_first_search(position, value, mode)
-            shapes.add(frozenset(visited))
-            excluded.append(position)
-        return shapes
-
-    def are_min_2_connected_cells_touch_border(self, position, mode='orthogonal') -> tuple[bool, set[Position]]:
-        value = self.value(position)
-        visited = self._depth_first_search(position, value, mode)
-        if len(visited) <= 1:
-            return False, set()
-        border_cells = set()
-        for cell in visited:
-            if cell[0] == 0 or cell[0] == self.rows_number - 1 or cell[1] == 0 or cell[1] == self.columns_number - 1:
-                border_cells.add(cell)
-        return len(border_cells) >= 2, visited
-
-    def find_all_min_2_connected_cells_touch_border(self, value, mode='orthogonal') -> set[frozenset[Position]]:
-        excluded = []
-        cells_sets: set[frozenset[Position]] = set()
-        while True:
-            position = self._get_cell_of_value(value, excluded)
-            if position is None:
-                break
-            if any(position in cells_set for cells_set in cells_sets):
-                excluded.append(position)
-                continue
-            are_touch_border, cells = self.are_min_2_connected_cells_touch_border(position, mode)
-            if are_touch_border:
-                cells_sets.add(frozenset(cells))
-            excluded.append(position)
-        return cells_sets
-
-    def _depth_first_search(self, position: Position, value, mode='orthogonal', visited=None) -> set[Position]:
-        if visited is None:
-            visited = set()
-        if (self.value(position) != value) or (position in visited):
-            return visited
-        visited.add(position)
-
-        neighbors_positions = self.neighbors_positions(position, mode)
-        for neighbor_position in neighbors_positions:
-            if self.value(neighbor_position) == value:
-                new_visited = self._depth_first_search(neighbor_position, value, mode, visited)
-                if new_visited != visited:
-                    return new_visited
-
-        return visited
-
-    def _get_cell_of_value(self, value, excluded=None) -> Position | None:
-        if excluded is None:
-            excluded = []
-        return next((Position(i, j) for i in range(self.rows_number) for j in range(self.columns_number) if
-                     self._matrix[i][j] == value and Position(i, j) not in excluded), None)
+    def _connectivity_mode(self, mode: str) -> str:
+        return mode
+
+    def _connectivity_walls(self) -> set[frozenset[Position]]:
+        return self._walls
 
     @staticmethod
     def get_adjacent_combinations(neighbor_length: int, block_length: int, circular: bool) -> list[list[bool]]:
@@ -234,9 +156,6 @@ class Grid[T](GridBase[T]):
     def list_to_string(values):
         return sum(values)
 
-    def is_empty(self):
-        return self == Grid.empty()
-
     def straddled_neighbors_positions(self, position: Position) -> set[Position]:
         return {neighbor for neighbor in position.straddled_neighbors() if neighbor in self}
 
@@ -0,0 +1,85 @@
+from typing import FrozenSet
+
+from Domain.Board.Position import Position
+
+
+class GridAdjacency:
+    """Neighbour, wall and ray tables of a grid, indexed by row-major cell index and built for one walls set."""
+
+    UP, DOWN, LEFT, RIGHT, UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT = range(8)
+    ORTHOGONAL = (UP, DOWN, LEFT, RIGHT)
+    DIAGONAL = (UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT)
+    OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+
+    def __init__(self, rows_number: int, columns_number: int, walls: set[FrozenSet[Position]]):
+        self.rows_number = rows_number
+        self.columns_number = columns_number
+        self.walls = walls
+        self.walls_count = len(walls)
+        self.positions = [Position(r, c) for r in range(rows_number) for c in range(columns_number)]
+        self.wall_masks = self._compute_wall_masks()
+        self.neighbors = [self._compute_neighbors(direction) for direction in range(len(self.OFFSETS))]
+        self.orthogonal_neighbors = [tuple(neighbor for neighbor in cell_neighbors if neighbor is not None) for cell_neighbors in zip(*self.neighbors[:4])]
+        self.diagonal_neighbors = [tuple(neighbor for neighbor in cell_neighbors if neighbor is not None) for cell_neighbors in zip(*self.neighbors[4:])]
+        self._ray_lengths: dict[int, list[int]] = {}
+
+    def index(self, position: Position) -> int | None:
+        r, c = position.r, position.c
+        if type(r) is int and type(c) is int and 0 <= r < self.rows_number and 0 <= c < self.columns_number:
+            return r * self.columns_number + c
+        return None
+
+    def has_wall(self, index: int, direction: int) -> bool:
+        return bool(self.wall_masks[index] & (1 << direction))
+
+    def ray(self, index: int, direction: int) -> list[Position]:
+        """Positions from the cell at `index` (excluded) in `direction`, up to the next wall or edge."""
+        lengths = self._ray_lengths.get(direction)
+        if lengths is None:
+            lengths = self._ray_lengths[direction] = self._compute_ray_lengths(direction)
+        length = lengths[index]
+        if length == 0:
+            return []
+        step = self._step(direction)
+        end = index + step * (length + 1)
+        return self.positions[index + step:end if end >= 0 else None:step]
+
+    def _step(self, direction: int) -> int:
+        dr, dc = self.OFFSETS[direction]
+        return dr * self.columns_number + dc
+
+    def _compute_wall_masks(self) -> list[int]:
+        wall_masks = [0] * len(self.positions)
+        for wall in self.walls:
+            if len(wall) != 2:
+                continue
+            first, second = wall
+            first_index, second_index = self.index(first), self.index(second)
+            if first_index is None or second_index is None:
+                continue
+            for direction in self.ORTHOGONAL:
+                dr, dc = self.OFFSETS[direction]
+                if (second.r - first.r, second.c - first.c) == (dr, dc):
+                    wall_masks[first_index] |= 1 << direction
+                    wall_masks[second_index] |= 1 << (direction ^ 1)
+        return wall_masks
+
+    def _compute_neighbors(self, direction: int) -> list[Position | None]:
+        dr, dc = self.OFFSETS[direction]
+        step = self._step(direction)
+        neighbors: list[Position | None] = [None] * len(self.positions)
+        for index, position in enumerate(self.positions):
+            if 0 <= position.r + dr < self.rows_number and 0 <= position.c + dc < self.columns_number and not self.has_wall(index, direction):
+                neighbors[index] = self.positions[index + step]
+        return neighbors
+
+    def _compute_ray_lengths(self, direction: int) -> list[int]:
+        step = self._step(direction)
+        neighbors = self.neighbors[direction]
+        lengths = [0] * len(self.positions)
+        for index in (range(len(self.positions)) if step < 0 else range(len(self.positions) - 1, -1, -1)):
+            neighbor = neighbors[index]
+            if neighbor is None or (direction in self.DIAGONAL and self.walls and frozenset((self.positions[index], neighbor)) in self.walls):
+                continue
+            lengths[index] = lengths[index + step] + 1
+        return lengths
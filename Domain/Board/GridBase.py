@@ -6,6 +6,9 @@ import numpy as np
 from bitarray import bitarray
 
 from Domain.Board.Direction import Direction
+from Domain.Board.GridAdjacency import GridAdjacency
+from Domain.Board.GridConnectivity import GridConnectivity
+from Domain.Board.GridSymmetry import GridSymmetry
 from Domain.Board.Position import Position
 from Domain.Puzzles.Pipes.PipeShapeTransition import PipeShapeTransition
 from Utils.colors import console_back_ground_colors, console_police_colors
@@ -23,15 +26,20 @@ class GridBase[T]:
         self.rows_number = len(matrix)
         self.columns_number = len(matrix[0])
         self._walls: set[FrozenSet[Position]] = set()
+        self._position_rows: list[list[Position]] | None = None
+        self._adjacency: GridAdjacency | None = None
+        self._hash: int | None = None
 
     def __getitem__(self, key) -> T:
         if isinstance(key, Position):
             return self._matrix[key.r][key.c]
         if isinstance(key, tuple):
             return self._matrix[key[0]][key[1]]
+        self._hash = None
         return self._matrix[key]
 
     def __setitem__(self, key, value):
+        self._hash = None
         if isinstance(key, Position):
             self._matrix[key.r][key.c] = value
         elif isinstance(key, tuple):
@@ -42,8 +50,8 @@ class GridBase[T]:
     def __eq__(self, other):
         if not issubclass(type(other), GridBase):
             return False
-        if all(isinstance(cell, bool) for cell in self._matrix):
-            return all(value == other.value(position) for position, value in self)
+        if type(self._matrix) is list and type(other._matrix) is list:
+            return self._matrix == other._matrix
         return self.matrix == other.matrix
 
     def __contains__(self, item: Position | T) -> bool:
@@ -52,9 +60,8 @@ class GridBase[T]:
         return 0 <= item.r < self.rows_number and 0 <= item.c < self.columns_number
 
     def __iter__(self) -> Generator[tuple[Position, T | Any], None, None]:
-        for r, row in enumerate(self._matrix):
-            for c, cell in enumerate(row):
-                yield Position(r, c), cell
+        for positions, row in zip(self._positions_by_row(), self._matrix):
+            yield from zip(positions, row)
 
     def __repr__(self) -> str:
         if self.is_empty():
@@ -64,7 +71,13 @@ class GridBase[T]:
         return '\n'.join(' '.join(str(cell) for cell in row) for row in self._matrix)
 
     def __hash__(self):
-        return hash(str(self._matrix))
+        """Structural hash, cached until a cell is set or a row is handed out through `grid[r]` or `matrix`."""
+        if self._hash is None:
+            try:
+                self._hash = hash(tuple(map(tuple, self._matrix)))
+            except TypeError:
+                self._hash = hash(str(self._matrix))
+        return self._hash
 
     def min_value(self) -> float:
         matrice_np = np.array(self._matrix, dtype=float)
@@ -76,6 +89,7 @@ class GridBase[T]:
 
     @property
     def matrix(self):
+        self._hash = None
         return self._matrix
 
     @property
@@ -95,10 +109,15 @@ class GridBase[T]:
         return position.r * self.columns_number + position.c
 
     def get_positions(self):
-        return [Position(r, c) for r in range(self.rows_number) for c in range(self.columns_number)]
+        return [position for positions in self._positions_by_row() for position in positions]
 
     def get_position_from_index(self, index: int) -> Position:
-        return Position(index // self.columns_number, index % self.columns_number)
+        return self._positions_by_row()[index // self.columns_number][index % self.columns_number]
+
+    def _positions_by_row(self) -> list[list[Position]]:
+        if self._position_rows is None:
+            self._position_rows = [[Position(r, c) for c in range(len(row))] for r, row in enumerate(self._matrix)]
+        return self._position_rows
 
     def to_console_string(self, police_color_grid=None, back_ground_color_grid=None, interline=False):
         matrix = self._matrix.copy()
@@ -134,79 +153,41 @@ class GridBase[T]:
         return {key: frozenset(value) for key, value in regions.items()} if regions else {}
 
     def are_cells_connected(self, value: T = True, mode='orthogonal') -> bool:
-        position = self._get_cell_of_value(value)
-        if position is None:
-            return False
-        visited = self._depth_first_search(position, value, mode)
-        return len(visited) == sum(cell == value for row in self._matrix for cell in row)
+        return GridConnectivity.label(self._matrix, value, self._connectivity_mode(mode), self._connectivity_walls())[1] == 1
 
     def are_all_cells_connected(self, mode='orthogonal') -> bool:
         return all([self.are_cells_connected(region_key, mode) for region_key in self.get_regions().keys()])
 
     def get_all_shapes(self, value=True, mode='orthogonal') -> set[FrozenSet[Position]]:
-        excluded = []
-        shapes = set()
-        while True:
-            position = self._get_cell_of_value(value, excluded)
-            if position is None:
-                break
-            if any(position in shape for shape in shapes):
-                excluded.append(position)
-                continue
-            visited = self._depth_first_search(position, value, mode)
-            shapes.add(frozenset(visited))
-            excluded.append(position)
-        return shapes
+        return {frozenset(component) for component in GridConnectivity.components(self._matrix, value, self._connectivity_mode(mode), self._connectivity_walls())}
 
     def are_min_2_connected_cells_touch_border(self, position, mode='orthogonal') -> tuple[bool, set[Position]]:
         value = self.value(position)
         visited = self._depth_first_search(position, value, mode)
         if len(visited) <= 1:
             return False, set()
-        border_cells = set()
-        for cell in visited:
-            if cell[0] == 0 or cell[0] == self.rows_number - 1 or cell[1] == 0 or cell[1] == self.columns_number - 1:
-                border_cells.add(cell)
-        return len(border_cells) >= 2, visited
+        return self._count_border_cells(visited) >= 2, visited
 
     def find_all_min_2_connected_cells_touch_border(self, value, mode='orthogonal') -> set[FrozenSet[Position]]:
-        excluded = []
-        cells_sets: set[FrozenSet[Position]] = set()
-        while True:
-            position = self._get_cell_of_value(value, excluded)
-            if position is None:
-                break
-            if any(position in cells_set for cells_set in cells_sets):
-                excluded.append(position)
-                continue
-            are_touch_border, cells = self.are_min_2_connected_cells_touch_border(position, mode)
-            if are_touch_border:
-                cells_sets.add(frozenset(cells))
-            excluded.append(position)
-        return cells_sets
-
-    def _depth_first_search(self, position: Position, value, mode='orthogonal', visited=None) -> set[Position]:
-        if visited is None:
-            visited = set()
-        if (self.value(position) != value) or (position in visited):
-            return visited
-        visited.add(position)
-
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)] if mode != 'diagonal' else [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-        for dr, dc in directions:
-            if 0 <= position.r + dr < self.rows_number and 0 <= position.c + dc < self.columns_number and (position.r + dr, position.c + dc) not in visited:
-                current_position = position + Position(dr, dc)
-                if self.value(current_position) == value:
-                    new_visited = self._depth_first_search(current_position, value, mode, visited)
-                    if new_visited != visited:
-                        return new_visited
-
-        return visited
-
-    def _get_cell_of_value(self, value, excluded=None) -> Position | None:
-        if excluded is None:
-            excluded = []
-        return next((Position(i, j) for i in range(self.rows_number) for j in range(self.columns_number) if self._matrix[i][j] == value and Position(i, j) not in excluded), None)
+        components = GridConnectivity.components(self._matrix, value, self._connectivity_mode(mode), self._connectivity_walls())
+        return {frozenset(component) for component in components if len(component) > 1 and self._count_border_cells(component) >= 2}
+
+    def _count_border_cells(self, positions: Iterable[Position]) -> int:
+        return sum(1 for position in positions if position.r in (0, self.rows_number - 1) or position.c in (0, self.columns_number - 1))
+
+    def _depth_first_search(self, position: Position, value, mode='orthogonal') -> set[Position]:
+        if self.value(position) != value:
+            return set()
+        mode, walls = self._connectivity_mode(mode), self._connectivity_walls()
+        return GridConnectivity.component(position, lambda current: [
+            neighbor for neighbor in GridConnectivity.neighbors(current, self.rows_number, self.columns_number, mode, walls) if self.value(neighbor) == value
+        ])
+
+    def _connectivity_mode(self, mode: str) -> str:
+        return 'diagonal_only' if mode == 'diagonal' else 'orthogonal'
+
+    def _connectivity_walls(self) -> set[FrozenSet[Position]] | None:
+        return None
 
     @staticmethod
     def get_adjacent_combinations(neighbour_length, block_length, circular) -> list[list[bool]]:
@@ -246,63 +227,63 @@ class GridBase[T]:
 
     def set_walls(self, walls: set[FrozenSet[Position]]):
         self._walls = walls
+        self._adjacency = None
 
     def add_wall(self, wall: list[Position]):
         if len(wall) != 2:
             raise ValueError("Un mur doit contenir exactement deux positions")
         self._walls.add(frozenset(wall))
+        self._adjacency = None
 
     def copy_walls_from_grid(self, other_grid: 'GridBase'):
         self._walls = other_grid._walls
+        self._adjacency = None
 
     @staticmethod
     def list_to_string(values):
         return sum(values)
 
     def is_empty(self):
-        return self == GridBase.empty()
+        return len(self._matrix) == 1 and len(self._matrix[0]) == 0
 
     def all_orthogonal_positions(self, position: Position) -> set[Position]:
         return set(self.all_positions_up(position)) | set(self.all_positions_down(position)) | set(self.all_positions_left(position)) | set(self.all_positions_right(position))
 
     def neighbors_positions(self, position: Position, mode='orthogonal') -> set[Position]:
         """mode : orthogonal, diagonal, diagonal_only"""
-        if mode == 'diagonal_only':
-            return {self.neighbor_up_left(position), self.neighbor_up_right(position), self.neighbor_down_left(position), self.neighbor_down_right(position)} - {None}
-
-        orthogonal_neighbors = {self.neighbor_up(position), self.neighbor_down(position), self.neighbor_left(position), self.neighbor_right(position)} - {None}
+        adjacency = self._adjacency_table()
+        index = adjacency.index(position)
         if mode == 'orthogonal':
-            return orthogonal_neighbors
-
+            return set(adjacency.orthogonal_neighbors[index]) if index is not None else {self.neighbor_up(position), self.neighbor_down(position), self.neighbor_left(position), self.neighbor_right(position)} - {None}
+        if mode == 'diagonal_only':
+            return set(adjacency.diagonal_neighbors[index]) if index is not None else {self.neighbor_up_left(position), self.neighbor_up_right(position), self.neighbor_down_left(position), self.neighbor_down_right(position)} - {None}
         if mode == 'diagonal' or mode == 'all':
-            diagonal_neighbors = {self.neighbor_up_left(position), self.neighbor_up_right(position), self.neighbor_down_left(position), self.neighbor_down_right(position)} - {None}
-            return orthogonal_neighbors | diagonal_neighbors
-
+            return self.neighbors_positions(position, 'orthogonal') | self.neighbors_positions(position, 'diagonal_only')
         raise ValueError(f"Invalid mode: {mode}")
 
     def neighbor_up(self, position: Position) -> Position:
-        return position.up if position.up in self and {position, position.up} not in self._walls else None
+        return self._neighbor(position, GridAdjacency.UP)
 
     def neighbor_down(self, position: Position) -> Position:
-        return position.down if position.down in self and {position, position.down} not in self._walls else None
+        return self._neighbor(position, GridAdjacency.DOWN)
 
     def neighbor_left(self, position: Position) -> Position:
-        return position.left if position.left in self and {position, position.left} not in self._walls else None
+        return self._neighbor(position, GridAdjacency.LEFT)
 
     def neighbor_right(self, position: Position) -> Position:
-        return position.right if position.right in self and {position, position.right} not in self._walls else None
+        return self._neighbor(position, GridAdjacency.RIGHT)
 
     def neighbor_up_left(self, position: Position) -> Position:
-        return position.up_left if position.up_left in self else None  # check if wall is not between position and position.up_left ?
+        return self._neighbor(position, GridAdjacency.UP_LEFT)  # check if wall is not between position and position.up_left ?
 
     def neighbor_up_right(self, position: Position) -> Position:
-        return position.up_right if position.up_right in self else None  # check if wall is not between position and position.up_right ?
+        return self._neighbor(position, GridAdjacency.UP_RIGHT)  # check if wall is not between position and position.up_right ?
 
     def neighbor_down_left(self, position: Position) -> Position:
-        return position.down_left if position.down_left in self else None  # check if wall is not between position and position.down_left ?
+        return self._neighbor(position, GridAdjacency.DOWN_LEFT)  # check if wall is not between position and position.down_left ?
 
     def neighbor_down_right(self, position: Position) -> Position:
-        return position.down_right if position.down_right in self else None  # check if wall is not between position and position.down_right ?
+        return self._neighbor(position, GridAdjacency.DOWN_RIGHT)  # check if wall is not between position and position.down_right ?
 
     def neighbors_values(self, position: Position, mode='orthogonal') -> list[T]:
         """mode : orthogonal, diagonal, diagonal_only"""
@@ -320,58 +301,55 @@ class GridBase[T]:
         raise ValueError(f"Invalid direction: {direction}")
 
     def all_positions_up(self, position: Position) -> list[Position]:
-        positions = []
-        while position.up in self and {position, position.up} not in self._walls:
-            position = position.up
-            positions.append(position)
-        return positions
+        return self._ray(position, GridAdjacency.UP)
 
     def all_positions_down(self, position: Position) -> list[Position]:
-        positions = []
-        while position.down in self and {position, position.down} not in self._walls:
-            position = position.down
-            positions.append(position)
-        return positions
+        return self._ray(position, GridAdjacency.DOWN)
 
     def all_positions_left(self, position: Position) -> list[Position]:
-        positions = []
-        while position.left in self and {position, position.left} not in self._walls:
-            position = position.left
-            positions.append(position)
-        return positions
+        return self._ray(position, GridAdjacency.LEFT)
 
     def all_positions_right(self, position: Position) -> list[Position]:
-        positions = []
-        while position.right in self and {position, position.right} not in self._walls:
-            position = position.right
-            positions.append(position)
-        return positions
+        return self._ray(position, GridAdjacency.RIGHT)
 
     def all_positions_up_right(self, position: Position) -> list[Position]:
-        positions = []
-        while position.up_right in self and {position, position.up_right} not in self._walls:
-            position = position.up_right
-            positions.append(position)
-        return positions
+        return self._ray(position, GridAdjacency.UP_RIGHT)
 
     def all_positions_up_left(self, position: Position) -> list[Position]:
-        positions = []
-        while position.up_left in self and {position, position.up_left} not in self._walls:
-            position = position.up_left
-            positions.append(position)
-        return positions
+        return self._ray(position, GridAdjacency.UP_LEFT)
 
     def all_positions_down_right(self, position: Position) -> list[Position]:
-        positions = []
-        while position.down_right in self and {position, position.down_right} not in self._walls:
-            position = position.down_right
-            positions.append(position)
-        return positions
+        return self._ray(position, GridAdjacency.DOWN_RIGHT)
 
     def all_positions_down_left(self, position: Position) -> list[Position]:
+        return self._ray(position, GridAdjacency.DOWN_LEFT)
+
+    def _adjacency_table(self) -> GridAdjacency:
+        adjacency = self._adjacency
+        if adjacency is None or adjacency.walls is not self._walls or adjacency.walls_count != len(self._walls):
+            adjacency = self._adjacency = GridAdjacency(self.rows_number, self.columns_number, self._walls)
+        return adjacency
+
+    def _neighbor(self, position: Position, direction: int) -> Position | None:
+        adjacency = self._adjacency_table()
+        index = adjacency.index(position)
+        if index is not None:
+            return adjacency.neighbors[direction][index]
+        dr, dc = GridAdjacency.OFFSETS[direction]
+        neighbor = Position(position.r + dr, position.c + dc)
+        if neighbor in self and (direction in GridAdjacency.DIAGONAL or {position, neighbor} not in self._walls):
+            return neighbor
+        return None
+
+    def _ray(self, position: Position, direction: int) -> list[Position]:
+        adjacency = self._adjacency_table()
+        index = adjacency.index(position)
+        if index is not None:
+            return adjacency.ray(index, direction)
+        dr, dc = GridAdjacency.OFFSETS[direction]
         positions = []
-        while position.down_left in self and {position, position.down_left} not in self._walls:
-            position = position.down_left
+        while (next_position := Position(position.r + dr, position.c + dc)) in self and {position, next_position} not in self._walls:
+            position = next_position
             positions.append(position)
         return positions
 
@@ -406,6 +384,36 @@ class GridBase[T]:
             matrix[position.r][position.c] = set_value
         return cls(matrix), Position(min_r, min_c)
 
+    def transformed(self, symmetry: GridSymmetry) -> 'GridBase':
+        rows_number, columns_number = symmetry.transformed_size(self.rows_number, self.columns_number)
+        matrix = [[None for _ in range(columns_number)] for _ in range(rows_number)]
+        for position, value in self:
+            transformed_position = symmetry.map_position(position, self.rows_number, self.columns_number)
+            matrix[transformed_position.r][transformed_position.c] = self._transform_cell(value, symmetry)
+        grid = self._from_transformed_matrix(matrix)
+        grid.set_walls({frozenset(symmetry.map_position(position, self.rows_number, self.columns_number) for position in wall) for wall in self._walls})
+        return grid
+
+    def canonical_form(self) -> tuple['GridBase', GridSymmetry]:
+        if self.is_empty():
+            return self, GridSymmetry.identity()
+        candidates = [(self.transformed(symmetry), symmetry) for symmetry in GridSymmetry.all()]
+        return min(candidates, key=lambda candidate: candidate[0]._canonical_key())
+
+    def _canonical_key(self) -> tuple:
+        walls = sorted(tuple(sorted((position.r, position.c) for position in wall)) for wall in self._walls)
+        return self.rows_number, self.columns_number, tuple(repr(cell) for row in self._matrix for cell in row), tuple(walls)
+
+    def _transform_cell(self, value, symmetry: GridSymmetry):
+        if isinstance(value, Direction):
+            return symmetry.map_direction(value)
+        if hasattr(value, 'transformed'):
+            return value.transformed(symmetry, self.rows_number, self.columns_number)
+        return value
+
+    def _from_transformed_matrix(self, matrix: list[list]) -> 'GridBase':
+        return type(self)(matrix)
+
     def find_different_neighbors_positions(self) -> list[tuple[Position, Position]]:
         pairs: list[tuple[Position, Position]] = list()
         min_value = round(self.min_value())
@@ -0,0 +1,117 @@
+from typing import Callable, Iterable, Sequence
+
+from Domain.Board.Position import Position
+
+
+class UnionFind:
+    """Disjoint sets over the indexes 0..size-1, stored in flat parent and size arrays."""
+
+    def __init__(self, size: int):
+        self._parents = list(range(size))
+        self._sizes = [1] * size
+
+    def find(self, index: int) -> int:
+        parents = self._parents
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    def union(self, first: int, second: int) -> bool:
+        first_root, second_root = self.find(first), self.find(second)
+        if first_root == second_root:
+            return False
+        if self._sizes[first_root] < self._sizes[second_root]:
+            first_root, second_root = second_root, first_root
+        self._parents[second_root] = first_root
+        self._sizes[first_root] += self._sizes[second_root]
+        return True
+
+    def connected(self, first: int, second: int) -> bool:
+        return self.find(first) == self.find(second)
+
+    def size(self, index: int) -> int:
+        return self._sizes[self.find(index)]
+
+
+class GridConnectivity:
+    """Iterative connectivity over grid cells: component labelling by union-find and explicit-stack traversals."""
+
+    NEIGHBOR_OFFSETS = {
+        'orthogonal': ((0, 1), (1, 0)),
+        'diagonal_only': ((1, 1), (1, -1)),
+        'diagonal': ((0, 1), (1, 0), (1, 1), (1, -1)),
+        'all': ((0, 1), (1, 0), (1, 1), (1, -1)),
+    }
+
+    @staticmethod
+    def label(matrix: Sequence[Sequence], value, mode='orthogonal', walls: set[frozenset[Position]] | None = None) -> tuple[list[int], int]:
+        """Row-major labels of the cells equal to `value`, components numbered from 1 in order of their first cell, 0 elsewhere.
+        Offsets come from NEIGHBOR_OFFSETS[mode]; walls only cut orthogonal steps."""
+        if mode not in GridConnectivity.NEIGHBOR_OFFSETS:
+            raise ValueError(f"Invalid mode: {mode}")
+        offsets = GridConnectivity.NEIGHBOR_OFFSETS[mode]
+        rows_number, columns_number = len(matrix), len(matrix[0]) if matrix else 0
+        union_find = UnionFind(rows_number * columns_number)
+        is_value = [[cell == value for cell in row] for row in matrix]
+        for r, row in enumerate(is_value):
+            for c, is_cell_value in enumerate(row):
+                if not is_cell_value:
+                    continue
+                for dr, dc in offsets:
+                    neighbor_r, neighbor_c = r + dr, c + dc
+                    if 0 <= neighbor_r < rows_number and 0 <= neighbor_c < columns_number and is_value[neighbor_r][neighbor_c]:
+                        if walls and (dr == 0 or dc == 0) and frozenset((Position(r, c), Position(neighbor_r, neighbor_c))) in walls:
+                            continue
+                        union_find.union(r * columns_number + c, neighbor_r * columns_number + neighbor_c)
+        labels = [0] * (rows_number * columns_number)
+        labels_by_root: dict[int, int] = {}
+        for index, is_cell_value in enumerate(cell for row in is_value for cell in row):
+            if is_cell_value:
+                labels[index] = labels_by_root.setdefault(union_find.find(index), len(labels_by_root) + 1)
+        return labels, len(labels_by_root)
+
+    @staticmethod
+    def components(matrix: Sequence[Sequence], value, mode='orthogonal', walls: set[frozenset[Position]] | None = None) -> list[set[Position]]:
+        labels, components_count = GridConnectivity.label(matrix, value, mode, walls)
+        columns_number = len(matrix[0]) if matrix else 0
+        components: list[set[Position]] = [set() for _ in range(components_count)]
+        for index, label in enumerate(labels):
+            if label:
+                components[label - 1].add(Position(index // columns_number, index % columns_number))
+        return components
+
+    @staticmethod
+    def neighbors(position: Position, rows_number: int, columns_number: int, mode='orthogonal', walls: set[frozenset[Position]] | None = None) -> list[Position]:
+        if mode not in GridConnectivity.NEIGHBOR_OFFSETS:
+            raise ValueError(f"Invalid mode: {mode}")
+        neighbors = []
+        for dr, dc in GridConnectivity.NEIGHBOR_OFFSETS[mode]:
+            for neighbor_r, neighbor_c in ((position.r + dr, position.c + dc), (position.r - dr, position.c - dc)):
+                if 0 <= neighbor_r < rows_number and 0 <= neighbor_c < columns_number:
+                    neighbor = Position(neighbor_r, neighbor_c)
+                    if not (walls and (dr == 0 or dc == 0) and frozenset((position, neighbor)) in walls):
+                        neighbors.append(neighbor)
+        return neighbors
+
+    @staticmethod
+    def component(start: Position, neighbors: Callable[[Position], Iterable[Position]]) -> set[Position]:
+        visited = {start}
+        stack = [start]
+        while stack:
+            for neighbor in neighbors(stack.pop()):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    stack.append(neighbor)
+        return visited
+
+    @staticmethod
+    def components_from(positions: Iterable[Position], neighbors: Callable[[Position], Iterable[Position]]) -> list[set[Position]]:
+        visited: set[Position] = set()
+        components = []
+        for position in positions:
+            if position not in visited:
+                component = GridConnectivity.component(position, neighbors)
+                visited.update(component)
+                components.append(component)
+        return components
@@ -0,0 +1,60 @@
+from Domain.Board.Direction import Direction
+from Domain.Board.Position import Position
+
+
+class GridSymmetry:
+    """Element of the dihedral group of the square: optional left-right mirror, then clockwise quarter turns."""
+
+    def __init__(self, quarter_turns: int = 0, mirrored: bool = False):
+        self.quarter_turns = quarter_turns % 4
+        self.mirrored = mirrored
+
+    @staticmethod
+    def all() -> list['GridSymmetry']:
+        return [GridSymmetry(quarter_turns, mirrored) for mirrored in (False, True) for quarter_turns in range(4)]
+
+    @staticmethod
+    def identity() -> 'GridSymmetry':
+        return GridSymmetry()
+
+    @property
+    def inverse(self) -> 'GridSymmetry':
+        if self.mirrored:
+            return self
+        return GridSymmetry(-self.quarter_turns)
+
+    @property
+    def swaps_dimensions(self) -> bool:
+        return self.quarter_turns % 2 == 1
+
+    @property
+    def reverses_orientation(self) -> bool:
+        return self.mirrored != self.swaps_dimensions
+
+    def transformed_size(self, rows_number: int, columns_number: int) -> tuple[int, int]:
+        return (columns_number, rows_number) if self.swaps_dimensions else (rows_number, columns_number)
+
+    def map_position(self, position: Position, rows_number: int, columns_number: int) -> Position:
+        r, c = position.r, position.c
+        if self.mirrored:
+            c = columns_number - 1 - c
+        for _ in range(self.quarter_turns):
+            r, c, rows_number, columns_number = c, rows_number - 1 - r, columns_number, rows_number
+        return Position(r, c)
+
+    def map_direction(self, direction: Direction) -> Direction:
+        if direction == Direction.none():
+            return direction
+        if self.mirrored and direction in (Direction.left(), Direction.right()):
+            direction = direction.opposite
+        clockwise = [Direction.up(), Direction.right(), Direction.down(), Direction.left()]
+        return clockwise[(clockwise.index(direction) + self.quarter_turns) % 4]
+
+    def __eq__(self, other):
+        return isinstance(other, GridSymmetry) and (self.quarter_turns, self.mirrored) == (other.quarter_turns, other.mirrored)
+
+    def __hash__(self):
+        return hash((self.quarter_turns, self.mirrored))
+
+    def __repr__(self):
+        return f"GridSymmetry({self.quarter_turns}, {self.mirrored})"
@@ -1,6 +1,7 @@
 import typing
 
 from Domain.Board.Direction import Direction
+from Domain.Board.GridSymmetry import GridSymmetry
 from Domain.Board.Position import Position
 
 IslandString0Bridge = typing.Literal[
@@ -120,6 +121,12 @@ class Island:
     def set_bridges_count_according_to_directions_bridges(self):
         self.bridges_count = sum([bridges for (_, bridges) in self.direction_position_bridges.values()])
 
+    def transformed(self, symmetry: GridSymmetry, rows_number: int, columns_number: int) -> 'Island':
+        island = Island(symmetry.map_position(self.position, rows_number, columns_number), self.bridges_count)
+        for direction, (position, bridges) in self.direction_position_bridges.items():
+            island.direction_position_bridges[symmetry.map_direction(direction)] = symmetry.map_position(position, rows_number, columns_number), bridges
+        return island
+
     def has_no_bridge(self):
         return self.bridges_count == 0
 
@@ -0,0 +1,51 @@
+from typing import Iterable
+
+from Domain.Board.Direction import Direction
+from Domain.Board.Position import Position
+
+
+class IslandTopology:
+    """Nearest island in each orthogonal direction and crossing bridge spans of row-major island positions, built by one row sweep and one column sweep."""
+
+    def __init__(self, positions: Iterable[Position]):
+        self.positions = tuple(positions)
+        self.neighbors: dict[Position, tuple[tuple[Direction, Position], ...]] = self._compute_neighbors()
+        self.crossover_bridges: list[dict[Position, Direction]] = self._compute_crossover_bridges()
+
+    def _compute_neighbors(self) -> dict[Position, tuple[tuple[Direction, Position], ...]]:
+        rows: dict[int, list[Position]] = {}
+        columns: dict[int, list[Position]] = {}
+        for position in self.positions:
+            rows.setdefault(position.r, []).append(position)
+            columns.setdefault(position.c, []).append(position)
+
+        right, left, up, down = {}, {}, {}, {}
+        for row in rows.values():
+            for first, second in zip(row, row[1:]):
+                right[first] = second
+                left[second] = first
+        for column in columns.values():
+            for first, second in zip(column, column[1:]):
+                down[first] = second
+                up[second] = first
+
+        directions_tables = ((Direction.right(), right), (Direction.left(), left), (Direction.up(), up), (Direction.down(), down))
+        return {position: tuple((direction, table[position]) for direction, table in directions_tables if position in table) for position in self.positions}
+
+    def _compute_crossover_bridges(self) -> list[dict[Position, Direction]]:
+        horizontal_spans: dict[Position, Position] = {}
+        for position in self.positions:
+            for direction, other_position in self.neighbors[position]:
+                if direction == Direction.right():
+                    for cross_position in position.all_positions_between(other_position):
+                        horizontal_spans[cross_position] = position
+
+        crossover_bridges = []
+        for position in self.positions:
+            for direction, other_position in self.neighbors[position]:
+                if direction != Direction.down():
+                    continue
+                for cross_position in position.all_positions_between(other_position):
+                    if cross_position in horizontal_spans:
+                        crossover_bridges.append({position: Direction.down(), horizontal_spans[cross_position]: Direction.right()})
+        return crossover_bridges
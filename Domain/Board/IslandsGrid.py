@@ -1,11 +1,13 @@
 from Domain.Board.Direction import Direction
 from Domain.Board.Grid import Grid
+from Domain.Board.GridConnectivity import GridConnectivity
 from Domain.Board.Island import Island
+from Domain.Board.IslandTopology import IslandTopology
 from Domain.Board.Position import Position
 
 
 class IslandGrid(Grid[Island]):
-    def __init__(self, input_matrix: list[list[int | Island]]):
+    def __init__(self, input_matrix: list[list[int | Island]], topology: IslandTopology | None = None):
         super().__init__(input_matrix)
         self.islands: dict[Position, Island] = {}
         for position, island_or_bridges_number in self:
@@ -14,13 +16,16 @@ class IslandGrid(Grid[Island]):
             elif isinstance(island_or_bridges_number, int) and island_or_bridges_number != 0:
                 self.islands[position] = Island(position, island_or_bridges_number)
 
+        self._initial_bridges_counts = {position: island.bridges_count for position, island in self.islands.items()}
+        self.topology: IslandTopology | None = None
         if len(self.islands) == 0:
             super().__init__([[]])
             self.islands = {}
             return
 
-        self._compute_possible_bridges()
-        self.possible_crossover_bridge = self._compute_possible_crossover_bridges()
+        self.topology = topology if topology is not None else IslandTopology(self.islands.keys())
+        self._set_possible_bridges()
+        self.possible_crossover_bridge = self.topology.crossover_bridges
 
     @staticmethod
     def from_walls_grid(grid: Grid, with_edges: bool = False) -> 'IslandGrid':
@@ -71,82 +76,32 @@ class IslandGrid(Grid[Island]):
     def empty() -> 'IslandGrid':
         return IslandGrid([[]])
 
-    def _compute_possible_bridges(self):
-        for island in self.islands.values():
-            min_distances = {}
-            for other_island in self.islands.values():
-                direction = island.position.direction_to(other_island.position)
-                if direction != Direction.right() and direction != Direction.left() and direction != Direction.up() and direction != Direction.down():
-                    continue
-                distance = island.position.distance_to(other_island.position)
-                if direction == Direction.right() and distance < min_distances.get(Direction.right(), (float('inf'), None))[0]:
-                    min_distances[Direction.right()] = (distance, other_island.position)
-                    continue
-                if direction == Direction.left() and distance < min_distances.get(Direction.left(), (float('inf'), None))[0]:
-                    min_distances[Direction.left()] = (distance, other_island.position)
-                    continue
-                if direction == Direction.up() and distance < min_distances.get(Direction.up(), (float('inf'), None))[0]:
-                    min_distances[Direction.up()] = (distance, other_island.position)
-                    continue
-                if direction == Direction.down() and distance < min_distances.get(Direction.down(), (float('inf'), None))[0]:
-                    min_distances[Direction.down()] = (distance, other_island.position)
-                    continue
-
-            if min_distances.get(Direction.right()) is not None:
-                island.direction_position_bridges[Direction.right()] = min_distances[Direction.right()][1], 0
-            if min_distances.get(Direction.left()) is not None:
-                island.direction_position_bridges[Direction.left()] = min_distances[Direction.left()][1], 0
-            if min_distances.get(Direction.up()) is not None:
-                island.direction_position_bridges[Direction.up()] = min_distances[Direction.up()][1], 0
-            if min_distances.get(Direction.down()) is not None:
-                island.direction_position_bridges[Direction.down()] = min_distances[Direction.down()][1], 0
+    def _from_transformed_matrix(self, matrix: list[list]) -> 'IslandGrid':
+        bridges = {island.position: dict(island.direction_position_bridges) for row in matrix for island in row if isinstance(island, Island)}
+        island_grid = IslandGrid(matrix)
+        for position, island in island_grid.islands.items():
+            island.direction_position_bridges.update(bridges.get(position, {}))
+        return island_grid
 
-    def _compute_possible_crossover_bridges(self) -> list[dict[Position, Direction]]:
-        possible_multiples_crossover_positions: dict[Position, dict[Position, Direction]] = {}
-        for island in self.islands.values():
-            island_position = island.position
-            for direction, (other_position, _) in island.direction_position_bridges.items():
-                if island_position.distance_to(other_position) == 1 or direction == Direction.left() or direction == Direction.up():
-                    continue
-                cross_positions = island_position.all_positions_between(other_position)
-                for cross_position in cross_positions:
-                    if possible_multiples_crossover_positions.get(cross_position) is None:
-                        possible_multiples_crossover_positions[cross_position] = {}
-                    possible_multiples_crossover_positions[cross_position][island_position] = direction
+    def with_reset_bridges(self) -> 'IslandGrid':
+        """Fresh grid with an Island on every island position, back to its initial bridges count and no bridge set, reusing this grid's topology."""
+        if self.is_empty():
+            return IslandGrid.empty()
+        matrix = [[Island(position, self._initial_bridges_counts[position]) if position in self._initial_bridges_counts else value for position, value in zip(positions, row)]
+                  for positions, row in zip(self._positions_by_row(), self._matrix)]
+        return IslandGrid(matrix, self.topology)
 
-        possible_crossover_bridges = [
-            directions_and_positions
-            for directions_and_positions in possible_multiples_crossover_positions.values()
-            if len(directions_and_positions) == 2
-        ]
-        return possible_crossover_bridges
+    def _set_possible_bridges(self):
+        for position, island in self.islands.items():
+            for direction, other_position in self.topology.neighbors[position]:
+                island.direction_position_bridges[direction] = other_position, 0
 
     def get_connected_positions(self, exclude_without_bridge=False) -> list[set[Position]]:
-        concerned_islands_count = len(self.islands) if not exclude_without_bridge else sum(1 for island in self.islands.values() if island.bridges_count != 0)
-        visited_list: list[set[Position]] = []
-        visited_flat: set[Position] = set()
-        while len(visited_flat) != concerned_islands_count:
-            position = next(island.position for island in self.islands.values() if island.position not in visited_flat) if not exclude_without_bridge else next(
-                (island.position for island in self.islands.values() if island.bridges_count != 0 and island.position not in visited_flat), None)
-            visited = self._depth_first_search_islands(position)
-            visited_list.append(visited)
-            visited_flat.update(visited)
-        return visited_list
-
-    def _depth_first_search_islands(self, position: Position, visited_positions=None) -> set[Position]:
-        if visited_positions is None:
-            visited_positions = set()
-        if position in visited_positions:
-            return visited_positions
-        visited_positions.add(position)
-        position_and_bridges = self.islands[position].direction_position_bridges.values()
-        next_positions = [position for position, bridges_count in position_and_bridges if bridges_count > 0 and position not in visited_positions]
-        for current_position in next_positions:
-            new_visited_positions = self._depth_first_search_islands(current_position, visited_positions)
-            if new_visited_positions != visited_positions:
-                return new_visited_positions
+        positions = [island.position for island in self.islands.values() if not exclude_without_bridge or island.bridges_count != 0]
+        return GridConnectivity.components_from(positions, self._bridged_positions)
 
-        return visited_positions
+    def _bridged_positions(self, position: Position) -> list[Position]:
+        return [next_position for next_position, bridges_count in self.islands[position].direction_position_bridges.values() if bridges_count > 0]
 
     def compute_linear_connected_positions(self, exclude_without_bridge=False) -> list[set[Position]]:
         concerned_islands_count = len(self.islands) if not exclude_without_bridge else sum(1 for island in self.islands.values() if island.bridges_count != 0)
@@ -168,25 +123,21 @@ class IslandGrid(Grid[Island]):
             connected_islands_list.append(connected_islands)
         return connected_islands_list
 
-    def _depth_first_linear_search_islands(self, position: Position, previous_position=None, visited_positions=None, crossed_positions=None) -> set[Position]:
-        if visited_positions is None:
-            visited_positions = set()
-            crossed_positions = set()
-        if position in visited_positions - crossed_positions:
-            return visited_positions
-        visited_positions.add(position)
-        position_and_bridges = self.islands[position].direction_position_bridges.values()
-        next_positions = [position for position, bridges_count in position_and_bridges if
-                          bridges_count > 0 and position not in visited_positions - crossed_positions and position != previous_position]
-        if len(next_positions) > 1 and previous_position is not None:
-            crossed_positions.add(position)
-            direction = previous_position.direction_to(position)
-            linear_next_position = position.after(direction)
-            next_positions = [linear_next_position]
-        for current_position in next_positions:
-            new_visited_positions = self._depth_first_linear_search_islands(current_position, position, visited_positions, crossed_positions)
-            return new_visited_positions
-
+    def _depth_first_linear_search_islands(self, position: Position) -> set[Position]:
+        previous_position = None
+        visited_positions: set[Position] = set()
+        crossed_positions: set[Position] = set()
+        while position not in visited_positions - crossed_positions:
+            visited_positions.add(position)
+            position_and_bridges = self.islands[position].direction_position_bridges.values()
+            next_positions = [next_position for next_position, bridges_count in position_and_bridges if
+                              bridges_count > 0 and next_position not in visited_positions - crossed_positions and next_position != previous_position]
+            if len(next_positions) > 1 and previous_position is not None:
+                crossed_positions.add(position)
+                next_positions = [position.after(previous_position.direction_to(position))]
+            if not next_positions:
+                break
+            previous_position, position = position, next_positions[0]
         return visited_positions
 
     def get_loop_positions(self) -> set[Position]:
@@ -200,27 +151,23 @@ class IslandGrid(Grid[Island]):
             visited_flat.update(positions)
         return set()
 
-    def _is_loop(self, position: Position | None = None, visited_positions=None, previous_position=None) -> tuple[bool, set[Position]]:
+    def _is_loop(self, position: Position | None = None) -> tuple[bool, set[Position]]:
         if position is None:
             position = next(island.position for island in self.islands.values() if island.bridges_count > 0)
-        if visited_positions is None:
-            visited_positions = set()
-        if position in visited_positions:
-            return True, visited_positions
-        visited_positions.add(position)
-        position_bridges = self.islands[position].direction_position_bridges.values()
-        for position_bridge in position_bridges:
-            if position_bridge[1] == 0:
-                continue
-            current_position = position_bridge[0]
-            if current_position == previous_position:
-                continue
-            if current_position in visited_positions:
-                return True, visited_positions
-            is_loop, _ = self._is_loop(current_position, visited_positions, position)
-            if is_loop:
-                return True, visited_positions
-
+        visited_positions = {position}
+        stack = [(position, None, iter(self.islands[position].direction_position_bridges.values()))]
+        while stack:
+            position, previous_position, position_bridges = stack[-1]
+            for current_position, bridges_count in position_bridges:
+                if bridges_count == 0 or current_position == previous_position:
+                    continue
+                if current_position in visited_positions:
+                    return True, visited_positions
+                visited_positions.add(current_position)
+                stack.append((current_position, position, iter(self.islands[current_position].direction_position_bridges.values())))
+                break
+            else:
+                stack.pop()
         return False, visited_positions
 
     def follow_path(self, position: Position | None = None, previous_position: Position | None = None, visited_positions=None, kept_bridges_by_visited_positions=None) -> list[Position]:
@@ -229,23 +176,21 @@ class IslandGrid(Grid[Island]):
         if visited_positions is None:
             visited_positions = []
             kept_bridges_by_visited_positions = {position: self.islands[position].bridges_count - 1}
-        visited_positions.append(position)
-        position_bridges = self.islands[position].direction_position_bridges.values()
-        next_positions_candidates = [position_bridges[0] for position_bridges in position_bridges if
-                                     position_bridges[1] > 0 and position_bridges[0] != previous_position]
-        if len(next_positions_candidates) == 0:
-            return visited_positions
-        if len(next_positions_candidates) == 1:
-            next_position = next_positions_candidates[0]
-        else:
-            next_position = position.after(previous_position.direction_to(position)) if previous_position else next_positions_candidates[0]
-        bridges_count = self.islands[next_position].bridges_count
-        if kept_bridges_by_visited_positions.get(next_position, bridges_count) >= 1:
+        while True:
+            visited_positions.append(position)
+            position_bridges = self.islands[position].direction_position_bridges.values()
+            next_positions_candidates = [next_position for next_position, bridges_count in position_bridges if bridges_count > 0 and next_position != previous_position]
+            if len(next_positions_candidates) == 0:
+                return visited_positions
+            if len(next_positions_candidates) == 1:
+                next_position = next_positions_candidates[0]
+            else:
+                next_position = position.after(previous_position.direction_to(position)) if previous_position else next_positions_candidates[0]
+            bridges_count = self.islands[next_position].bridges_count
+            if kept_bridges_by_visited_positions.get(next_position, bridges_count) < 1:
+                return visited_positions
             kept_bridges_by_visited_positions[next_position] = kept_bridges_by_visited_positions.get(next_position, bridges_count) - 2
-            new_visited_positions = self.follow_path(next_position, position, visited_positions, kept_bridges_by_visited_positions)
-            if new_visited_positions != visited_positions:
-                return new_visited_positions
-        return visited_positions
+            previous_position, position = position, next_position
 
     def __repr__(self) -> str:
         if self.is_empty():
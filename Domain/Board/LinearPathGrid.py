@@ -128,18 +128,61 @@ class LinearPathGrid(Grid[PathCell]):
         return path
 
     @staticmethod
-    def _find_checkpoint_path(grid: Grid, start_position: Position, positions: set[Position], end_position: Position, current_path=None):
-        if current_path is None:
-            current_path = [start_position]
-        if len(current_path) == len(positions) and (end_position is None or start_position in grid.neighbors_positions(end_position)):
-            return current_path
-        for next_position in grid.neighbors_positions(start_position):
-            if next_position in positions and next_position not in current_path:
-                new_path = current_path.copy()
-                new_path.append(next_position)
-                result = LinearPathGrid._find_checkpoint_path(grid, next_position, positions, end_position, new_path)
-                if result is not None:
-                    return result
+    def from_successors(successors: dict[Position, Position], start_position: Position) -> 'LinearPathGrid':
+        """Walks `successors` from `start_position`; empty unless the walk visits every position of `successors` exactly once."""
+        path = [start_position]
+        position = start_position
+        for _ in range(len(successors)):
+            position = successors.get(position)
+            if position is None:
+                return LinearPathGrid.empty()
+            path.append(position)
+        if position in successors or len(set(path)) != len(path):
+            return LinearPathGrid.empty()
+        grid = LinearPath(path).get_grid()
+        grid._set_path(path)
+        return grid
+
+    @staticmethod
+    def _indexed_positions(grid: Grid, positions: set[Position], end_position: Position | None) -> tuple[list[Position], dict[Position, int], list[list[int]], set[int]]:
+        ordered_positions = list(positions)
+        index_by_position = {position: index for index, position in enumerate(ordered_positions)}
+        neighbors_indexes = [[index_by_position[neighbor] for neighbor in grid.neighbors_positions(position) if neighbor in index_by_position] for position in ordered_positions]
+        end_neighbors = set(grid.neighbors_positions(end_position)) if end_position is not None else set(ordered_positions)
+        final_indexes = {index for index, position in enumerate(ordered_positions) if position in end_neighbors}
+        return ordered_positions, index_by_position, neighbors_indexes, final_indexes
+
+    @staticmethod
+    def _find_checkpoint_path(grid: Grid, start_position: Position, positions: set[Position], end_position: Position | None) -> list[Position] | None:
+        """Depth first search over a visited bitmask, remembering the (position, visited) states that cannot be completed."""
+        ordered_positions, index_by_position, neighbors_indexes, final_indexes = LinearPathGrid._indexed_positions(grid, positions, end_position)
+        if start_position not in index_by_position:
+            return None
+        all_visited = (1 << len(ordered_positions)) - 1
+        start_index = index_by_position[start_position]
+        path = [start_index]
+        visited = 1 << start_index
+        if visited == all_visited:
+            return [start_position] if start_index in final_indexes else None
+        dead_states: set[tuple[int, int]] = set()
+        stack = [iter(neighbors_indexes[start_index])]
+        while stack:
+            for next_index in stack[-1]:
+                next_visited = visited | 1 << next_index
+                if next_visited == visited or (next_index, next_visited) in dead_states:
+                    continue
+                if next_visited == all_visited:
+                    if next_index in final_indexes:
+                        return [ordered_positions[index] for index in path] + [ordered_positions[next_index]]
+                    continue
+                path.append(next_index)
+                visited = next_visited
+                stack.append(iter(neighbors_indexes[next_index]))
+                break
+            else:
+                stack.pop()
+                dead_states.add((path[-1], visited))
+                visited ^= 1 << path.pop()
         return None
 
     @staticmethod
@@ -149,20 +192,51 @@ class LinearPathGrid(Grid[PathCell]):
         return count_found > 1
 
     @staticmethod
-    def _has_multy_path(grid: Grid, start_position: Position, positions: set[Position], end_position: Position, current_path=None, found_count=0):
-        if current_path is None:
-            current_path = [start_position]
-        if len(current_path) == len(positions) and start_position in grid.neighbors_positions(end_position):
-            found_count += 1
-            return found_count
-        for next_position in grid.neighbors_positions(start_position):
-            if next_position in positions and next_position not in current_path:
-                new_path = current_path.copy()
-                new_path.append(next_position)
-                found_count = LinearPathGrid._has_multy_path(grid, next_position, positions, end_position, new_path, found_count)
+    def _has_multy_path(grid: Grid, start_position: Position, positions: set[Position], end_position: Position) -> int:
+        """Number of paths, capped at 2, counted by a depth first search memoized on (position, visited bitmask)."""
+        ordered_positions, index_by_position, neighbors_indexes, final_indexes = LinearPathGrid._indexed_positions(grid, positions, end_position)
+        if start_position not in index_by_position:
+            return 0
+        all_visited = (1 << len(ordered_positions)) - 1
+        start_index = index_by_position[start_position]
+        if 1 << start_index == all_visited:
+            return 1 if start_index in final_indexes else 0
+        counts: dict[tuple[int, int], int] = {}
+        stack = [[start_index, 1 << start_index, iter(neighbors_indexes[start_index]), 0]]
+        while stack:
+            frame = stack[-1]
+            index, visited, next_indexes, found_count = frame
+            for next_index in next_indexes:
                 if found_count > 1:
+                    break
+                next_visited = visited | 1 << next_index
+                if next_visited == visited:
+                    continue
+                if next_visited == all_visited:
+                    found_count += next_index in final_indexes
+                    continue
+                known_count = counts.get((next_index, next_visited))
+                if known_count is not None:
+                    found_count += known_count
+                    continue
+                frame[3] = found_count
+                stack.append([next_index, next_visited, iter(neighbors_indexes[next_index]), 0])
+                break
+            else:
+                found_count = min(found_count, 2)
+                counts[(index, visited)] = found_count
+                stack.pop()
+                if not stack:
                     return found_count
-        return found_count
+                stack[-1][3] += found_count
+                continue
+            if found_count > 1:
+                counts[(index, visited)] = 2
+                stack.pop()
+                if not stack:
+                    return 2
+                stack[-1][3] += 2
+        return 0
 
     def next(self, position):
         value = self[position]
@@ -1,6 +1,7 @@
 ﻿import typing
 
 from Domain.Board.Direction import Direction
+from Domain.Board.GridSymmetry import GridSymmetry
 
 PipeString = typing.Literal[
     "L0", "L1", "L2", "L3",
@@ -64,5 +65,8 @@ class Pipe:
     def __repr__(self):
         return str(self)
 
+    def transformed(self, symmetry: GridSymmetry, rows_number: int, columns_number: int) -> 'Pipe':
+        return Pipe.from_connection(frozenset(symmetry.map_direction(direction) for direction in self.get_connected_to()))
+
     def get_connected_to(self) -> frozenset[Direction]:
         return PIPE_STRING_TO_CONNECTIONS[self._string]
@@ -1,6 +1,7 @@
 ﻿from typing import Tuple
 
 from Domain.Board.Grid import Grid
+from Domain.Board.GridConnectivity import UnionFind
 from Domain.Board.Pipe import Pipe
 from Domain.Board.Position import Position
 
@@ -10,36 +11,16 @@ class PipesGrid(Grid[Pipe]):
         super().__init__(input_matrix)
 
     def get_connected_positions_and_is_loop(self) -> Tuple[list[set[Position]], bool]:
-        total_positions = self.columns_number * self.rows_number
-        visited_list: list[set[Position]] = []
-        visited_flat: set[Position] = set()
+        union_find = UnionFind(self.rows_number * self.columns_number)
         is_loop = False
-        while len(visited_flat) != total_positions:
-            position = next(position for position, _ in self if position not in visited_flat)
-            visited_in_this_pass, is_loop_in_this_pass = self._depth_first_search_pipes_and_is_loop(position)
-            if is_loop_in_this_pass:
-                is_loop = True
-            visited_list.append(visited_in_this_pass)
-            visited_flat.update(visited_in_this_pass)
-        return visited_list, is_loop
-
-    def _depth_first_search_pipes_and_is_loop(self, position: Position, visited_positions=None, forbidden_direction=None) -> tuple[set[Position], bool]:
-        if visited_positions is None:
-            visited_positions = set()
-        if position in visited_positions:
-            return visited_positions, True
-        visited_positions.add(position)
-
-        current_pipe = self[position]
-        connected_to = current_pipe.get_connected_to()
-        loop = False
-        for direction in [direction for direction in connected_to if direction != forbidden_direction]:
-            next_pos = position.after(direction)
-            if next_pos not in self or {position, next_pos} in self._walls:
-                continue
-            next_pipe = self[next_pos]
-            if direction.opposite in next_pipe.get_connected_to():
-                _, is_loop = self._depth_first_search_pipes_and_is_loop(next_pos, visited_positions, direction.opposite)
-                if is_loop:
-                    loop = True
-        return visited_positions, loop
+        for position, pipe in self:
+            for direction in pipe.get_connected_to():
+                next_position = position.after(direction)
+                if next_position < position or next_position not in self or {position, next_position} in self._walls:
+                    continue
+                if direction.opposite in self[next_position].get_connected_to() and not union_find.union(self.get_index_from_position(position), self.get_index_from_position(next_position)):
+                    is_loop = True
+        connected_positions: dict[int, set[Position]] = {}
+        for index, position in enumerate(self.get_positions()):
+            connected_positions.setdefault(union_find.find(index), set()).add(position)
+        return list(connected_positions.values()), is_loop
@@ -4,9 +4,25 @@ from Domain.Board.Direction import Direction
 
 
 class Position:
-    def __init__(self, row, column):
-        self.r = row
-        self.c = column
+    __slots__ = ('r', 'c', '_hash')
+    _interned: dict[tuple[int, int], 'Position'] = {}
+    _MAX_INTERNED = 1 << 20
+
+    def __new__(cls, row, column):
+        key = (row, column)
+        position = Position._interned.get(key)
+        if position is not None and type(row) is int and type(column) is int:
+            return position
+        position = object.__new__(cls)
+        position.r = row
+        position.c = column
+        position._hash = hash(key)
+        if type(row) is int and type(column) is int and len(Position._interned) < Position._MAX_INTERNED:
+            Position._interned[key] = position
+        return position
+
+    def __reduce__(self):
+        return Position, (self.r, self.c)
 
     def neighbors(self, mode='orthogonal') -> list['Position']:
         if mode == 'orthogonal':
@@ -24,7 +40,7 @@ class Position:
 
     def direction_to(self, other: 'Position') -> Direction:
         if other is None or self == other:
-            return Direction(Direction.none())
+            return Direction.none()
         if self.r == other.r:
             if self.c < other.c:
                 return Direction.right()
@@ -33,7 +49,7 @@ class Position:
             if self.r < other.r:
                 return Direction.down()
             return Direction.up()
-        return Direction(Direction.none())
+        return Direction.none()
 
     def direction_from(self, other: 'Position') -> Direction:
         return other.direction_to(self)
@@ -46,15 +62,10 @@ class Position:
         return math.sqrt(math.pow(self.r - other.r, 2) + math.pow(self.c - other.c, 2))
 
     def after(self, direction: Direction, count=1) -> 'Position':
-        if direction == Direction.down():
-            return Position(self.r + count, self.c)
-        if direction == Direction.right():
-            return Position(self.r, self.c + count)
-        if direction == Direction.up():
-            return Position(self.r - count, self.c)
-        if direction == Direction.left():
-            return Position(self.r, self.c - count)
-        return self
+        delta = _DIRECTION_DELTAS.get(direction)
+        if delta is None:
+            return self
+        return Position(self.r + delta[0] * count, self.c + delta[1] * count)
 
     def before(self, direction, count=1) -> 'Position':
         return self.after(direction.opposite, count)
@@ -123,10 +134,10 @@ class Position:
         return Position(math.ceil(self.r), math.ceil(self.c))
 
     def __eq__(self, other):
-        return isinstance(other, Position) and self.r == other.r and self.c == other.c
+        return self is other or (isinstance(other, Position) and self.r == other.r and self.c == other.c)
 
     def __hash__(self):
-        return hash((self.r, self.c))
+        return self._hash
 
     def __str__(self):
         return f'({self.r}, {self.c})'
@@ -168,10 +179,7 @@ class Position:
         return self.r if item == 0 else self.c
 
     def __setitem__(self, key, value):
-        if key == 0:
-            self.r = value
-        else:
-            self.c = value
+        raise TypeError("Position is immutable")
 
     def __iter__(self):
         return iter([self.r, self.c])
@@ -181,3 +189,6 @@ class Position:
 
     def __len__(self):  # get air of rectangle from (0, 0) to self
         return abs(self.r) + abs(self.c) + 1
+
+
+_DIRECTION_DELTAS = {Direction.down(): (1, 0), Direction.right(): (0, 1), Direction.up(): (-1, 0), Direction.left(): (0, -1)}
@@ -1,5 +1,6 @@
 from Domain.Board.Direction import Direction
 from Domain.Board.Grid import Grid
+from Domain.Board.GridConnectivity import GridConnectivity
 from Domain.Board.Position import Position
 
 
@@ -29,15 +30,7 @@ class RegionsGrid(Grid):
         return grid
 
     @classmethod
-    def _depth_first_search_regions(cls, grid: Grid, position: Position, visited=None) -> set[Position]:
-        if visited is None: visited = set()
-        if position in visited: return visited
-
-        visited.add(position)
-        opened_on = grid[position]
-        for new_position in [position.after(dirct) for dirct in Direction.orthogonal_directions() if dirct in opened_on and position.after(dirct) in grid]:
-            new_visited = cls._depth_first_search_regions(grid, new_position, visited)
-            if new_visited != visited:
-                return new_visited
-
-        return visited
+    def _depth_first_search_regions(cls, grid: Grid, position: Position) -> set[Position]:
+        return GridConnectivity.component(position, lambda current: [
+            current.after(direction) for direction in Direction.orthogonal_directions() if direction in grid[current] and current.after(direction) in grid
+        ])
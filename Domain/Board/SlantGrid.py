@@ -1,4 +1,5 @@
 from Domain.Board.Grid import Grid
+from Domain.Board.GridSymmetry import GridSymmetry
 from Domain.Board.Position import Position
 
 
@@ -36,6 +37,11 @@ class SlantGrid(Grid):
 
         return cls(matrix)
 
+    def _transform_cell(self, value, symmetry: GridSymmetry):
+        if value is None or not symmetry.reverses_orientation:
+            return value
+        return not value
+
     def __str__(self):
         result = ""
         for r in range(self.rows_number):
@@ -1,6 +1,6 @@
 ﻿from collections import defaultdict
 from itertools import combinations
-from typing import Tuple, FrozenSet, Dict, List, TypeVar, Set, Generic, Iterable
+from typing import FrozenSet, Dict, List, TypeVar, Set, Generic, Iterable
 
 from bitarray import bitarray
 
@@ -25,6 +25,7 @@ class WrappedGrid(GridBase[T], Generic[T]):
 
         if isinstance(key, tuple):
             return self._matrix[key[0]][key[1]]
+        self._hash = None
         return self._matrix[key]
 
     def __contains__(self, item):
@@ -41,76 +42,9 @@ class WrappedGrid(GridBase[T], Generic[T]):
                 regions[self._matrix[r][c]].add(Position(r, c))
         return {key: frozenset(value) for key, value in regions.items()} if regions else {}
 
-    def are_cells_connected(self, value: T = True, mode='orthogonal') -> bool:
-        position = self._get_cell_of_value(value)
-        if position is None:
-            return False
-        visited = self._depth_first_search(position, value, mode)
-        return len(visited) == sum(cell == value for row in self._matrix for cell in row)
-
     def are_all_cells_connected(self, mode='orthogonal') -> bool:
         return all([self.are_cells_connected(region_key, mode) for region_key in self.get_regions().keys()])
 
-    def get_all_shapes(self, value=True, mode='orthogonal') -> Set[FrozenSet[Position]]:
-        excluded = []
-        shapes = set()
-        while True:
-            position = self._get_cell_of_value(value, excluded)
-            if position is None:
-                break
-            if any(position in shape for shape in shapes):
-                excluded.append(position)
-                continue
-            visited = self._depth_first_search(position, value, mode)
-            shapes.add(frozenset(visited))
-            excluded.append(position)
-        return shapes
-
-    def are_min_2_connected_cells_touch_border(self, position, mode='orthogonal') -> Tuple[bool, set[Position]]:
-        value = self.value(position)
-        visited = self._depth_first_search(position, value, mode)
-        if len(visited) <= 1:
-            return False, set()
-        border_cells = set()
-        for cell in visited:
-            if cell[0] == 0 or cell[0] == self.rows_number - 1 or cell[1] == 0 or cell[1] == self.columns_number - 1:
-                border_cells.add(cell)
-        return len(border_cells) >= 2, visited
-
-    def find_all_min_2_connected_cells_touch_border(self, value, mode='orthogonal') -> Set[FrozenSet[Position]]:
-        excluded = []
-        cells_sets: Set[FrozenSet[Position]] = set()
-        while True:
-            position = self._get_cell_of_value(value, excluded)
-            if position is None:
-                break
-            if any(position in cells_set for cells_set in cells_sets):
-                excluded.append(position)
-                continue
-            are_touch_border, cells = self.are_min_2_connected_cells_touch_border(position, mode)
-            if are_touch_border:
-                cells_sets.add(frozenset(cells))
-            excluded.append(position)
-        return cells_sets
-
-    def _depth_first_search(self, position: Position, value, mode='orthogonal', visited=None) -> Set[Position]:
-        if visited is None:
-            visited = set()
-        if (self.value(position) != value) or (position in visited):
-            return visited
-        visited.add(position)
-
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)] if mode != 'diagonal' else [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-        for dr, dc in directions:
-            if 0 <= position.r + dr < self.rows_number and 0 <= position.c + dc < self.columns_number and (position.r + dr, position.c + dc) not in visited:
-                current_position = position + Position(dr, dc)
-                if self.value(current_position) == value:
-                    new_visited = self._depth_first_search(current_position, value, mode, visited)
-                    if new_visited != visited:
-                        return new_visited
-
-        return visited
-
     @staticmethod
     def get_adjacent_combinations(neighbour_length, block_length, circular) -> list[list[bool]]:
         if block_length == 0:
@@ -151,9 +85,6 @@ class WrappedGrid(GridBase[T], Generic[T]):
     def list_to_string(values):
         return sum(values)
 
-    def is_empty(self):
-        return self == Grid.empty()
-
     def neighbors_positions(self, position: Position, mode='orthogonal') -> list[Position]:
         return [position for position in position.neighbors(mode) if position in self]
 
@@ -1,5 +1,6 @@
 ﻿from typing import Tuple
 
+from Domain.Board.GridConnectivity import GridConnectivity
 from Domain.Board.Pipe import Pipe
 from Domain.Board.Position import Position
 from Domain.Board.WrappedGrid import WrappedGrid
@@ -10,38 +11,18 @@ class WrappedPipesGrid(WrappedGrid[Pipe]):
         super().__init__(input_matrix)
 
     def get_connected_positions_and_is_loop(self) -> Tuple[list[set[Position]], bool]:
-        total_positions = self.columns_number * self.rows_number
-        visited_list: list[set[Position]] = []
-        visited_flat: set[Position] = set()
-        is_loop = False
-        while len(visited_flat) != total_positions:
-            position = next(position for position, _ in self if position not in visited_flat)
-            visited_in_this_pass, is_loop_in_this_pass = self._depth_first_search_pipes_and_is_loop(position)
-            if is_loop_in_this_pass:
-                is_loop = True
-            visited_list.append(visited_in_this_pass)
-            visited_flat.update(visited_in_this_pass)
-        return visited_list, is_loop
+        return GridConnectivity.components_from(self.get_positions(), self._connected_pipes_positions), False
 
-    def _depth_first_search_pipes_and_is_loop(self, position: Position, visited_positions=None, forbidden_direction=None) -> Tuple[set[Position], bool]:
-        if visited_positions is None:
-            visited_positions = set()
-        if position in visited_positions:
-            return visited_positions, True
-        visited_positions.add(position)
-
-        current_pipe = self[position]
-        connected_to = current_pipe.get_connected_to()
-        for direction in [direction for direction in connected_to if direction != forbidden_direction]:
-            next_pos = position.after(direction)
-            if {position, next_pos} in self._walls:
+    def _connected_pipes_positions(self, position: Position) -> list[Position]:
+        connected_positions = []
+        for direction in self[position].get_connected_to():
+            next_position = position.after(direction)
+            if {position, next_position} in self._walls:
                 continue
-            next_pos = self.normalize_position(next_pos)
-            next_pipe = self[next_pos]
-            if direction.opposite in next_pipe.get_connected_to():
-                self._depth_first_search_pipes_and_is_loop(next_pos, visited_positions, direction.opposite)
-
-        return visited_positions, False
+            next_position = self.normalize_position(next_position)
+            if direction.opposite in self[next_position].get_connected_to():
+                connected_positions.append(next_position)
+        return connected_positions
 
     def normalize_position(self, position: Position) -> Position:
         if position.r < 0:
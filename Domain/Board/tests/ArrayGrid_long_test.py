@@ -0,0 +1,40 @@
+import random
+import time
+import unittest
+from unittest import TestCase
+
+from Domain.Board.ArrayGrid import ArrayGrid
+from Domain.Board.Grid import Grid
+
+
+class ArrayGridLongTest(TestCase):
+    @staticmethod
+    def _random_matrix(size: int) -> list[list[bool]]:
+        rng = random.Random(11)
+        return [[rng.random() < 0.55 for _ in range(size)] for _ in range(size)]
+
+    @staticmethod
+    def _measure(function, repetitions: int) -> float:
+        start = time.perf_counter()
+        for _ in range(repetitions):
+            function()
+        return (time.perf_counter() - start) / repetitions
+
+    def test_get_all_shapes_benchmark(self):
+        matrix = self._random_matrix(30)
+        grid, array_grid = Grid(matrix), ArrayGrid(matrix)
+        self.assertEqual(grid.get_all_shapes(), array_grid.get_all_shapes())
+        list_seconds = self._measure(grid.get_all_shapes, 1)
+        array_seconds = self._measure(array_grid.get_all_shapes, 20)
+        print(f"get_all_shapes 30x30: list grid {list_seconds * 1000:.1f}ms, array grid {array_seconds * 1000:.2f}ms")
+        self.assertLess(array_seconds, list_seconds)
+
+    def test_label_benchmark(self):
+        for size in (100, 300):
+            array_grid = ArrayGrid(self._random_matrix(size))
+            seconds = self._measure(array_grid.label, 5)
+            print(f"label {size}x{size}: {seconds * 1000:.1f}ms")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from Domain.Board.ArrayGrid import ArrayGrid
+from Domain.Board.Grid import Grid
+from Domain.Board.Position import Position
+
+
+class ArrayGridTest(TestCase):
+    def test_wraps_array_without_copy(self):
+        array = np.zeros((2, 3), dtype=np.int8)
+        grid = ArrayGrid(array)
+        grid[Position(1, 2)] = 5
+        self.assertEqual(5, array[1, 2])
+        self.assertEqual((2, 3), (grid.rows_number, grid.columns_number))
+        self.assertEqual(5, grid.value(1, 2))
+        self.assertIsInstance(grid.value(1, 2), int)
+
+    def test_rejects_non_numeric_values(self):
+        with self.assertRaises(ValueError):
+            ArrayGrid([['a', 'b']])
+
+    def test_equals_list_grid(self):
+        matrix = [[1, 2], [3, 4]]
+        self.assertEqual(Grid(matrix), ArrayGrid(matrix))
+        self.assertEqual(ArrayGrid(matrix), Grid(matrix))
+        self.assertNotEqual(ArrayGrid(matrix), ArrayGrid([[1, 2], [3, 5]]))
+        self.assertEqual(repr(Grid(matrix)), repr(ArrayGrid(matrix)))
+
+    def test_from_solver_values(self):
+        grid = ArrayGrid.from_solver_values([7, 8, 9, 10], np.array([[3, 0], [1, 2]]))
+        self.assertEqual([[10, 7], [8, 9]], grid.matrix)
+
+    def test_counts(self):
+        grid = ArrayGrid([[1, 1, 2], [3, 1, 2]])
+        self.assertEqual(3, grid.count(1))
+        self.assertEqual({1: 3, 2: 2, 3: 1}, grid.count_by_value())
+        self.assertEqual((1.0, 3.0), (grid.min_value(), grid.max_value()))
+
+    def test_get_regions(self):
+        grid = ArrayGrid([[1, 1, 2], [3, 1, 2]])
+        self.assertEqual({
+            1: frozenset({Position(0, 0), Position(0, 1), Position(1, 1)}),
+            2: frozenset({Position(0, 2), Position(1, 2)}),
+            3: frozenset({Position(1, 0)}),
+        }, grid.get_regions())
+
+    def test_label_numbers_components_in_row_major_order(self):
+        grid = ArrayGrid([
+            [1, 0, 1],
+            [1, 0, 0],
+            [0, 1, 1],
+        ])
+        labels, components_count = grid.label(1)
+        self.assertEqual(3, components_count)
+        self.assertEqual([[1, 0, 2], [1, 0, 0], [0, 3, 3]], labels.tolist())
+
+    def test_label_follows_spiral(self):
+        grid = ArrayGrid([
+            [1, 1, 1, 1, 1],
+            [0, 0, 0, 0, 1],
+            [1, 1, 1, 0, 1],
+            [1, 0, 0, 0, 1],
+            [1, 1, 1, 1, 1],
+        ])
+        self.assertEqual(1, grid.label(1)[1])
+        self.assertTrue(grid.are_cells_connected(1))
+
+    def test_get_all_shapes_by_mode(self):
+        grid = ArrayGrid([
+            [True, False, False],
+            [False, True, False],
+            [False, True, True],
+        ])
+        self.assertEqual({frozenset({Position(0, 0)}), frozenset({Position(1, 1), Position(2, 1), Position(2, 2)})}, grid.get_all_shapes())
+        self.assertEqual({frozenset({Position(0, 0), Position(1, 1), Position(2, 1), Position(2, 2)})}, grid.get_all_shapes(True, 'diagonal'))
+        self.assertEqual({frozenset({Position(0, 0), Position(1, 1), Position(2, 2)}), frozenset({Position(2, 1)})}, grid.get_all_shapes(True, 'diagonal_only'))
+        self.assertFalse(grid.are_cells_connected())
+        self.assertTrue(grid.are_cells_connected(True, 'diagonal'))
+
+    def test_walls_split_components(self):
+        grid = ArrayGrid([[1, 1, 1]])
+        grid.add_wall([Position(0, 1), Position(0, 2)])
+        self.assertEqual({frozenset({Position(0, 0), Position(0, 1)}), frozenset({Position(0, 2)})}, grid.get_all_shapes(1))
+
+    def test_different_neighbors(self):
+        grid = ArrayGrid([
+            [1, 1, 2],
+            [1, 1, 2],
+        ])
+        self.assertEqual([[False, True, True], [False, True, True]], grid.different_neighbors_mask().tolist())
+        self.assertEqual([(Position(0, 1), Position(0, 2)), (Position(1, 1), Position(1, 2))], grid.find_different_neighbors_positions())
+
+    def test_matches_list_grid_on_random_grids(self):
+        rng = np.random.default_rng(5)
+        for _ in range(20):
+            matrix = rng.integers(0, 3, size=rng.integers(1, 8, size=2)).tolist()
+            grid, array_grid = Grid(matrix), ArrayGrid(matrix)
+            self.assertEqual(grid.get_regions(), array_grid.get_regions())
+            for value in range(3):
+                for mode in ('orthogonal', 'diagonal', 'diagonal_only'):
+                    self.assertEqual(grid.get_all_shapes(value, mode), array_grid.get_all_shapes(value, mode))
+
+
+if __name__ == '__main__':
+    unittest.main()
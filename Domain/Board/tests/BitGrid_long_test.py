@@ -0,0 +1,37 @@
+import random
+import time
+import unittest
+from unittest import TestCase
+
+from Domain.Board.BitGrid import BitGrid
+from Domain.Board.Grid import Grid
+
+
+class BitGridLongTest(TestCase):
+    @staticmethod
+    def _measure(function, repetitions: int) -> float:
+        start = time.perf_counter()
+        for _ in range(repetitions):
+            function()
+        return (time.perf_counter() - start) / repetitions
+
+    def test_bit_grid_against_grid_benchmark(self):
+        rng = random.Random(11)
+        size = 30
+        grid = Grid([[rng.random() < 0.6 for _ in range(size)] for _ in range(size)])
+        bit_grid = BitGrid.from_grid(grid)
+        self.assertEqual(grid.get_all_shapes(True), bit_grid.shapes())
+
+        grid_shapes_seconds = self._measure(lambda: grid.get_all_shapes(True), 20)
+        bit_shapes_seconds = self._measure(lambda: bit_grid.shapes(), 20)
+        grid_connected_seconds = self._measure(lambda: grid.are_cells_connected(True), 20)
+        bit_connected_seconds = self._measure(lambda: bit_grid.is_connected(), 20)
+        grid_counts_seconds = self._measure(lambda: [sum(row) for row in grid.matrix] + [sum(column) for column in zip(*grid.matrix)], 20)
+        bit_counts_seconds = self._measure(lambda: bit_grid.row_counts() + bit_grid.column_counts(), 20)
+        print(f"{size}x{size}: shapes {grid_shapes_seconds * 1000:.2f}ms -> {bit_shapes_seconds * 1000:.2f}ms, "
+              f"connected {grid_connected_seconds * 1000:.3f}ms -> {bit_connected_seconds * 1000:.3f}ms, "
+              f"row/column counts {grid_counts_seconds * 1000:.3f}ms -> {bit_counts_seconds * 1000:.3f}ms")
+
+
+if __name__ == '__main__':
+    unittest.main()
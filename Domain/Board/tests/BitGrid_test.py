@@ -0,0 +1,66 @@
+import unittest
+from unittest import TestCase
+
+from Domain.Board.BitGrid import BitGrid
+from Domain.Board.Grid import Grid
+from Domain.Board.Position import Position
+
+
+class BitGridTest(TestCase):
+    def setUp(self):
+        self.matrix = [
+            [1, 1, 0, 1],
+            [1, 1, 0, 1],
+            [0, 0, 1, 1],
+        ]
+        self.bit_grid = BitGrid.from_matrix(self.matrix)
+
+    def test_round_trips_through_grid_and_hex(self):
+        self.assertEqual(Grid([[bool(value) for value in row] for row in self.matrix]), self.bit_grid.to_grid())
+        self.assertEqual(Grid(self.matrix), self.bit_grid.to_grid(1, 0))
+        self.assertEqual(self.bit_grid, BitGrid.from_hex(3, 4, self.bit_grid.to_hex()))
+        self.assertEqual(self.bit_grid, BitGrid.from_positions(3, 4, self.bit_grid.positions()))
+        self.assertTrue(self.bit_grid[Position(2, 3)])
+        self.assertFalse(self.bit_grid[Position(0, 2)])
+        self.assertTrue(BitGrid.from_grid(Grid.empty()).is_empty())
+
+    def test_counts_by_row_column_and_region(self):
+        self.assertEqual(8, self.bit_grid.count())
+        self.assertEqual([3, 3, 2], self.bit_grid.row_counts())
+        self.assertEqual([2, 2, 1, 3], self.bit_grid.column_counts())
+        region_masks = {'left': self.bit_grid.region_mask([Position(0, 0), Position(2, 0), Position(2, 1)]), 'row': self.bit_grid.row_mask(1)}
+        self.assertEqual({'left': 1, 'row': 3}, self.bit_grid.region_counts(region_masks))
+
+    def test_shifts_do_not_wrap_around_rows(self):
+        self.assertEqual(BitGrid.from_matrix([[0, 1, 1, 0], [0, 1, 1, 0], [0, 0, 0, 1]]), self.bit_grid.right())
+        self.assertEqual(BitGrid.from_matrix([[1, 0, 1, 0], [1, 0, 1, 0], [0, 1, 1, 0]]), self.bit_grid.left())
+        self.assertEqual(BitGrid.from_matrix([[1, 1, 0, 1], [0, 0, 1, 1], [0, 0, 0, 0]]), self.bit_grid.up())
+        self.assertEqual(BitGrid.from_matrix([[0, 0, 0, 0], [1, 1, 0, 1], [1, 1, 0, 1]]), self.bit_grid.down())
+
+    def test_2x2_blocks_and_runs(self):
+        self.assertEqual([Position(0, 0)], list(self.bit_grid.blocks_2x2().positions()))
+        self.assertTrue(self.bit_grid.has_2x2_block())
+        self.assertFalse(BitGrid.from_matrix([[1, 0, 1], [1, 1, 1]]).has_2x2_block())
+        self.assertEqual([Position(0, 3)], list(self.bit_grid.runs(3, 1, 0).positions()))
+        self.assertFalse(self.bit_grid.has_run(4))
+        self.assertTrue(self.bit_grid.has_run(3, 'all'))
+        self.assertTrue(BitGrid.from_matrix([[1, 0, 0], [0, 1, 0], [0, 0, 1]]).has_run(3, 'all'))
+
+    def test_flood_fill_and_components(self):
+        self.assertEqual(2, len(self.bit_grid.components()))
+        self.assertFalse(self.bit_grid.is_connected())
+        self.assertTrue(self.bit_grid.is_connected('diagonal'))
+        self.assertEqual({frozenset({Position(0, 0), Position(0, 1), Position(1, 0), Position(1, 1)}),
+                          frozenset({Position(0, 3), Position(1, 3), Position(2, 2), Position(2, 3)})}, self.bit_grid.shapes())
+        self.assertEqual(self.bit_grid.shapes(), Grid(self.matrix).get_all_shapes(1))
+        self.assertTrue(self.bit_grid.has_adjacent())
+        self.assertFalse(BitGrid.from_matrix([[1, 0], [0, 1]]).has_adjacent())
+        self.assertTrue(BitGrid.from_matrix([[1, 0], [0, 1]]).has_adjacent('diagonal'))
+
+    def test_exclusion_literals_negate_set_cells(self):
+        bit_grid = BitGrid.from_matrix([[1, 0], [0, 1]])
+        self.assertEqual(['not a', 'b', 'c', 'not d'], bit_grid.exclusion_literals('abcd', lambda variable: f'not {variable}'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import random
+import time
+import unittest
+from unittest import TestCase
+
+from Domain.Board.Grid import Grid
+from Domain.Board.Position import Position
+
+
+class GridAdjacencyLongTest(TestCase):
+    @staticmethod
+    def _measure(function, repetitions: int) -> float:
+        start = time.perf_counter()
+        for _ in range(repetitions):
+            function()
+        return (time.perf_counter() - start) / repetitions
+
+    def test_neighbors_and_rays_benchmark(self):
+        rng = random.Random(11)
+        size = 30
+        grid = Grid([[0 for _ in range(size)] for _ in range(size)])
+        for _ in range(size * 4):
+            position = Position(rng.randrange(size - 1), rng.randrange(size - 1))
+            grid.add_wall([position, position.right if rng.random() < 0.5 else position.down])
+        positions = [position for position, _ in grid]
+
+        neighbors_seconds = self._measure(lambda: [grid.neighbors_positions(position) for position in positions], 20)
+        neighbor_up_seconds = self._measure(lambda: [grid.neighbor_up(position) for position in positions], 20)
+        rays_seconds = self._measure(lambda: [grid.all_orthogonal_positions(position) for position in positions], 20)
+        print(f"{size}x{size}, {len(grid.walls)} walls, per full-grid pass: neighbors_positions {neighbors_seconds * 1000:.2f}ms, "
+              f"neighbor_up {neighbor_up_seconds * 1000:.2f}ms, all_orthogonal_positions {rays_seconds * 1000:.2f}ms")
+
+
+if __name__ == '__main__':
+    unittest.main()
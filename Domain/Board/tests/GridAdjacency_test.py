@@ -0,0 +1,50 @@
+import unittest
+from unittest import TestCase
+
+from Domain.Board.Grid import Grid
+from Domain.Board.GridAdjacency import GridAdjacency
+from Domain.Board.Position import Position
+
+
+class GridAdjacencyTest(TestCase):
+    def setUp(self):
+        self.grid = Grid([[0 for _ in range(4)] for _ in range(3)])
+
+    def test_wall_masks_are_set_on_both_sides(self):
+        adjacency = GridAdjacency(3, 4, {frozenset({Position(1, 1), Position(1, 2)})})
+        self.assertTrue(adjacency.has_wall(adjacency.index(Position(1, 1)), GridAdjacency.RIGHT))
+        self.assertTrue(adjacency.has_wall(adjacency.index(Position(1, 2)), GridAdjacency.LEFT))
+        self.assertFalse(adjacency.has_wall(adjacency.index(Position(1, 1)), GridAdjacency.UP))
+        self.assertIsNone(adjacency.neighbors[GridAdjacency.RIGHT][adjacency.index(Position(1, 1))])
+
+    def test_index_is_none_outside_grid(self):
+        adjacency = GridAdjacency(3, 4, set())
+        self.assertEqual(5, adjacency.index(Position(1, 1)))
+        self.assertIsNone(adjacency.index(Position(-1, 0)))
+        self.assertIsNone(adjacency.index(Position(0, 4)))
+
+    def test_rays_stop_at_walls_and_edges(self):
+        self.grid.add_wall([Position(1, 2), Position(1, 3)])
+        self.assertEqual([Position(1, 1), Position(1, 2)], self.grid.all_positions_right(Position(1, 0)))
+        self.assertEqual([Position(1, 0)], self.grid.all_positions_left(Position(1, 1)))
+        self.assertEqual([Position(1, 2), Position(0, 2)], self.grid.all_positions_up(Position(2, 2)))
+        self.assertEqual([Position(1, 1), Position(0, 0)], self.grid.all_positions_up_left(Position(2, 2)))
+        self.assertEqual([Position(1, 2), Position(0, 3)], self.grid.all_positions_up_right(Position(2, 1)))
+        self.assertEqual([], self.grid.all_positions_left(Position(0, 0)))
+
+    def test_tables_are_rebuilt_when_walls_change(self):
+        self.assertEqual(Position(0, 1), self.grid.neighbor_right(Position(0, 0)))
+        self.grid.add_wall([Position(0, 0), Position(0, 1)])
+        self.assertIsNone(self.grid.neighbor_right(Position(0, 0)))
+        self.grid.set_walls(set())
+        self.assertEqual({Position(0, 1), Position(1, 0)}, self.grid.neighbors_positions(Position(0, 0)))
+        self.grid.walls.add(frozenset({Position(0, 0), Position(1, 0)}))
+        self.assertEqual({Position(0, 1)}, self.grid.neighbors_positions(Position(0, 0)))
+
+    def test_positions_outside_grid_are_still_answered(self):
+        self.assertEqual(Position(0, 0), self.grid.neighbor_down(Position(-1, 0)))
+        self.assertEqual([Position(0, 0), Position(1, 0), Position(2, 0)], self.grid.all_positions_down(Position(-1, 0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+﻿import unittest
+from unittest import TestCase
+
+from Domain.Board.Direction import Direction
+from Domain.Board.GridBase import GridBase
+from Domain.Board.GridSymmetry import GridSymmetry
+from Domain.Board.Position import Position
+
+
+class GridBaseTest(TestCase):
+    def test_transformed_rotates_matrix_clockwise(self):
+        grid = GridBase([
+            [1, 2, 3],
+            [4, 5, 6],
+        ])
+        expected_grid = GridBase([
+            [4, 1],
+            [5, 2],
+            [6, 3],
+        ])
+        self.assertEqual(expected_grid, grid.transformed(GridSymmetry(1)))
+
+    def test_transformed_mirrors_walls_and_directions(self):
+        grid = GridBase([[Direction.left(), 0, 0]])
+        grid.add_wall([Position(0, 0), Position(0, 1)])
+        transformed_grid = grid.transformed(GridSymmetry(0, True))
+        self.assertEqual(GridBase([[0, 0, Direction.right()]]), transformed_grid)
+        self.assertEqual({frozenset([Position(0, 2), Position(0, 1)])}, transformed_grid.walls)
+
+    def test_inverse_transform_restores_grid(self):
+        grid = GridBase([
+            [1, 2, 3],
+            [4, 5, 6],
+        ])
+        for symmetry in GridSymmetry.all():
+            self.assertEqual(grid, grid.transformed(symmetry).transformed(symmetry.inverse))
+
+    def test_canonical_form_is_shared_by_all_symmetric_grids(self):
+        grid = GridBase([
+            [1, 0, 0],
+            [0, 2, 0],
+            [0, 0, 3],
+            [4, 0, 0],
+        ])
+        canonical_grid, _ = grid.canonical_form()
+        for symmetry in GridSymmetry.all():
+            other_canonical_grid, other_symmetry = grid.transformed(symmetry).canonical_form()
+            self.assertEqual(canonical_grid, other_canonical_grid)
+            self.assertEqual(other_canonical_grid, grid.transformed(symmetry).transformed(other_symmetry))
+
+    def test_canonical_form_maps_back_with_inverse(self):
+        grid = GridBase([
+            [0, 7],
+            [3, 0],
+        ])
+        canonical_grid, symmetry = grid.canonical_form()
+        self.assertEqual(grid, canonical_grid.transformed(symmetry.inverse))
+
+    def test_canonical_form_depends_on_walls(self):
+        grid = GridBase([[0, 0], [0, 0]])
+        walled_grid = GridBase([[0, 0], [0, 0]])
+        walled_grid.add_wall([Position(0, 0), Position(0, 1)])
+        self.assertNotEqual(grid.canonical_form()[0]._canonical_key(), walled_grid.canonical_form()[0]._canonical_key())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import random
+import time
+import unittest
+from unittest import TestCase
+
+from Domain.Board.Grid import Grid
+from Domain.Board.Position import Position
+
+
+class GridConnectivityLongTest(TestCase):
+    @staticmethod
+    def _measure(function, repetitions: int) -> float:
+        start = time.perf_counter()
+        for _ in range(repetitions):
+            function()
+        return (time.perf_counter() - start) / repetitions
+
+    @staticmethod
+    def _random_grid(size: int) -> Grid:
+        rng = random.Random(11)
+        return Grid([[rng.random() < 0.55 for _ in range(size)] for _ in range(size)])
+
+    @staticmethod
+    def _snake_grid(size: int) -> Grid:
+        return Grid([[r % 4 != 1 or c == size - 1 if r % 4 < 2 else r % 4 != 3 or c == 0 for c in range(size)] for r in range(size)])
+
+    def test_connectivity_benchmark(self):
+        for size in (50, 100):
+            for name, grid in (('random', self._random_grid(size)), ('snake', self._snake_grid(size))):
+                shapes_seconds = self._measure(lambda: grid.get_all_shapes(True), 5)
+                connected_seconds = self._measure(lambda: grid.are_cells_connected(True), 5)
+                search_seconds = self._measure(lambda: grid._depth_first_search(Position(0, 0), True), 5)
+                print(f"{name} {size}x{size}: get_all_shapes {shapes_seconds * 1000:.1f}ms, are_cells_connected {connected_seconds * 1000:.1f}ms, "
+                      f"_depth_first_search {search_seconds * 1000:.1f}ms")
+                self.assertLess(shapes_seconds, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
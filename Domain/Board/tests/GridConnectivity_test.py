@@ -0,0 +1,61 @@
+import unittest
+from unittest import TestCase
+
+from Domain.Board.Grid import Grid
+from Domain.Board.GridConnectivity import GridConnectivity, UnionFind
+from Domain.Board.Position import Position
+
+
+class UnionFindTest(TestCase):
+    def test_union_joins_sets_once(self):
+        union_find = UnionFind(4)
+        self.assertTrue(union_find.union(0, 1))
+        self.assertTrue(union_find.union(2, 1))
+        self.assertFalse(union_find.union(0, 2))
+        self.assertTrue(union_find.connected(0, 2))
+        self.assertFalse(union_find.connected(0, 3))
+        self.assertEqual(3, union_find.size(2))
+
+
+class GridConnectivityTest(TestCase):
+    def setUp(self):
+        self.matrix = [
+            [1, 1, 0, 1],
+            [0, 1, 0, 1],
+            [1, 0, 1, 1],
+        ]
+
+    def test_label_numbers_components_in_row_major_order(self):
+        labels, components_count = GridConnectivity.label(self.matrix, 1)
+        self.assertEqual(3, components_count)
+        self.assertEqual([1, 1, 0, 2, 0, 1, 0, 2, 3, 0, 2, 2], labels)
+
+    def test_label_modes(self):
+        self.assertEqual(1, GridConnectivity.label(self.matrix, 1, 'diagonal')[1])
+        self.assertEqual(4, GridConnectivity.label(self.matrix, 1, 'diagonal_only')[1])
+        with self.assertRaises(ValueError):
+            GridConnectivity.label(self.matrix, 1, 'knight')
+
+    def test_walls_cut_orthogonal_steps_only(self):
+        walls = {frozenset({Position(0, 0), Position(0, 1)}), frozenset({Position(0, 1), Position(1, 1)})}
+        components = GridConnectivity.components(self.matrix, 1, 'orthogonal', walls)
+        self.assertIn({Position(0, 0)}, components)
+        self.assertIn({Position(0, 1)}, components)
+        self.assertIn({Position(1, 1)}, components)
+        self.assertEqual(1, GridConnectivity.label([[1, 0], [0, 1]], 1, 'diagonal', {frozenset({Position(0, 0), Position(1, 1)})})[1])
+
+    def test_component_follows_neighbors_function(self):
+        grid = Grid(self.matrix)
+        component = GridConnectivity.component(Position(0, 3), lambda position: [neighbor for neighbor in grid.neighbors_positions(position) if grid[neighbor] == 1])
+        self.assertEqual({Position(0, 3), Position(1, 3), Position(2, 3), Position(2, 2)}, component)
+
+    def test_long_snake_does_not_hit_recursion_limit(self):
+        size = 120
+        matrix = [[r % 4 != 1 or c == size - 1 if r % 4 < 2 else r % 4 != 3 or c == 0 for c in range(size)] for r in range(size)]
+        self.assertTrue(Grid(matrix).are_cells_connected(True))
+        self.assertEqual(1, len(Grid(matrix).get_all_shapes(True)))
+        self.assertEqual(sum(map(sum, matrix)), len(Grid(matrix)._depth_first_search(Position(0, 0), True)))
+
+
+if __name__ == '__main__':
+    unittest.main()
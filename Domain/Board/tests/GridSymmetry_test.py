@@ -0,0 +1,46 @@
+import unittest
+from unittest import TestCase
+
+from Domain.Board.Direction import Direction
+from Domain.Board.GridSymmetry import GridSymmetry
+from Domain.Board.Position import Position
+
+
+class GridSymmetryTest(TestCase):
+    def test_group_has_eight_distinct_elements(self):
+        self.assertEqual(8, len(set(GridSymmetry.all())))
+
+    def test_quarter_turn_maps_positions_clockwise(self):
+        symmetry = GridSymmetry(1)
+        self.assertEqual(Position(0, 1), symmetry.map_position(Position(0, 0), 2, 3))
+        self.assertEqual(Position(2, 1), symmetry.map_position(Position(0, 2), 2, 3))
+        self.assertEqual((3, 2), symmetry.transformed_size(2, 3))
+
+    def test_mirror_maps_positions_left_right(self):
+        self.assertEqual(Position(1, 2), GridSymmetry(0, True).map_position(Position(1, 0), 2, 3))
+
+    def test_inverse_maps_back_every_position(self):
+        rows_number, columns_number = 2, 3
+        for symmetry in GridSymmetry.all():
+            transformed_rows_number, transformed_columns_number = symmetry.transformed_size(rows_number, columns_number)
+            for position in [Position(r, c) for r in range(rows_number) for c in range(columns_number)]:
+                transformed_position = symmetry.map_position(position, rows_number, columns_number)
+                self.assertEqual(position, symmetry.inverse.map_position(transformed_position, transformed_rows_number, transformed_columns_number))
+
+    def test_map_direction_follows_map_position(self):
+        for symmetry in GridSymmetry.all():
+            for direction in Direction.orthogonal_directions():
+                position = Position(1, 1)
+                mapped_position = symmetry.map_position(position, 3, 3)
+                mapped_neighbor = symmetry.map_position(position.after(direction), 3, 3)
+                self.assertEqual(mapped_position.direction_to(mapped_neighbor), symmetry.map_direction(direction))
+
+    def test_reverses_orientation(self):
+        self.assertFalse(GridSymmetry(2).reverses_orientation)
+        self.assertTrue(GridSymmetry(1).reverses_orientation)
+        self.assertTrue(GridSymmetry(0, True).reverses_orientation)
+        self.assertFalse(GridSymmetry(1, True).reverses_orientation)
+
+
+if __name__ == '__main__':
+    unittest.main()
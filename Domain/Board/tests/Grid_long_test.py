@@ -0,0 +1,35 @@
+import random
+import time
+import unittest
+from unittest import TestCase
+
+from Domain.Board.Grid import Grid
+from Domain.Board.Position import Position
+
+
+class GridLongTest(TestCase):
+    @staticmethod
+    def _measure(function, repetitions: int) -> float:
+        start = time.perf_counter()
+        for _ in range(repetitions):
+            function()
+        return (time.perf_counter() - start) / repetitions
+
+    def test_hash_equality_and_emptiness_benchmark(self):
+        rng = random.Random(11)
+        size = 30
+        matrix = [[rng.randrange(10) for _ in range(size)] for _ in range(size)]
+        grid = Grid(matrix)
+        other_grid = Grid([row[:] for row in matrix])
+
+        equality_seconds = self._measure(lambda: grid == other_grid, 200)
+        string_hash_seconds = self._measure(lambda: hash(str(grid._matrix)), 200)
+        first_hash_seconds = self._measure(lambda: (grid.set_value(Position(0, 0), 1), hash(grid)), 200)
+        cached_hash_seconds = self._measure(lambda: hash(grid), 200)
+        is_empty_seconds = self._measure(lambda: grid.is_empty(), 200)
+        print(f"{size}x{size}: hash(str(matrix)) {string_hash_seconds * 1e6:.1f}us, hash after update {first_hash_seconds * 1e6:.1f}us, "
+              f"cached hash {cached_hash_seconds * 1e6:.2f}us, == {equality_seconds * 1e6:.1f}us, is_empty {is_empty_seconds * 1e6:.2f}us")
+
+
+if __name__ == '__main__':
+    unittest.main()
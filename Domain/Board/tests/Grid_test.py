@@ -543,6 +543,31 @@ class GridTest(TestCase):
         expected_repr = "Grid.empty()"
         self.assertEqual(repr(grid), expected_repr)
 
+    def test_equal_grids_share_hash(self):
+        grid = Grid([[1, 2], [3, 4]])
+        self.assertEqual(hash(Grid([[1, 2], [3, 4]])), hash(grid))
+        self.assertEqual(hash(Grid([[True, False]])), hash(Grid([[1, 0]])))
+        self.assertEqual(1, len({grid, Grid([[1, 2], [3, 4]])}))
+        self.assertEqual(hash(Grid([[[1], [2]]])), hash(Grid([[[1], [2]]])))
+
+    def test_hash_follows_cell_updates(self):
+        grid = Grid([[1, 2], [3, 4]])
+        hash(grid)
+        grid[Position(0, 0)] = 5
+        self.assertEqual(hash(Grid([[5, 2], [3, 4]])), hash(grid))
+        grid.set_value(Position(0, 1), 6)
+        self.assertEqual(hash(Grid([[5, 6], [3, 4]])), hash(grid))
+        grid[1][0] = 7
+        self.assertEqual(hash(Grid([[5, 6], [7, 4]])), hash(grid))
+        grid.matrix[1][1] = 8
+        self.assertEqual(hash(Grid([[5, 6], [7, 8]])), hash(grid))
+
+    def test_is_empty(self):
+        self.assertTrue(Grid.empty().is_empty())
+        self.assertTrue(Grid([[]]).is_empty())
+        self.assertFalse(Grid([[0]]).is_empty())
+        self.assertFalse(Grid([[], []]).is_empty())
+
     def test_repr_fully_populated_grid(self):
         grid = Grid([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
         expected_repr = "1 2 3\n4 5 6\n7 8 9"
@@ -0,0 +1,28 @@
+import time
+import unittest
+from unittest import TestCase
+
+from Domain.Board.Island import Island
+from Domain.Board.IslandsGrid import IslandGrid
+from Domain.Board.Position import Position
+
+
+class IslandsGridLongTest(TestCase):
+    @staticmethod
+    def _measure(function, repetitions: int) -> float:
+        start = time.perf_counter()
+        for _ in range(repetitions):
+            function()
+        return (time.perf_counter() - start) / repetitions
+
+    def test_construction_benchmark(self):
+        size = 25
+        island_grid = IslandGrid([[Island(Position(r, c), 2) for c in range(size)] for r in range(size)])
+
+        construction_seconds = self._measure(lambda: IslandGrid([[Island(Position(r, c), 2) for c in range(size)] for r in range(size)]), 10)
+        reset_seconds = self._measure(island_grid.with_reset_bridges, 10)
+        print(f"{size}x{size} islands: construction {construction_seconds * 1000:.2f}ms, with_reset_bridges {reset_seconds * 1000:.2f}ms")
+
+
+if __name__ == '__main__':
+    unittest.main()
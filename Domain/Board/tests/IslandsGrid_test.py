@@ -1,5 +1,7 @@
 ﻿from unittest import TestCase
 
+from Domain.Board.Direction import Direction
+from Domain.Board.GridSymmetry import GridSymmetry
 from Domain.Board.Island import Island
 from Domain.Board.IslandsGrid import IslandGrid
 from Domain.Board.Position import Position
@@ -283,3 +285,41 @@ class IslandsGridTest(TestCase):
             Position(0, 0)
         ]
         self.assertEqual(expected_positions, connected_positions)
+
+    def test_transformed_rotates_islands_and_bridges(self):
+        island00 = Island(Position(0, 0), 1)
+        island01 = Island(Position(0, 1), 1)
+        island_grid = IslandGrid([[island00, island01]])
+        island00.set_bridge_to_position(Position(0, 1), 1)
+        island01.set_bridge_to_position(Position(0, 0), 1)
+
+        transformed_grid = island_grid.transformed(GridSymmetry(1))
+
+        self.assertIsInstance(transformed_grid, IslandGrid)
+        self.assertEqual(' ╷ \n ╵ ', repr(transformed_grid))
+        self.assertEqual((Position(1, 0), 1), transformed_grid[Position(0, 0)].direction_position_bridges[Direction.down()])
+        self.assertEqual(island_grid, transformed_grid.transformed(GridSymmetry(1).inverse))
+
+    def test_possible_bridges_reach_nearest_island_in_each_direction(self):
+        island_grid = IslandGrid([[1, 0, 2], [0, 0, 0], [3, 0, 0]])
+
+        self.assertEqual({Direction.right(): (Position(0, 2), 0), Direction.down(): (Position(2, 0), 0)}, island_grid.islands[Position(0, 0)].direction_position_bridges)
+        self.assertEqual({Direction.left(): (Position(0, 0), 0)}, island_grid.islands[Position(0, 2)].direction_position_bridges)
+        self.assertEqual({Direction.up(): (Position(0, 0), 0)}, island_grid.islands[Position(2, 0)].direction_position_bridges)
+
+    def test_possible_crossover_bridges(self):
+        island_grid = IslandGrid([[0, 1, 0], [1, 0, 1], [0, 1, 0]])
+
+        self.assertEqual([{Position(0, 1): Direction.down(), Position(1, 0): Direction.right()}], island_grid.possible_crossover_bridge)
+
+    def test_with_reset_bridges_reuses_topology(self):
+        island_grid = IslandGrid([[Island(Position(r, c), 2) for c in range(3)] for r in range(2)])
+        island_grid[Position(0, 0)].set_bridge_to_position(Position(0, 1), 1)
+        island_grid[Position(0, 0)].set_bridges_count_according_to_directions_bridges()
+
+        reset_grid = island_grid.with_reset_bridges()
+
+        self.assertIs(island_grid.topology, reset_grid.topology)
+        self.assertEqual(2, reset_grid[Position(0, 0)].bridges_count)
+        self.assertEqual({Direction.right(): (Position(0, 1), 0), Direction.down(): (Position(1, 0), 0)}, reset_grid[Position(0, 0)].direction_position_bridges)
+        self.assertEqual(1, island_grid[Position(0, 0)].bridges_count)
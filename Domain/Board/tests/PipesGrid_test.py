@@ -1,6 +1,7 @@
 ﻿from unittest import TestCase
 
 from Domain.Board.Direction import Direction
+from Domain.Board.GridSymmetry import GridSymmetry
 from Domain.Board.Pipe import Pipe
 from Domain.Board.PipesGrid import PipesGrid
 from Domain.Board.Position import Position
@@ -69,3 +70,17 @@ class PipesGridTest(TestCase):
         ]
         self.assertEqual(expected_connected_positions, connected_positions)
         self.assertTrue(is_loop)
+
+    def test_transformed_rotates_pipes_connections(self):
+        pipes_grid = PipesGrid([
+            [Pipe.from_connection(frozenset([Direction.right()])), Pipe.from_connection(frozenset([Direction.left(), Direction.down()]))],
+        ])
+        expected_pipes_grid = PipesGrid([
+            [Pipe.from_connection(frozenset([Direction.down()]))],
+            [Pipe.from_connection(frozenset([Direction.up(), Direction.left()]))],
+        ])
+        transformed_grid = pipes_grid.transformed(GridSymmetry(1))
+        self.assertIsInstance(transformed_grid, PipesGrid)
+        self.assertEqual(str(expected_pipes_grid), str(transformed_grid))
+        connected_positions, is_loop = transformed_grid.get_connected_positions_and_is_loop()
+        self.assertEqual(1, len(connected_positions))
@@ -0,0 +1,45 @@
+import random
+import time
+import tracemalloc
+import unittest
+from unittest import TestCase
+
+from Domain.Board.Grid import Grid
+from Domain.Board.IslandsGrid import IslandGrid
+
+
+class PositionLongTests(TestCase):
+    @staticmethod
+    def _measure(function, repetitions: int) -> tuple[float, int]:
+        function()
+        tracemalloc.start()
+        function()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        start = time.perf_counter()
+        for _ in range(repetitions):
+            function()
+        return (time.perf_counter() - start) / repetitions, peak_bytes
+
+    def test_depth_first_search_benchmark(self):
+        rng = random.Random(11)
+        grid = Grid([[rng.random() < 0.5 for _ in range(60)] for _ in range(60)])
+        true_positions = [position for position, value in grid if value]
+
+        def search_from_every_cell():
+            for position in true_positions:
+                grid._depth_first_search(position, True)
+
+        seconds, peak_bytes = self._measure(search_from_every_cell, 3)
+        print(f"_depth_first_search 60x60: {seconds * 1000:.0f}ms, peak {peak_bytes / 1024:.0f}KiB")
+
+    def test_island_grid_construction_benchmark(self):
+        rng = random.Random(11)
+        matrix = [[rng.randint(1, 8) if rng.random() < 0.3 else 0 for _ in range(40)] for _ in range(40)]
+
+        seconds, peak_bytes = self._measure(lambda: IslandGrid([row[:] for row in matrix]), 5)
+        print(f"IslandGrid 40x40: {seconds * 1000:.0f}ms, peak {peak_bytes / 1024:.0f}KiB")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 ﻿import math
+import pickle
 from unittest import TestCase
 
 from Domain.Board.Direction import Direction
@@ -89,3 +90,23 @@ class PositionTest(TestCase):
         self.assertEqual(math.sqrt(8), Position(1, 1).distance_to(Position(3, 3)))
         self.assertEqual(math.sqrt(18), Position(1, 1).distance_to(Position(4, 4)))
         self.assertEqual(math.sqrt(13), Position(1, 1).distance_to(Position(3, 4)))
+
+    def test_integer_positions_are_interned(self):
+        self.assertIs(Position(1, 2), Position(1, 2))
+        self.assertIs(Position(1, 2), Position(1, 1).right)
+        self.assertIs(Position(1, 2), pickle.loads(pickle.dumps(Position(1, 2))))
+        self.assertEqual('(1.5, 2.0)', str(Position(1.5, 2.0)))
+
+    def test_position_is_immutable(self):
+        with self.assertRaises(TypeError):
+            Position(1, 2)[0] = 3
+        with self.assertRaises(AttributeError):
+            Position(1, 2).x = 3
+
+    def test_directions_are_singletons(self):
+        self.assertIs(Direction.up(), Direction('up'))
+        self.assertIs(Direction.up(), Direction(Direction.up()))
+        self.assertIs(Direction.up(), Direction.down().opposite)
+        self.assertIs(Direction.up(), pickle.loads(pickle.dumps(Direction.up())))
+        with self.assertRaises(ValueError):
+            Direction('diagonal')
@@ -1,6 +1,7 @@
 ﻿import unittest
 from unittest import TestCase
 
+from Domain.Board.GridSymmetry import GridSymmetry
 from Domain.Board.SlantGrid import SlantGrid
 from Domain.Puzzles.utils import positions
 
@@ -71,6 +72,15 @@ class GridTest(TestCase):
         self.assertEqual(2, len(loops))
         self.assertEqual(expected_loops, loops)
 
+    def test_transformed_flips_slants_when_orientation_is_reversed(self):
+        slant_grid = SlantGrid.from_slant_str(
+            '╲╲\n'
+            '╱·\n'
+        )
+        self.assertEqual('╱╱\n·╲\n', str(slant_grid.transformed(GridSymmetry(0, True))))
+        self.assertEqual('╲╱\n·╱\n', str(slant_grid.transformed(GridSymmetry(1))))
+        self.assertEqual('·╱\n╲╲\n', str(slant_grid.transformed(GridSymmetry(2))))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
-﻿from z3 import Solver, Bool, Not, unsat, And, is_true
+﻿from z3 import Solver, Bool, Not, Or, unsat, And, is_true
 
+from Domain.Board.BitGrid import BitGrid
 from Domain.Board.Grid import Grid
 from Domain.Puzzles.GameSolver import GameSolver
 
@@ -25,7 +26,7 @@ class BinairoSolver(GameSolver):
         return self._previous_solution
 
     def get_other_solution(self) -> Grid:
-        self._solver.add(Not(And([self._grid_z3[position] == value for position, value in self._previous_solution])))
+        self._solver.add(Or(BitGrid.from_grid(self._previous_solution).exclusion_literals((variable for row in self._grid_z3.matrix for variable in row), Not)))
         self._previous_solution = self._compute_solution()
         return self._previous_solution
 
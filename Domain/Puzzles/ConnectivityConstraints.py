@@ -0,0 +1,109 @@
+from typing import Iterable
+
+from ortools.sat.python.cp_model import CpModel, IntVar
+
+from Domain.Board.Position import Position
+
+
+class ConnectivityConstraints:
+    @staticmethod
+    def add_single_loop(model: CpModel, edges: dict[frozenset[Position], IntVar], visited: dict[Position, IntVar] | None = None, name: str = 'loop') -> dict[Position, IntVar]:
+        nodes = sorted({position for edge in edges for position in edge})
+        index = {position: i for i, position in enumerate(nodes)}
+        if visited is None:
+            visited = {position: model.NewBoolVar(f"{name}_visited_{position}") for position in nodes}
+        arcs = [(index[position], index[position], visited[position].Not()) for position in nodes]
+        for edge, edge_var in edges.items():
+            position0, position1 = sorted(edge)
+            forward = model.NewBoolVar(f"{name}_{position0}_{position1}")
+            backward = model.NewBoolVar(f"{name}_{position1}_{position0}")
+            model.Add(edge_var == forward + backward)
+            arcs.append((index[position0], index[position1], forward))
+            arcs.append((index[position1], index[position0], backward))
+        model.AddCircuit(arcs)
+        return visited
+
+    @staticmethod
+    def add_single_path(model: CpModel, edges: dict[frozenset[Position], IntVar], start: Position | None = None, end: Position | None = None, visited: dict[Position, IntVar] | None = None, name: str = 'path') -> dict[Position, IntVar]:
+        nodes = sorted({position for edge in edges for position in edge})
+        index = {position: i for i, position in enumerate(nodes)}
+        if visited is None:
+            visited = {position: model.NewBoolVar(f"{name}_visited_{position}") for position in nodes}
+        closing_node = len(nodes)
+        arcs = [(index[position], index[position], visited[position].Not()) for position in nodes]
+        for position in nodes:
+            is_start = model.NewBoolVar(f"{name}_start_{position}")
+            is_end = model.NewBoolVar(f"{name}_end_{position}")
+            if start is not None:
+                model.Add(is_start == (1 if position == start else 0))
+            if end is not None:
+                model.Add(is_end == (1 if position == end else 0))
+            arcs.append((closing_node, index[position], is_start))
+            arcs.append((index[position], closing_node, is_end))
+        for edge, edge_var in edges.items():
+            position0, position1 = sorted(edge)
+            forward = model.NewBoolVar(f"{name}_{position0}_{position1}")
+            backward = model.NewBoolVar(f"{name}_{position1}_{position0}")
+            model.Add(edge_var == forward + backward)
+            arcs.append((index[position0], index[position1], forward))
+            arcs.append((index[position1], index[position0], backward))
+        model.AddCircuit(arcs)
+        return visited
+
+    @staticmethod
+    def add_connected_cells_flow(model: CpModel, cells: dict[Position, IntVar], mode='orthogonal', name: str = 'flow'):
+        positions = sorted(cells)
+        max_flow = max(len(positions) - 1, 0)
+        roots = ConnectivityConstraints._add_first_active_roots(model, positions, cells, name)
+        inflows: dict[Position, list[IntVar]] = {position: [] for position in positions}
+        outflows: dict[Position, list[IntVar]] = {position: [] for position in positions}
+        for position in positions:
+            for neighbor in ConnectivityConstraints._neighbors(position, cells, mode):
+                flow = model.NewIntVar(0, max_flow, f"{name}_{position}_{neighbor}")
+                model.Add(flow == 0).OnlyEnforceIf(cells[position].Not())
+                model.Add(flow == 0).OnlyEnforceIf(cells[neighbor].Not())
+                model.Add(flow == 0).OnlyEnforceIf(roots[neighbor])
+                outflows[position].append(flow)
+                inflows[neighbor].append(flow)
+        for position in positions:
+            model.Add(sum(inflows[position]) - sum(outflows[position]) == cells[position]).OnlyEnforceIf(roots[position].Not())
+
+    @staticmethod
+    def add_connected_cells_distance(model: CpModel, cells: dict[Position, IntVar], mode='orthogonal', name: str = 'distance'):
+        positions = sorted(cells)
+        max_distance = max(len(positions) - 1, 0)
+        roots = ConnectivityConstraints._add_first_active_roots(model, positions, cells, name)
+        distances = {position: model.NewIntVar(0, max_distance, f"{name}_{position}") for position in positions}
+        for position in positions:
+            model.Add(distances[position] == 0).OnlyEnforceIf(roots[position])
+            parents = []
+            for neighbor in ConnectivityConstraints._neighbors(position, cells, mode):
+                parent = model.NewBoolVar(f"{name}_parent_{position}_{neighbor}")
+                model.AddImplication(parent, cells[neighbor])
+                model.Add(distances[position] == distances[neighbor] + 1).OnlyEnforceIf(parent)
+                parents.append(parent)
+            model.AddBoolOr(parents).OnlyEnforceIf([cells[position], roots[position].Not()])
+
+    @staticmethod
+    def _add_first_active_roots(model: CpModel, positions: list[Position], cells: dict[Position, IntVar], name: str) -> dict[Position, IntVar]:
+        roots = {}
+        any_active_before = None
+        for position in positions:
+            root = model.NewBoolVar(f"{name}_root_{position}")
+            if any_active_before is None:
+                model.Add(root == cells[position])
+                any_active_before = cells[position]
+            else:
+                model.AddBoolAnd([cells[position], any_active_before.Not()]).OnlyEnforceIf(root)
+                model.AddBoolOr([root, cells[position].Not(), any_active_before])
+                active = model.NewBoolVar(f"{name}_active_until_{position}")
+                model.AddBoolOr([any_active_before, cells[position]]).OnlyEnforceIf(active)
+                model.AddImplication(any_active_before, active)
+                model.AddImplication(cells[position], active)
+                any_active_before = active
+            roots[position] = root
+        return roots
+
+    @staticmethod
+    def _neighbors(position: Position, cells: dict[Position, IntVar], mode: str) -> Iterable[Position]:
+        return [neighbor for neighbor in position.neighbors(mode) if neighbor in cells]
@@ -23,6 +23,9 @@ class DetourSolver(GameSolver):
         self._previous_solution: IslandGrid | None = None
 
     def _init_island_grid(self):
+        if self._island_grid is not None:
+            self._island_grid = self._island_grid.with_reset_bridges()
+            return
         self._island_grid = IslandGrid(
             [[Island(Position(r, c), 2) for c in range(self._clues_grid.columns_number)] for r in range(self._clues_grid.rows_number)]
         )
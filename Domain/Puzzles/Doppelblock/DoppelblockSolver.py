@@ -18,6 +18,7 @@ class DoppelblockSolver(GameSolver):
         self._row_sums_clues = row_sums_clues
         self._column_sums_clues = column_sums_clues
         self._model = cp_model.CpModel()
+        self._solver = cp_model.CpSolver()
         self._grid_vars: Grid | None = None
         self._is_black_bools_rows: list[list[cp_model.IntVar]] | None = None
         self._is_black_bools_cols: list[list[cp_model.IntVar]] | None = None
@@ -49,7 +50,7 @@ class DoppelblockSolver(GameSolver):
         return self._compute_solution()
 
     def _compute_solution(self):
-        solver = cp_model.CpSolver()
+        solver = self._solver
         status = solver.Solve(self._model)
         if status not in (cp_model.FEASIBLE, cp_model.OPTIMAL):
             return Grid.empty()
@@ -17,6 +17,7 @@ class EverySecondTurnSolver(GameSolver):
         self._island_grid: IslandGrid | None = None
         self.init_island_grid()
         self._model = cp_model.CpModel()
+        self._solver = cp_model.CpSolver()
         self._island_bridges: dict[Position, dict[Direction, cp_model.BoolVar]] = {}
         self._previous_solution: IslandGrid | None = None
 
@@ -43,7 +44,7 @@ class EverySecondTurnSolver(GameSolver):
 
     def _ensure_all_islands_connected(self) -> tuple[IslandGrid, int]:
         proposition_count = 0
-        solver = cp_model.CpSolver()
+        solver = self._solver
         while solver.Solve(self._model) == cp_model.OPTIMAL:
             proposition_count += 1
             for position, direction_bridges in self._island_bridges.items():
@@ -19,6 +19,7 @@ class From1ToXSolver(GameSolver):
         if len(self._regions) < 2:
             raise ValueError("The grid must have at least 2 regions")
         self._model = cp_model.CpModel()
+        self._solver = cp_model.CpSolver()
         self._grid_vars: Grid | None = None
         self._previous_solution: Grid | None = None
 
@@ -48,7 +49,7 @@ class From1ToXSolver(GameSolver):
         return self._compute_solution()
 
     def _compute_solution(self) -> Grid:
-        solver = cp_model.CpSolver()
+        solver = self._solver
         status = solver.Solve(self._model)
         if status not in (cp_model.FEASIBLE, cp_model.OPTIMAL):
             return Grid.empty()
@@ -8,6 +8,7 @@ from Domain.Board.Island import Island
 from Domain.Board.IslandsGrid import IslandGrid
 from Domain.Board.Position import Position
 from Domain.Puzzles.GameSolver import GameSolver
+from Domain.Puzzles.LazyConstraintSolver import LazyConstraintSolver
 
 
 class HashiSolver(GameSolver):
@@ -19,8 +20,12 @@ class HashiSolver(GameSolver):
         self._solver = cp_model.CpSolver()
         self._island_bridges: Dict[Position, Dict[Direction, any]] = {}
         self._previous_solution: IslandGrid | None = None
+        self._lazy_solver = LazyConstraintSolver(self._model, self._solver)
 
     def init_island_grid(self):
+        if self._island_grid is not None:
+            self._island_grid = self._island_grid.with_reset_bridges()
+            return
         self._island_grid = IslandGrid([[Island(Position(r, c), self._input_grid[Position(r, c)]) if isinstance(self._input_grid[Position(r, c)], int) else None for c in range(self._input_grid.columns_number)] for r in range(self._input_grid.rows_number)])
 
     def _init_solver(self):
@@ -38,38 +43,34 @@ class HashiSolver(GameSolver):
         return solution
 
     def get_grid_when_shape_is_loop(self):
-        proposition_count = 0
-        status = self._solver.Solve(self._model)
+        solution = self._lazy_solver.solve(self._compute_solution, self._isolated_groups_cuts)
+        if solution is None:
+            return Grid.empty(), self._lazy_solver.iterations_count
+        return solution, self._lazy_solver.iterations_count
 
-        while status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
-            proposition_count += 1
-            self.init_island_grid()
-
-            for position, direction_bridges in self._island_bridges.items():
-                for direction, bridges_var in direction_bridges.items():
-                    bridges_number = self._solver.Value(bridges_var)
-                    if bridges_number > 0:
-                        self._island_grid[position].set_bridge_to_position(self._island_grid[position].direction_position_bridges[direction][0], bridges_number)
-
-            self._previous_solution = self._island_grid
-            connected_positions = self._island_grid.get_connected_positions()
-            if len(connected_positions) == 1:
-                return self._island_grid, proposition_count
-
-            exclusion_literals = []
-            for island in self._previous_solution.islands.values():
-                for direction, (_, value) in island.direction_position_bridges.items():
-                    temp_var = self._model.NewBoolVar(f"excl_{island.position}_{direction}")
-                    self._model.Add(self._island_bridges[island.position][direction] == value).OnlyEnforceIf(temp_var)
-                    self._model.Add(self._island_bridges[island.position][direction] != value).OnlyEnforceIf(temp_var.Not())
-                    exclusion_literals.append(temp_var)
-
-            if exclusion_literals:
-                self._model.AddBoolOr([lit.Not() for lit in exclusion_literals])
-
-            status = self._solver.Solve(self._model)
-
-        return Grid.empty(), proposition_count
+    def _compute_solution(self, solver: cp_model.CpSolver) -> IslandGrid:
+        self.init_island_grid()
+        for position, direction_bridges in self._island_bridges.items():
+            for direction, bridges_var in direction_bridges.items():
+                bridges_number = solver.Value(bridges_var)
+                if bridges_number > 0:
+                    self._island_grid[position].set_bridge_to_position(self._island_grid[position].direction_position_bridges[direction][0], bridges_number)
+        return self._island_grid
+
+    def _isolated_groups_cuts(self, island_grid: IslandGrid) -> list:
+        connected_positions = island_grid.get_connected_positions()
+        if len(connected_positions) == 1:
+            return []
+        cuts = []
+        for positions in connected_positions:
+            crossing_bridges = [
+                self._island_bridges[position][direction]
+                for position in positions
+                for direction, (other_position, _) in island_grid[position].direction_position_bridges.items()
+                if other_position not in positions
+            ]
+            cuts.append(LazyConstraintSolver.cut_set(crossing_bridges))
+        return cuts
 
     def get_other_solution(self):
         if self._previous_solution is None:
@@ -84,9 +85,8 @@ class HashiSolver(GameSolver):
                 exclusion_literals.append(temp_var)
 
         if exclusion_literals:
-            self._model.AddBoolOr([lit.Not() for lit in exclusion_literals])
+            self._lazy_solver.add_cut([lit.Not() for lit in exclusion_literals])
 
-        self.init_island_grid()
         return self.get_solution()
 
     def _add_constraints(self):
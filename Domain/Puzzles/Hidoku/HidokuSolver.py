@@ -13,6 +13,7 @@ class HidokuSolver(GameSolver):
         self._rows_number = self._grid.rows_number
         self._columns_number = self._grid.columns_number
         self._model = cp_model.CpModel()
+        self._solver = cp_model.CpSolver()
         self._grid_var = Grid.empty()
         self._previous_solution = Grid.empty()
         self.position_value_min = next((p for p, v in self._grid if v == 1), None)
@@ -26,7 +27,7 @@ class HidokuSolver(GameSolver):
         self._add_constraints()
 
     def get_solution(self) -> Grid:
-        solver = cp_model.CpSolver()
+        solver = self._solver
         status = solver.Solve(self._model)
 
         if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
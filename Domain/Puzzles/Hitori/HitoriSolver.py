@@ -1,5 +1,6 @@
 from ortools.sat.python import cp_model
 
+from Domain.Board.BitGrid import BitGrid
 from Domain.Board.Grid import Grid
 from Domain.Board.Position import Position
 from Domain.Puzzles.GameSolver import GameSolver
@@ -12,11 +13,13 @@ class HitoriSolver(GameSolver):
         self._solver = cp_model.CpSolver()
         self._model = cp_model.CpModel()
         self._grid_vars = None
+        self._grid_var_indexes = None
         self._previous_solution: Grid | None = None
 
     def _init_solver(self):
         self._model = cp_model.CpModel()
         self._grid_vars = Grid([[self._model.NewBoolVar(f"grid_{r}_{c}") for c in range(self._grid.columns_number)] for r in range(self._grid.rows_number)])
+        self._grid_var_indexes = [variable.Index() for _, variable in self._grid_vars]
         self._add_constraints()
 
     def get_solution(self) -> Grid:
@@ -36,22 +39,21 @@ class HitoriSolver(GameSolver):
         while True:
             status = self._solver.Solve(self._model)
             if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-                 boolean_grid = self._build_boolean_grid_from_solution()
-                 white_shapes = boolean_grid.get_all_shapes()
-                 if len(white_shapes) == 1:
-                      solution_grid = self._build_solution_grid(boolean_grid)
+                 white_cells = self._build_white_cells_from_solution()
+                 if white_cells.is_connected():
+                      solution_grid = self._build_solution_grid(white_cells)
                       self._previous_solution = solution_grid
                       return solution_grid
                  else:
-                      self._add_connectivity_constraints(white_shapes)
+                      self._add_connectivity_constraints(white_cells.shapes())
             else:
                  return Grid.empty()
 
-    def _build_boolean_grid_from_solution(self):
-        return Grid([[self._solver.BooleanValue(self._grid_vars[r][c]) for c in range(self._grid.columns_number)] for r in range(self._grid.rows_number)])
+    def _build_white_cells_from_solution(self) -> BitGrid:
+        return BitGrid.from_solver_values(self._grid.rows_number, self._grid.columns_number, self._solver.response_proto.solution, self._grid_var_indexes)
 
-    def _build_solution_grid(self, boolean_grid):
-        return Grid([[self._grid.value(r, c) if boolean_grid.value(r, c) else False for c in range(self._grid.columns_number)] for r in range(self._grid.rows_number)])
+    def _build_solution_grid(self, white_cells: BitGrid):
+        return Grid([[value if is_white else False for value, is_white in zip(row, white_row)] for row, white_row in zip(self._grid.matrix, white_cells.matrix)])
 
     def _add_connectivity_constraints(self, white_shapes: set[frozenset[Position]]):
 
@@ -31,7 +31,7 @@ class KanjoSolver(GameSolver):
             self._positions_by_clues[val].append(pos)
 
         self._model = None
-        self._solver = None
+        self._solver = cp_model.CpSolver()
         
         self._h_arcs = None
         self._v_arcs = None
@@ -53,7 +53,6 @@ class KanjoSolver(GameSolver):
         if self._model is None:
             self._init_model()
         
-        self._solver = cp_model.CpSolver()
         solution, _ = self._ensure_all_islands_grouped()
         return solution
 
@@ -7,6 +7,7 @@ from Domain.Board.Grid import Grid
 from Domain.Board.Island import Island
 from Domain.Board.IslandsGrid import IslandGrid
 from Domain.Board.Position import Position
+from Domain.Puzzles.ConnectivityConstraints import ConnectivityConstraints
 from Domain.Puzzles.GameSolver import GameSolver
 
 
@@ -120,6 +121,17 @@ class KoburinSolver(GameSolver):
         self._add_no_adjacent_black_constraint()
         self._add_opposite_bridges_constraints()
         self._add_bridges_sum_constraints()
+        self._add_single_loop_constraint()
+
+    def _add_single_loop_constraint(self):
+        edges = {
+            frozenset([position, position.after(direction)]): direction_bridges[direction]
+            for position, direction_bridges in self._island_bridges_z3.items()
+            for direction in [Direction.right(), Direction.down()]
+            if position.after(direction) in self._island_bridges_z3
+        }
+        visited = {position: black_cell.Not() for position, black_cell in self._black_cells_z3.items()}
+        ConnectivityConstraints.add_single_loop(self._model, edges, visited)
 
     def _add_initial_constraints(self):
         # Border constraints: no edges going outside the grid
@@ -0,0 +1,68 @@
+import time
+from typing import Callable, Iterable
+
+from ortools.sat.python import cp_model
+from ortools.sat.python.cp_model import CpModel, CpSolver, IntVar
+
+Cut = list[IntVar] | cp_model.BoundedLinearExpression
+
+
+class LazyConstraintSolver[S]:
+    def __init__(self, model: CpModel, solver: CpSolver | None = None):
+        self._model = model
+        self._solver = solver if solver is not None else CpSolver()
+        self.iterations_count = 0
+        self.iterations_durations: list[float] = []
+        self.cuts_count = 0
+
+    @property
+    def solver(self) -> CpSolver:
+        return self._solver
+
+    @property
+    def total_duration(self) -> float:
+        return sum(self.iterations_durations)
+
+    def solve(self, extract_solution: Callable[[CpSolver], S], find_cuts: Callable[[S], Iterable[Cut]]) -> S | None:
+        while True:
+            start_time = time.perf_counter()
+            status = self._solver.solve(self._model)
+            if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                self._end_iteration(start_time)
+                return None
+            solution = extract_solution(self._solver)
+            cuts = list(find_cuts(solution))
+            self._end_iteration(start_time)
+            if not cuts:
+                return solution
+            for cut in cuts:
+                self.add_cut(cut)
+            self._hint_from_last_response()
+
+    def add_cut(self, cut: Cut):
+        self.cuts_count += 1
+        if isinstance(cut, list):
+            self._model.add_bool_or(cut)
+            return
+        self._model.add(cut)
+
+    def _end_iteration(self, start_time: float):
+        self.iterations_count += 1
+        self.iterations_durations.append(time.perf_counter() - start_time)
+
+    def _hint_from_last_response(self):
+        self._model.clear_hints()
+        for index, value in enumerate(self._solver.response_proto.solution):
+            self._model.add_hint(self._model.get_int_var_from_proto_index(index), value)
+
+    @staticmethod
+    def region_cut(inside_literals: Iterable[IntVar], boundary_literals: Iterable[IntVar]) -> list[IntVar]:
+        return [literal.Not() for literal in inside_literals] + list(boundary_literals)
+
+    @staticmethod
+    def cut_set(crossing_vars: Iterable[IntVar]) -> cp_model.BoundedLinearExpression:
+        return sum(crossing_vars) >= 1
+
+    @staticmethod
+    def subtour_cut(inside_edges: list[IntVar], nodes_count: int) -> cp_model.BoundedLinearExpression:
+        return sum(inside_edges) <= nodes_count - 1
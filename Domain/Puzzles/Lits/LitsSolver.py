@@ -1,12 +1,16 @@
 import collections
 from typing import Iterable, Set
 
+import numpy as np
 from ortools.sat.python import cp_model
 
+from Domain.Board.ArrayGrid import ArrayGrid
 from Domain.Board.Direction import Direction
 from Domain.Board.Grid import Grid
 from Domain.Board.Position import Position
+from Domain.Puzzles.ConnectivityConstraints import ConnectivityConstraints
 from Domain.Puzzles.GameSolver import GameSolver
+from Domain.Puzzles.LazyConstraintSolver import LazyConstraintSolver
 from Domain.Puzzles.Lits.LitsGridBuilder import LitsGridBuilder
 from Domain.Puzzles.Lits.LitsType import LitsType
 from Utils.ShapeGenerator import ShapeGenerator
@@ -23,51 +27,50 @@ class LitsSolver(GameSolver):
         self.rows_number = self._grid.rows_number
         self.columns_number = self._grid.columns_number
         self._grid_vars: Grid | None = None
+        self._grid_var_indexes: np.ndarray | None = None
         self.previous_solution: Grid | None = None
         self._model = cp_model.CpModel()
+        self._solver = cp_model.CpSolver()
+        self._lazy_solver = LazyConstraintSolver(self._model, self._solver)
+        self._shaded_vars: dict[Position, cp_model.IntVar] = {}
 
     def get_solution(self) -> Grid:
-        max_value = max(LitsType, key=lambda x: x.value).value
-        self._grid_vars = Grid([[self._model.NewIntVar(0, max_value, f"grid_{r}_{c}") for c in range(self._grid.columns_number)] for r in range(self._grid.rows_number)])
-        self._add_constraints()
+        if self._grid_vars is None:
+            max_value = max(LitsType, key=lambda x: x.value).value
+            self._grid_vars = Grid([[self._model.NewIntVar(0, max_value, f"grid_{r}_{c}") for c in range(self._grid.columns_number)] for r in range(self._grid.rows_number)])
+            self._grid_var_indexes = np.array([[variable.Index() for variable in row] for row in self._grid_vars.matrix])
+            self._add_constraints()
+
+        solution = self._lazy_solver.solve(self._compute_solution, self._connectivity_cuts)
+        if solution is None:
+            return Grid.empty()
+        self.previous_solution = Grid(solution.matrix)
+        return self.previous_solution
+
+    def _compute_solution(self, solver: cp_model.CpSolver) -> ArrayGrid:
+        return ArrayGrid.from_solver_values(solver.response_proto.solution, self._grid_var_indexes)
+
+    def _connectivity_cuts(self, current_solution: ArrayGrid) -> list:
+        components_shapes = ArrayGrid(current_solution.array != self.empty).get_all_shapes()
+        components = [set(shape) for shape in components_shapes]
+        if len(components) <= 1:
+            return []
 
-        solver = cp_model.CpSolver()
-
-        while solver.Solve(self._model) in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
-            current_solution = Grid([[solver.Value(self._grid_vars.value(i, j)) for j in range(self.columns_number)] for i in range(self.rows_number)])
-
-            bool_matrix = [[1 if cell != 0 else 0 for cell in row] for row in current_solution.matrix]
-            bool_grid = Grid(bool_matrix)
-
-            components_shapes = bool_grid.get_all_shapes(1)
-            components = [set(shape) for shape in components_shapes]
-
-            if len(components) <= 1:
-                self.previous_solution = current_solution
-                return self.previous_solution
-
-            self._add_connectivity_constraints(components)
-
-        return Grid.empty()
-
-    def _add_connectivity_constraints(self, components):
         components.sort(key=len, reverse=True)
+        cuts = []
         for component in components[1:]:
-            literals = []
-            for position in component:
-                is_unshaded = self._model.NewBoolVar(f"conn_unshade_{position.r}_{position.c}")
-                self._model.Add(self._grid_vars[position] == 0).OnlyEnforceIf(is_unshaded)
-                self._model.Add(self._grid_vars[position] != 0).OnlyEnforceIf(is_unshaded.Not())
-                literals.append(is_unshaded)
-
-            neighbors = [p for p in ShapeGenerator.around_shape(component) if p in self._grid]
-            for position in neighbors:
-                is_shaded = self._model.NewBoolVar(f"conn_shade_{position.r}_{position.c}")
-                self._model.Add(self._grid_vars[position] != 0).OnlyEnforceIf(is_shaded)
-                self._model.Add(self._grid_vars[position] == 0).OnlyEnforceIf(is_shaded.Not())
-                literals.append(is_shaded)
-
-            self._model.AddBoolOr(literals)
+            inside_literals = [self._shaded_var(position) for position in component]
+            boundary_literals = [self._shaded_var(position) for position in ShapeGenerator.around_shape(component) if position in self._grid]
+            cuts.append(LazyConstraintSolver.region_cut(inside_literals, boundary_literals))
+        return cuts
+
+    def _shaded_var(self, position: Position):
+        if position not in self._shaded_vars:
+            is_shaded = self._model.NewBoolVar(f"shaded_{position.r}_{position.c}")
+            self._model.Add(self._grid_vars[position] != 0).OnlyEnforceIf(is_shaded)
+            self._model.Add(self._grid_vars[position] == 0).OnlyEnforceIf(is_shaded.Not())
+            self._shaded_vars[position] = is_shaded
+        return self._shaded_vars[position]
 
     def get_other_solution(self):
         if self.previous_solution is None:
@@ -82,7 +85,7 @@ class LitsSolver(GameSolver):
                 self._model.Add(self._grid_vars[Position(r, c)] == prev_val).OnlyEnforceIf(diff_var.Not())
                 bool_vars.append(diff_var)
 
-        self._model.AddBoolOr(bool_vars)
+        self._lazy_solver.add_cut(bool_vars)
 
         return self.get_solution()
 
@@ -91,6 +94,11 @@ class LitsSolver(GameSolver):
         self._add_regions_constraints()
         self._add_no_square_constraints()
         self._add_touching_constraints()
+        self._add_shaded_connectivity_constraint()
+
+    def _add_shaded_connectivity_constraint(self):
+        shaded = {position: self._shaded_var(position) for position, _ in self._grid}
+        ConnectivityConstraints.add_connected_cells_flow(self._model, shaded)
 
     def _add_count_in_regions_constraints(self):
         for region in self._regions.values():
@@ -14,6 +14,7 @@ class LookAirSolver(GameSolver):
         self._columns_number = self._grid.columns_number
         self._grid_vars: Grid | None = None
         self._model = cp_model.CpModel()
+        self._solver = cp_model.CpSolver()
         self._previous_solution: Grid | None = None
 
     def _init_solver(self):
@@ -65,7 +66,7 @@ class LookAirSolver(GameSolver):
         return solution
 
     def _compute_solution(self) -> Grid:
-        solver = cp_model.CpSolver()
+        solver = self._solver
         status = solver.Solve(self._model)
         if status not in (cp_model.FEASIBLE, cp_model.OPTIMAL):
             return Grid.empty()
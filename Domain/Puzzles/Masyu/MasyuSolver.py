@@ -1,13 +1,13 @@
-﻿from ortools.sat.cp_model_pb2 import CpSolverStatus
-from ortools.sat.python import cp_model
-from ortools.sat.python.cp_model import IntVar, CpModel, CpSolver
+﻿from ortools.sat.python.cp_model import IntVar, CpModel, CpSolver
 
 from Domain.Board.Direction import Direction
 from Domain.Board.Grid import Grid
 from Domain.Board.Island import Island
 from Domain.Board.IslandsGrid import IslandGrid
 from Domain.Board.Position import Position
+from Domain.Puzzles.ConnectivityConstraints import ConnectivityConstraints
 from Domain.Puzzles.GameSolver import GameSolver
+from Domain.Puzzles.LazyConstraintSolver import LazyConstraintSolver
 
 
 class MasyuSolver(GameSolver):
@@ -20,22 +20,22 @@ class MasyuSolver(GameSolver):
         self._initialized = False
         self._island_bridges_z3: dict[Position, dict[Direction, IntVar]] = {}
         self._previous_solution: IslandGrid | None = None
+        self._dots_positions = {position for position, value in grid if value in ('w', 'b')}
+        self._lazy_solver = LazyConstraintSolver(self._model, self._solver)
 
     def init_island_grid(self):
+        if self._island_grid is not None:
+            self._island_grid = self._island_grid.with_reset_bridges()
+            return
         self._island_grid = IslandGrid([[Island(Position(r, c), 2) for c in range(self.input_grid.columns_number)] for r in range(self.input_grid.rows_number)])
 
     def _init_solver(self):
-        self._model = cp_model.CpModel()
         self._island_bridges_z3 = {
             island.position: {direction: self._model.NewBoolVar(f"{island.position}_{direction}") for direction in Direction.orthogonal_directions()} for island in self._island_grid.islands.values()
         }
         self._add_constraints()
         self._initialized = True
 
-    @staticmethod
-    def _is_feasible(status: CpSolverStatus) -> bool:
-        return status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
-
     def get_solution(self) -> IslandGrid:
         if not self._initialized:
             self._init_solver()
@@ -44,36 +44,37 @@ class MasyuSolver(GameSolver):
         return solution
 
     def _ensure_all_islands_connected(self) -> tuple[IslandGrid, int]:
-        proposition_count = 0
-        while self._is_feasible(self._solver.Solve(self._model)):
-            proposition_count += 1
-            for position, direction_bridges in self._island_bridges_z3.items():
-                for direction, var in direction_bridges.items():
-                    if position.after(direction) not in self._island_bridges_z3:
-                        continue
-                    bridges_number = self._solver.Value(var)
-                    if bridges_number > 0:
-                        self._island_grid[position].set_bridge_to_position(self._island_grid[position].direction_position_bridges[direction][0], bridges_number)
-                    elif position in self._island_grid and direction in self._island_grid[position].direction_position_bridges:
-                        self._island_grid[position].direction_position_bridges.pop(direction)
-                self._island_grid[position].set_bridges_count_according_to_directions_bridges()
-            connected_positions = self._island_grid.get_connected_positions(exclude_without_bridge=True)
-            if len(connected_positions) == 1:
-                self._previous_solution = self._island_grid
-                return self._island_grid, proposition_count
-
-            # Block this exact set of active edges for each detected loop
-            for positions in connected_positions:
-                literals = []
-                for position in positions:
-                    for direction, (_, value) in self._island_grid[position].direction_position_bridges.items():
-                        if value == 1:
-                            literals.append(self._island_bridges_z3[position][direction])
-                if literals:
-                    self._model.AddBoolOr([lit.Not() for lit in literals])
-            self.init_island_grid()
-
-        return IslandGrid.empty(), proposition_count
+        solution = self._lazy_solver.solve(self._compute_solution, self._subtours_cuts)
+        if solution is None:
+            return IslandGrid.empty(), self._lazy_solver.iterations_count
+        self._previous_solution = solution
+        return solution, self._lazy_solver.iterations_count
+
+    def _compute_solution(self, solver: CpSolver) -> IslandGrid:
+        self.init_island_grid()
+        for position, direction_bridges in self._island_bridges_z3.items():
+            for direction, var in direction_bridges.items():
+                if position.after(direction) not in self._island_bridges_z3:
+                    continue
+                bridges_number = solver.Value(var)
+                if bridges_number > 0:
+                    self._island_grid[position].set_bridge_to_position(self._island_grid[position].direction_position_bridges[direction][0], bridges_number)
+                elif position in self._island_grid and direction in self._island_grid[position].direction_position_bridges:
+                    self._island_grid[position].direction_position_bridges.pop(direction)
+            self._island_grid[position].set_bridges_count_according_to_directions_bridges()
+        return self._island_grid
+
+    def _subtours_cuts(self, island_grid: IslandGrid) -> list:
+        connected_positions = island_grid.get_connected_positions(exclude_without_bridge=True)
+        if len(connected_positions) <= 1:
+            return []
+        # a loop covering only some of the dots can never be the solution, whatever its exact shape
+        cuts = [self._subtour_cut(positions) for positions in connected_positions if not self._dots_positions <= positions]
+        return cuts if cuts else [self._subtour_cut(positions) for positions in connected_positions[1:]]
+
+    def _subtour_cut(self, positions: set[Position]):
+        inside_edges = [self._island_bridges_z3[position][direction] for position in positions for direction in [Direction.right(), Direction.down()] if position.after(direction) in positions]
+        return LazyConstraintSolver.subtour_cut(inside_edges, len(positions))
 
     def get_other_solution(self):
         literals = []
@@ -82,15 +83,24 @@ class MasyuSolver(GameSolver):
                 if value == 1:
                     literals.append(self._island_bridges_z3[island.position][direction])
         if literals:
-            self._model.AddBoolOr([lit.Not() for lit in literals])
+            self._lazy_solver.add_cut([lit.Not() for lit in literals])
 
-        self.init_island_grid()
         return self.get_solution()
 
     def _add_constraints(self):
         self._add_opposite_bridges_constraints()
         self._add_bridges_sum_constraints()
         self._add_dots_constraints()
+        self._add_single_loop_constraint()
+
+    def _add_single_loop_constraint(self):
+        edges = {
+            frozenset([position, position.after(direction)]): direction_bridges[direction]
+            for position, direction_bridges in self._island_bridges_z3.items()
+            for direction in [Direction.right(), Direction.down()]
+            if position.after(direction) in self._island_bridges_z3
+        }
+        ConnectivityConstraints.add_single_loop(self._model, edges)
 
     def _add_opposite_bridges_constraints(self):
         for island in self._island_grid.islands.values():
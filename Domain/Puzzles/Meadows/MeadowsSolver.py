@@ -13,6 +13,7 @@ class MeadowsSolver(GameSolver):
         self._rows_number = self._grid.rows_number
         self._columns_number = self._grid.columns_number
         self._model = cp_model.CpModel()
+        self._solver = cp_model.CpSolver()
         self._vars: Grid | None = None
         self._previous_solution: Grid | None = None
 
@@ -43,7 +44,7 @@ class MeadowsSolver(GameSolver):
         if self._vars is None:
             return Grid.empty()
 
-        solver = cp_model.CpSolver()
+        solver = self._solver
         status = solver.Solve(self._model)
         if status not in (cp_model.FEASIBLE, cp_model.OPTIMAL):
             return Grid.empty()
@@ -81,7 +82,7 @@ class MeadowsSolver(GameSolver):
         # Not all equal
         self._model.Add(sum(eq_bools) <= self._rows_number * self._columns_number - 1)
 
-        solver = cp_model.CpSolver()
+        solver = self._solver
         status = solver.Solve(self._model)
         if status not in (cp_model.FEASIBLE, cp_model.OPTIMAL):
             return Grid.empty()
@@ -1,5 +1,6 @@
-﻿from z3 import Solver, Bool, Not, And, unsat, is_true
+﻿from z3 import Solver, Bool, Not, Or, unsat, is_true
 
+from Domain.Board.BitGrid import BitGrid
 from Domain.Board.Grid import Grid
 from Domain.Puzzles.GameSolver import GameSolver
 
@@ -22,7 +23,7 @@ class MinesweeperSolver(GameSolver):
         return self._previous_solution
 
     def get_other_solution(self) -> Grid:
-        self._solver.add(Not(And([self._grid_z3[position] == value for position, value in self._previous_solution])))
+        self._solver.add(Or(BitGrid.from_grid(self._previous_solution).exclusion_literals((variable for row in self._grid_z3.matrix for variable in row), Not)))
         self._previous_solution = self._compute_solution()
         return self._previous_solution
 
@@ -35,6 +35,9 @@ class MintonetteSolver(GameSolver):
         self._previous_solution: IslandGrid
 
     def _init_island_grid(self):
+        if self._island_grid is not None:
+            self._island_grid = self._island_grid.with_reset_bridges()
+            return
         self._island_grid = IslandGrid([[Island(Position(r, c), 2) for c in range(self._columns_number)] for r in range(self._rows_number)])
 
     def _init_solver(self):
@@ -1,5 +1,6 @@
 ﻿from ortools.sat.python.cp_model import CpModel, CpSolver, INFEASIBLE
 
+from Domain.Board.BitGrid import BitGrid
 from Domain.Board.Grid import Grid
 from Domain.Puzzles.GameSolver import GameSolver
 
@@ -15,7 +16,6 @@ class No4InARowSolver(GameSolver):
         self._solver = CpSolver()
         self._grid_ortools = None
         self._previous_solution = None
-        self._blocked_solutions = []
 
     def get_solution(self) -> Grid:
         self._grid_ortools = {}
@@ -30,18 +30,8 @@ class No4InARowSolver(GameSolver):
 
     def get_other_solution(self) -> Grid:
         if self._previous_solution and not self._previous_solution.is_empty():
-            solution_as_list = []
-            for r in range(self.rows_number):
-                for c in range(self.columns_number):
-                    if self._previous_solution.value(r, c) == 1:
-                        solution_as_list.append(self._grid_ortools[(r, c)])
-                    else:
-                        solution_as_list.append(self._model.NewBoolVar("not_" + str(len(self._blocked_solutions))))
-                        self._model.AddBoolAnd([solution_as_list[-1]]).OnlyEnforceIf(self._grid_ortools[(r, c)].Not())
-                        self._model.AddBoolAnd([solution_as_list[-1].Not()]).OnlyEnforceIf(self._grid_ortools[(r, c)])
-
-            self._model.AddBoolOr([var.Not() for var in solution_as_list])
-            self._blocked_solutions.append(solution_as_list)
+            previous_bits = BitGrid.from_grid(self._previous_solution)
+            self._model.AddBoolOr(previous_bits.exclusion_literals(self._grid_ortools.values(), lambda variable: variable.Not()))
 
         self._previous_solution = self._compute_solution()
         return self._previous_solution
@@ -52,15 +42,8 @@ class No4InARowSolver(GameSolver):
         if status == INFEASIBLE:
             return Grid.empty()
 
-        grid_values = []
-        for r in range(self.rows_number):
-            row_values = []
-            for c in range(self.columns_number):
-                value = self._solver.BooleanValue(self._grid_ortools[(r, c)])
-                row_values.append(value)
-            grid_values.append(row_values)
-
-        return Grid(grid_values)
+        solution = self._solver.response_proto.solution
+        return BitGrid.from_solver_values(self.rows_number, self.columns_number, solution, [variable.Index() for variable in self._grid_ortools.values()]).to_grid()
 
     def _add_constraints(self):
         self._add_initial_constraints()
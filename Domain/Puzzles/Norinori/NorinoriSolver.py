@@ -1,5 +1,6 @@
 from ortools.sat.python import cp_model
 
+from Domain.Board.BitGrid import BitGrid
 from Domain.Board.Grid import Grid
 from Domain.Board.Position import Position
 from Domain.Puzzles.GameSolver import GameSolver
@@ -26,11 +27,14 @@ class NorinoriSolver(GameSolver):
         self._model = None
         self._solver = cp_model.CpSolver()
         self._grid_vars = None
+        self._grid_var_indexes = None
+        self._previous_solution: BitGrid | None = None
         self._status = None
 
     def _init_model(self):
         self._model = cp_model.CpModel()
         self._grid_vars = [[self._model.NewBoolVar(f"grid_{r}_{c}") for c in range(self.columns_number)] for r in range(self.rows_number)]
+        self._grid_var_indexes = [variable.Index() for row in self._grid_vars for variable in row]
         self._add_constraints()
 
     def get_solution(self) -> Grid:
@@ -48,15 +52,7 @@ class NorinoriSolver(GameSolver):
         if self._status not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
             return self.get_solution()
 
-        current_vars = []
-        for r in range(self.rows_number):
-            for c in range(self.columns_number):
-                var = self._grid_vars[r][c]
-                if self._solver.BooleanValue(var):
-                    current_vars.append(var.Not())
-                else:
-                    current_vars.append(var)
-        self._model.AddBoolOr(current_vars)
+        self._model.AddBoolOr(self._previous_solution.exclusion_literals((variable for row in self._grid_vars for variable in row), lambda variable: variable.Not()))
 
         self._status = self._solver.Solve(self._model)
 
@@ -66,8 +62,8 @@ class NorinoriSolver(GameSolver):
         return self._compute_solution()
 
     def _compute_solution(self) -> Grid:
-        grid = Grid([[1 if self._solver.Value(self._grid_vars[i][j]) else 0 for j in range(self.columns_number)] for i in range(self.rows_number)])
-        return grid
+        self._previous_solution = BitGrid.from_solver_values(self.rows_number, self.columns_number, self._solver.response_proto.solution, self._grid_var_indexes)
+        return self._previous_solution.to_grid(1, 0)
 
     def queen(self, position):
         return self._grid_vars[position.r][position.c]
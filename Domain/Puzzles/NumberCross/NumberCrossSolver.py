@@ -20,6 +20,7 @@ class NumberCrossSolver(GameSolver):
         self._row_sums_clues = row_sums_clues
         self._column_sums_clues = column_sums_clues
         self._model = cp_model.CpModel()
+        self._solver = cp_model.CpSolver()
         self._grid_vars: Grid | None = None
         self._previous_solution: Grid | None = None
 
@@ -49,7 +50,7 @@ class NumberCrossSolver(GameSolver):
         return self._previous_solution
 
     def _compute_solution(self) -> Grid:
-        solver = cp_model.CpSolver()
+        solver = self._solver
         status = solver.Solve(self._model)
         if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
             return Grid.empty()
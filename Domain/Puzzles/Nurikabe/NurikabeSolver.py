@@ -1,6 +1,12 @@
+import numpy as np
 from ortools.sat.python import cp_model
+
+from Domain.Board.ArrayGrid import ArrayGrid
 from Domain.Board.Grid import Grid
+from Domain.Board.Position import Position
+from Domain.Puzzles.ConnectivityConstraints import ConnectivityConstraints
 from Domain.Puzzles.GameSolver import GameSolver
+from Domain.Puzzles.LazyConstraintSolver import LazyConstraintSolver
 
 
 class NurikabeSolver(GameSolver):
@@ -24,11 +30,13 @@ class NurikabeSolver(GameSolver):
         self._model = cp_model.CpModel()
         self._solver = cp_model.CpSolver()
         self._solver.parameters.max_time_in_seconds = 30.0
+        self._lazy_solver = LazyConstraintSolver(self._model, self._solver)
 
         self._is_white = {}
         self._island_id = {}
         self._dist = {}
         self._init_vars()
+        self._is_white_indexes = np.array([[self._is_white[r, c].Index() for c in range(self.cols)] for r in range(self.rows)])
         self._add_constraints()
         self._previous_solution = None
 
@@ -47,6 +55,11 @@ class NurikabeSolver(GameSolver):
         self._add_seed_constraints()
         self._add_adjacency_constraints()
         self._add_no_2x2_river_constraint()
+        self._add_river_connectivity_constraint()
+
+    def _add_river_connectivity_constraint(self):
+        rivers = {Position(r, c): self._is_white[r, c].Not() for r in range(self.rows) for c in range(self.cols)}
+        ConnectivityConstraints.add_connected_cells_distance(self._model, rivers)
 
     def _add_white_island_constraints(self):
         for r in range(self.rows):
@@ -136,25 +149,24 @@ class NurikabeSolver(GameSolver):
         self._model.AddBoolOr([b.Not() for b in match_bools])
 
     def _solve_and_check_river_connectivity(self) -> Grid:
-        while True:
-            status = self._solver.Solve(self._model)
-            if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-                sol_rows = []
-                for r in range(self.rows):
-                    row = []
-                    for c in range(self.cols):
-                        if self._solver.BooleanValue(self._is_white[r, c]):
-                            row.append(self.island)
-                        else:
-                            row.append(self.river)
-                    sol_rows.append(row)
-
-                solution = Grid(sol_rows)
-
-                if solution.are_cells_connected(self.river) or not any(self.river in row for row in sol_rows):
-                    self._previous_solution = solution
-                    return solution
-                else:
-                    self._exclude_solution(solution)
-            else:
-                return Grid.empty()
+        solution = self._lazy_solver.solve(self._compute_solution, self._river_connectivity_cuts)
+        if solution is None:
+            return Grid.empty()
+        self._previous_solution = Grid(solution.matrix)
+        return self._previous_solution
+
+    def _compute_solution(self, solver: cp_model.CpSolver) -> ArrayGrid:
+        is_white = ArrayGrid.from_solver_values(solver.response_proto.solution, self._is_white_indexes, dtype=bool)
+        return ArrayGrid(np.where(is_white.array, self.island, self.river))
+
+    def _river_connectivity_cuts(self, solution: ArrayGrid) -> list[list]:
+        river_shapes = solution.get_all_shapes(self.river)
+        if len(river_shapes) <= 1:
+            return []
+        cuts = []
+        for river_shape in river_shapes:
+            boundary = {neighbor for position in river_shape for neighbor in solution.neighbors_positions(position)} - river_shape
+            inside_literals = [self._is_white[position.r, position.c].Not() for position in river_shape]
+            boundary_literals = [self._is_white[position.r, position.c].Not() for position in boundary]
+            cuts.append(LazyConstraintSolver.region_cut(inside_literals, boundary_literals))
+        return cuts
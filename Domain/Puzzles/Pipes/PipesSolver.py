@@ -6,6 +6,7 @@ from Domain.Board.Pipe import Pipe
 from Domain.Board.PipesGrid import PipesGrid
 from Domain.Board.Position import Position
 from Domain.Puzzles.GameSolver import GameSolver
+from Domain.Puzzles.LazyConstraintSolver import LazyConstraintSolver
 from Domain.Puzzles.Pipes.PipeShapeTransition import PipeShapeTransition
 
 
@@ -18,6 +19,7 @@ class PipesSolver(GameSolver):
         self._solver = cp_model.CpSolver()
         self._grid_vars: GridBase | None = None
         self._previous_solution: GridBase[Pipe] | None = None
+        self._lazy_solver = LazyConstraintSolver(self._model, self._solver)
 
     def _init_solver(self):
         self._grid_vars = GridBase([
@@ -43,73 +45,52 @@ class PipesSolver(GameSolver):
         return solution
 
     def get_solution_when_all_pipes_connected(self):
-        proposition_count = 0
-        status = self._solver.Solve(self._model)
-
-        while status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
-            proposition_count += 1
-            current_grid = PipesGrid([[
-                self._create_pipe_from_model(Position(r, c))
-                for c in range(self._columns_number)]
-                for r in range(self._rows_number)])
-
-            connected_positions, is_loop = current_grid.get_connected_positions_and_is_loop()
-            if len(connected_positions) == 1 and not is_loop:
-                self._previous_solution = current_grid
-                transition_grid = GridBase([[
-                    PipeShapeTransition(self._input_grid[Position(r, c)], current_grid[Position(r, c)])
-                    for c in range(self._columns_number)]
-                    for r in range(self._rows_number)])
-                return transition_grid, proposition_count
-
-            if len(connected_positions) > 1:
-                max_connected_positions = max(connected_positions, key=len)
-                connected_positions = [position for positions in connected_positions if positions != max_connected_positions for position in positions]
-
-            # Add constraints to exclude this solution
-            exclusion_literals = []
-            for position in connected_positions:
-                connected_to = current_grid[position].get_connected_to()
-                for direction, is_connected in [
-                    (Direction.up(), Direction.up() in connected_to),
-                    (Direction.down(), Direction.down() in connected_to),
-                    (Direction.left(), Direction.left() in connected_to),
-                    (Direction.right(), Direction.right() in connected_to)
-                ]:
-                    temp_var = self._model.NewBoolVar(f"excl_{position}_{direction}")
-                    self._model.Add(self._grid_vars[position][direction] == is_connected).OnlyEnforceIf(temp_var)
-                    self._model.Add(self._grid_vars[position][direction] != is_connected).OnlyEnforceIf(temp_var.Not())
-                    exclusion_literals.append(temp_var)
-
-            if exclusion_literals:
-                self._model.AddBoolOr([lit.Not() for lit in exclusion_literals])
-
-            status = self._solver.Solve(self._model)
-
-        return GridBase.empty(), proposition_count
+        current_grid = self._lazy_solver.solve(self._compute_pipes_grid, self._disconnected_pipes_cuts)
+        if current_grid is None:
+            return GridBase.empty(), self._lazy_solver.iterations_count
+
+        self._previous_solution = current_grid
+        transition_grid = GridBase([[
+            PipeShapeTransition(self._input_grid[Position(r, c)], current_grid[Position(r, c)])
+            for c in range(self._columns_number)]
+            for r in range(self._rows_number)])
+        return transition_grid, self._lazy_solver.iterations_count
+
+    def _compute_pipes_grid(self, solver: cp_model.CpSolver) -> PipesGrid:
+        return PipesGrid([[self._create_pipe_from_model(solver, Position(r, c)) for c in range(self._columns_number)] for r in range(self._rows_number)])
+
+    def _disconnected_pipes_cuts(self, current_grid: PipesGrid) -> list:
+        connected_positions, is_loop = current_grid.get_connected_positions_and_is_loop()
+        if len(connected_positions) == 1:
+            return [self._exclusion_literals(current_grid)] if is_loop else []
+
+        # every group of pipes must be linked to the rest of the grid through at least one of its boundary edges
+        cuts = []
+        for positions in connected_positions:
+            crossing_edges = [
+                self._grid_vars[position][direction]
+                for position in positions
+                for direction in Direction.orthogonal_directions()
+                if position.after(direction) in current_grid and position.after(direction) not in positions
+            ]
+            cuts.append(LazyConstraintSolver.cut_set(crossing_edges))
+        return cuts
 
     def get_other_solution(self):
         if self._previous_solution is None:
             return self.get_solution()
 
+        self._lazy_solver.add_cut(self._exclusion_literals(self._previous_solution))
+        return self.get_solution()
+
+    def _exclusion_literals(self, pipes_grid: PipesGrid) -> list:
         exclusion_literals = []
-        for position, pipe in self._previous_solution:
+        for position, pipe in pipes_grid:
             connected_to = pipe.get_connected_to()
-            for direction, is_connected in [
-                (Direction.up(), Direction.up() in connected_to),
-                (Direction.down(), Direction.down() in connected_to),
-                (Direction.left(), Direction.left() in connected_to),
-                (Direction.right(), Direction.right() in connected_to)
-            ]:
-                temp_var = self._model.NewBoolVar(f"prev_{position}_{direction}")
-                self._model.Add(self._grid_vars[position][direction] == is_connected).OnlyEnforceIf(temp_var)
-                self._model.Add(self._grid_vars[position][direction] != is_connected).OnlyEnforceIf(temp_var.Not())
-                exclusion_literals.append(temp_var)
-
-        if exclusion_literals:
-            self._model.AddBoolOr([lit.Not() for lit in exclusion_literals])
-
-        return self.get_solution()
+            for direction in Direction.orthogonal_directions():
+                variable = self._grid_vars[position][direction]
+                exclusion_literals.append(variable.Not() if direction in connected_to else variable)
+        return exclusion_literals
 
     def _add_constraints(self):
         self._add_possible_rotations_constraints()
@@ -276,14 +257,14 @@ class PipesSolver(GameSolver):
             if position_right is not None:
                 self._model.Add(self._grid_vars[position][Direction.right()] == self._grid_vars[position_right][Direction.left()])
 
-    def _create_pipe_from_model(self, position: Position):
+    def _create_pipe_from_model(self, solver: cp_model.CpSolver, position: Position):
         directions = []
-        if self._solver.Value(self._grid_vars[position][Direction.up()]):
+        if solver.Value(self._grid_vars[position][Direction.up()]):
             directions.append(Direction.up())
-        if self._solver.Value(self._grid_vars[position][Direction.left()]):
+        if solver.Value(self._grid_vars[position][Direction.left()]):
             directions.append(Direction.left())
-        if self._solver.Value(self._grid_vars[position][Direction.down()]):
+        if solver.Value(self._grid_vars[position][Direction.down()]):
             directions.append(Direction.down())
-        if self._solver.Value(self._grid_vars[position][Direction.right()]):
+        if solver.Value(self._grid_vars[position][Direction.right()]):
             directions.append(Direction.right())
         return Pipe.from_connection(frozenset(directions))
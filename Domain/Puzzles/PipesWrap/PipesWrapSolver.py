@@ -39,7 +39,7 @@ class PipesWrapSolver(PipesSolver):
         while status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
             proposition_count += 1
             current_grid = WrappedPipesGrid([[
-                self._create_pipe_from_model(Position(r, c))
+                self._create_pipe_from_model(self._solver, Position(r, c))
                 for c in range(self._columns_number)]
                 for r in range(self._rows_number)])
 
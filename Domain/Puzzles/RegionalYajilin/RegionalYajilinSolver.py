@@ -18,6 +18,7 @@ class RegionalYajilinSolver(GameSolver):
         self._island_grid: IslandGrid | None = None
         self._init_island_grid()
         self._model = cp_model.CpModel()
+        self._solver = cp_model.CpSolver()
         self._island_bridges_vars: Dict[Position, Dict[Direction, cp_model.IntVar]] = {}
         self._black_cells_vars: Dict[Position, cp_model.IntVar] = {}
         self._previous_solution: IslandGrid | None = None
@@ -48,7 +49,7 @@ class RegionalYajilinSolver(GameSolver):
 
     def _ensure_all_islands_connected(self) -> tuple[IslandGrid, int]:
         proposition_count = 0
-        solver = cp_model.CpSolver()
+        solver = self._solver
 
         while True:
             status = solver.Solve(self._model)
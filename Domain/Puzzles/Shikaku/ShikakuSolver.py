@@ -15,6 +15,7 @@ class ShikakuSolver(GameSolver):
         if numbers_sum != self.rows_number * self.columns_number:
             raise ValueError("Sum of numbers must be equal to the number of cells")
         self._model = cp_model.CpModel()
+        self._solver = cp_model.CpSolver()
         self._matrix_vars = None
         self._position_number_by_rectangle_index = self._get_position_number_by_rectangle_index()
         self._previous_solution: Grid | None = None
@@ -31,7 +32,7 @@ class ShikakuSolver(GameSolver):
                              for r in range(self.rows_number)]
         self._add_constraints()
 
-        solver = cp_model.CpSolver()
+        solver = self._solver
         status = solver.Solve(self._model)
 
         if status not in (cp_model.FEASIBLE, cp_model.OPTIMAL):
@@ -56,7 +57,7 @@ class ShikakuSolver(GameSolver):
                 literals.append(self._matrix_vars[r][c] != prev_val)
         self._model.AddBoolOr(literals)
 
-        solver = cp_model.CpSolver()
+        solver = self._solver
         status = solver.Solve(self._model)
 
         if status not in (cp_model.FEASIBLE, cp_model.OPTIMAL):
@@ -26,6 +26,7 @@ class SudokuBaseSolver(GameSolver):
             raise ValueError("initial numbers must be between 1 and n x n")
         self._grid_vars = None
         self._model = cp_model.CpModel()
+        self._solver = cp_model.CpSolver()
         self._previous_solution: Grid | None = None
 
     def _init_sub_squares(self):
@@ -46,7 +47,7 @@ class SudokuBaseSolver(GameSolver):
         self._add_constraints()
         self._add_specific_constraints()
 
-        solver = cp_model.CpSolver()
+        solver = self._solver
         status = solver.Solve(self._model)
 
         if status not in (cp_model.FEASIBLE, cp_model.OPTIMAL):
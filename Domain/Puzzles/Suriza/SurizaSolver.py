@@ -5,6 +5,7 @@ from Domain.Board.Grid import Grid
 from Domain.Board.Island import Island
 from Domain.Board.IslandsGrid import IslandGrid
 from Domain.Board.Position import Position
+from Domain.Puzzles.ConnectivityConstraints import ConnectivityConstraints
 from Domain.Puzzles.GameSolver import GameSolver
 
 
@@ -88,6 +89,16 @@ class SurizaSolver(GameSolver):
         self._add_opposite_bridges_constraints()
         self._add_bridges_sum_constraints()
         self._add_numbers_constraints()
+        self._add_single_loop_constraint()
+
+    def _add_single_loop_constraint(self):
+        edges = {
+            frozenset([position, position.after(direction)]): direction_bridges[direction]
+            for position, direction_bridges in self._island_bridges.items()
+            for direction in [Direction.right(), Direction.down()]
+            if position.after(direction) in self._island_bridges
+        }
+        ConnectivityConstraints.add_single_loop(self._model, edges)
 
     def _add_initial_constraints(self):
         for col in range(self._island_grid.columns_number):
@@ -1,5 +1,7 @@
+import numpy as np
 from z3 import Solver, Bool, Not, And, Or, is_true, sat
 
+from Domain.Board.ArrayGrid import ArrayGrid
 from Domain.Board.Grid import Grid
 from Domain.Board.Position import Position
 from Domain.Puzzles.GameSolver import GameSolver
@@ -110,8 +112,8 @@ class TapaSolver(GameSolver):
         while self._solver.check() == sat:
             model = self._solver.model()
             proposition_count += 1
-            current_grid = Grid([[is_true(model.eval(self._grid_z3[Position(i, j)])) for j in range(self._grid_z3.columns_number)] for i in
-                                 range(self._grid_z3.rows_number)])
+            current_grid = ArrayGrid(np.array([[is_true(model.eval(self._grid_z3[Position(i, j)])) for j in range(self._grid_z3.columns_number)] for i in
+                                               range(self._grid_z3.rows_number)], dtype=bool))
             black_shapes = current_grid.get_all_shapes()
             if len(black_shapes) == 1:
                 return TapaSolver.crop_grid(current_grid), proposition_count
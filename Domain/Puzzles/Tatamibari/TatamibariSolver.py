@@ -13,6 +13,7 @@ class TatamibariSolver(GameSolver):
         self._rows_number = grid.rows_number
         self._columns_number = grid.columns_number
         self._model = cp_model.CpModel()
+        self._solver = cp_model.CpSolver()
         self._grid_vars: Grid | None = None
         self._previous_solution: Grid | None = None
         self._symbol_by_position: dict | None = self._compute_symbol_region_ids()
@@ -60,7 +61,7 @@ class TatamibariSolver(GameSolver):
         self._add_constraints()
 
     def _compute_solution(self) -> Grid:
-        solver = cp_model.CpSolver()
+        solver = self._solver
         status = solver.Solve(self._model)
         if status in (cp_model.FEASIBLE, cp_model.OPTIMAL):
             solution = Grid([[solver.Value(self._grid_vars.value(r, c)) for c in range(self._columns_number)] for r in range(self._rows_number)])
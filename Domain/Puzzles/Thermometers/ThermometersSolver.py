@@ -90,6 +90,7 @@ class ThermometersSolver(GameSolver):
         self.rows_full_numbers = self.full_numbers_by_column_row['row']
 
         self._model = None
+        self._solver = cp_model.CpSolver()
         self._matrix_ortools = None
         self._grid_ortools = None
         self._previous_solution_grid = None
@@ -106,7 +107,7 @@ class ThermometersSolver(GameSolver):
         if self._model is None:
             self._init_solver()
 
-        solver = cp_model.CpSolver()
+        solver = self._solver
         status = solver.Solve(self._model)
 
         if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
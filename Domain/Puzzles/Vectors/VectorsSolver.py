@@ -11,6 +11,7 @@ class VectorsSolver(GameSolver):
         self.rows_number = self._grid.rows_number
         self.columns_number = self._grid.columns_number
         self._model = cp_model.CpModel()
+        self._solver = cp_model.CpSolver()
         self._grid_vars = None
         self._previous_solution: Grid | None = None
         self._black_positions_with_region_number: dict[Position, int] = {}
@@ -42,7 +43,7 @@ class VectorsSolver(GameSolver):
         return self._previous_solution
 
     def _compute_solution(self) -> Grid:
-        solver = cp_model.CpSolver()
+        solver = self._solver
         status = solver.Solve(self._model)
 
         if status not in (cp_model.FEASIBLE, cp_model.OPTIMAL):
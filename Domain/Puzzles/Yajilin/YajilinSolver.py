@@ -27,7 +27,10 @@ class YajilinSolver(GameSolver):
         self._previous_solution: IslandGrid | None = None
 
     def _init_island_grid(self):
-        self._island_grid = IslandGrid([[Island(Position(r, c), 2) for c in range(self.input_grid.columns_number)] for r in range(self.input_grid.rows_number)])
+        if self._island_grid is not None:
+            self._island_grid = self._island_grid.with_reset_bridges()
+        else:
+            self._island_grid = IslandGrid([[Island(Position(r, c), 2) for c in range(self.input_grid.columns_number)] for r in range(self.input_grid.rows_number)])
         for position in [position for position, value in self.input_grid if value != '']:
             [self._island_grid[position].set_bridge_to_position(neighbor, 0) for neighbor in position.neighbors()]
             self._island_grid[position].set_bridges_count_according_to_directions_bridges()
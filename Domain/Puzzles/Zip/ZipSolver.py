@@ -1,7 +1,8 @@
-﻿from z3 import Solver, Not, And, Int, sat
+﻿from z3 import Solver, Not, And, Int, sat, Implies, If, ArithRef
 
 from Domain.Board.Grid import Grid
 from Domain.Board.LinearPathGrid import LinearPathGrid
+from Domain.Board.Position import Position
 from Domain.Puzzles.GameSolver import GameSolver
 
 
@@ -16,7 +17,8 @@ class ZipSolver(GameSolver):
         self._finish_position = self._checkpoints[max(self._checkpoints.keys())]
         self._solver = Solver()
         self._grid_z3: Grid | None = None
-        self._previous_solution: Grid | None = None
+        self._successors_z3: dict[Position, tuple[ArithRef, list[Position]]] = {}
+        self._previous_solution: dict[Position, int] | None = None
         self._solver_impl = None
 
     def get_solution(self) -> LinearPathGrid:
@@ -32,27 +34,31 @@ class ZipSolver(GameSolver):
         if self._solver_impl:
             return self._solver_impl.get_other_solution()
 
-        self._solver.add(Not(And([self._grid_z3[position] == value for position, value in self._previous_solution])))
+        self._solver.add(self._exclude_successors(self._previous_solution))
         return self._compute_solution()
 
     def _compute_solution(self) -> LinearPathGrid:
         while self._solver.check() == sat:
             model = self._solver.model()
-            grid_solution = Grid([[(model.eval(self._grid_z3.value(r, c))).as_long() for c in range(self.columns_number)] for r in range(self.rows_number)])
-            grid_solution.set_walls(self._grid.walls)
-            linear_path_grid = LinearPathGrid.from_grid_and_checkpoints(grid_solution, self._checkpoints)
-            if linear_path_grid == Grid.empty():
-                self._solver.add(Not(And([self._grid_z3[position] == value for position, value in grid_solution])))
+            successors_indexes = {position: model.eval(successor).as_long() for position, (successor, _) in self._successors_z3.items()}
+            successors = {position: self._successors_z3[position][1][index] for position, index in successors_indexes.items()}
+            linear_path_grid = LinearPathGrid.from_successors(successors, self._start_position)
+            if linear_path_grid.is_empty():
+                self._solver.add(self._exclude_successors(successors_indexes))
                 continue
-            self._previous_solution = grid_solution
+            self._previous_solution = successors_indexes
             return linear_path_grid
         return LinearPathGrid.empty()
 
+    def _exclude_successors(self, successors_indexes: dict[Position, int]):
+        return Not(And([self._successors_z3[position][0] == index for position, index in successors_indexes.items()]))
+
     def _add_constraints(self):
         self._add_initial_constraints()
         self._add_finish_checkpoint_not_same_value_neighbors_constraints()
         self._add_on_checkpoints_neighbors_count_constraints()
         self._add_along_path_neighbors_count_constraints()
+        self._add_successors_constraints()
 
     def _add_initial_constraints(self):
         for position in self._checkpoints.values():
@@ -61,6 +67,31 @@ class ZipSolver(GameSolver):
             self._solver.add(self._grid_z3[position] >= self._grid[self._start_position])
             self._solver.add(self._grid_z3[position] < self._grid[self._finish_position])
 
+    def _add_successors_constraints(self):
+        # each cell but the finish points to the next cell of the path; ranks along the path forbid cycles
+        rank_z3 = {position: Int(f"rank_{position}") for position, _ in self._grid}
+        self._solver.add(rank_z3[self._start_position] == 0)
+        for position, _ in self._grid:
+            if position == self._finish_position:
+                continue
+            neighbors_positions = list(self._grid_z3.neighbors_positions(position))
+            successor = Int(f"successor_{position}")
+            self._successors_z3[position] = successor, neighbors_positions
+            self._solver.add(successor >= 0, successor < len(neighbors_positions))
+            for index, neighbor_position in enumerate(neighbors_positions):
+                segment_step = 1 if neighbor_position in self._checkpoints.values() else 0
+                self._solver.add(Implies(successor == index, And(self._grid_z3[neighbor_position] == self._grid_z3[position] + segment_step, rank_z3[neighbor_position] == rank_z3[position] + 1)))
+
+        for position, _ in self._grid:
+            if position == self._start_position:
+                continue
+            predecessors = [
+                If(self._successors_z3[neighbor_position][0] == self._successors_z3[neighbor_position][1].index(position), 1, 0)
+                for neighbor_position in self._grid_z3.neighbors_positions(position)
+                if neighbor_position in self._successors_z3 and position in self._successors_z3[neighbor_position][1]
+            ]
+            self._solver.add(sum(predecessors) == 1)
+
     def _add_finish_checkpoint_not_same_value_neighbors_constraints(self):
         neighbors_values = self._get_neighbors_values(self._finish_position)
         finish_value = self._grid[self._finish_position]
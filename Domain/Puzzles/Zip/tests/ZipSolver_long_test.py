@@ -0,0 +1,64 @@
+import random
+import time
+import unittest
+from unittest import TestCase
+
+from Domain.Board.Grid import Grid
+from Domain.Board.LinearPathGrid import LinearPathGrid
+from Domain.Board.Position import Position
+from Domain.Puzzles.Zip.ZipSolver import ZipSolver
+
+
+class ZipSolverLongTests(TestCase):
+    @staticmethod
+    def _random_path(size: int, rng: random.Random) -> list[Position]:
+        path = [Position(r, c if r % 2 == 0 else size - 1 - c) for r in range(size) for c in range(size)]
+        for _ in range(size * size * 10):
+            if rng.random() < 0.5:
+                path.reverse()
+            end = path[-1]
+            neighbors = [neighbor for neighbor in end.neighbors() if 0 <= neighbor.r < size and 0 <= neighbor.c < size and neighbor != path[-2]]
+            index = path.index(rng.choice(neighbors))
+            path[index + 1:] = reversed(path[index + 1:])
+        return path
+
+    @staticmethod
+    def _zip_grid(path: list[Position], size: int, checkpoints_count: int) -> tuple[Grid, Grid, dict[int, Position]]:
+        step = (len(path) - 1) / (checkpoints_count - 1)
+        checkpoints = {value + 1: path[round(value * step)] for value in range(checkpoints_count)}
+        puzzle = Grid([[0] * size for _ in range(size)])
+        for value, position in checkpoints.items():
+            puzzle[position] = value
+        segments = Grid([[0] * size for _ in range(size)])
+        value = 0
+        for position in path:
+            value = puzzle[position] or value
+            segments[position] = value
+        return puzzle, segments, checkpoints
+
+    def test_path_reconstruction_benchmark(self):
+        rng = random.Random(11)
+        for size in range(8, 13):
+            path = self._random_path(size, rng)
+            puzzle, segments, checkpoints = self._zip_grid(path, size, size)
+            successors = dict(zip(path, path[1:]))
+
+            start = time.perf_counter()
+            from_checkpoints = LinearPathGrid.from_grid_and_checkpoints(segments, checkpoints)
+            checkpoints_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            from_successors = LinearPathGrid.from_successors(successors, path[0])
+            successors_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            solution = ZipSolver(puzzle).get_solution()
+            solve_seconds = time.perf_counter() - start
+
+            self.assertEqual(path, from_successors.path)
+            self.assertEqual(len(path), len(from_checkpoints.path))
+            self.assertEqual(len(path), len(solution.path))
+            print(f"{size}x{size}: rebuild from segments {checkpoints_seconds * 1000:.2f}ms, from successors {successors_seconds * 1000:.2f}ms, solve {solve_seconds:.2f}s")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import random
+import time
+import unittest
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from Domain.Board.Position import Position
+from Domain.Puzzles.ConnectivityConstraints import ConnectivityConstraints
+from Domain.Puzzles.LazyConstraintSolver import LazyConstraintSolver
+
+
+class ConnectivityConstraintsLongTests(TestCase):
+    @staticmethod
+    def _region_model(size: int, seed: int) -> tuple[cp_model.CpModel, dict[Position, cp_model.IntVar]]:
+        model = cp_model.CpModel()
+        cells = {Position(r, c): model.NewBoolVar(f"{r}_{c}") for r in range(size) for c in range(size)}
+        rng = random.Random(seed)
+        for position in rng.sample(sorted(cells), size):
+            model.Add(cells[position] == 1)
+        for position in rng.sample(sorted(cells), size):
+            model.Add(cells[position] == 0)
+        for r in range(size - 1):
+            for c in range(size - 1):
+                model.Add(sum(cells[Position(r + dr, c + dc)] for dr in range(2) for dc in range(2)) <= 3)
+        model.Add(sum(cells.values()) == size * size // 2)
+        return model, cells
+
+    @staticmethod
+    def _connected_components(active: set[Position]) -> list[set[Position]]:
+        components = []
+        remaining = set(active)
+        while remaining:
+            component = set()
+            stack = [remaining.pop()]
+            while stack:
+                position = stack.pop()
+                component.add(position)
+                for neighbor in position.neighbors():
+                    if neighbor in remaining:
+                        remaining.remove(neighbor)
+                        stack.append(neighbor)
+            components.append(component)
+        return components
+
+    def _solve_lazy(self, model: cp_model.CpModel, cells: dict[Position, cp_model.IntVar]) -> set[Position] | None:
+        def find_cuts(active: set[Position]):
+            for component in self._connected_components(active)[1:]:
+                boundary = {neighbor for position in component for neighbor in position.neighbors() if neighbor in cells and neighbor not in component}
+                yield LazyConstraintSolver.region_cut([cells[position] for position in component], [cells[position] for position in boundary])
+
+        lazy_solver = LazyConstraintSolver(model)
+        return lazy_solver.solve(lambda solver: {position for position, cell in cells.items() if solver.Value(cell)}, find_cuts)
+
+    def _solve_with_encoding(self, model: cp_model.CpModel, cells: dict[Position, cp_model.IntVar], encoding) -> set[Position] | None:
+        encoding(model, cells)
+        solver = cp_model.CpSolver()
+        if solver.solve(model) not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            return None
+        return {position for position, cell in cells.items() if solver.Value(cell)}
+
+    def test_connected_region_encodings_benchmark(self):
+        for size in [6, 8, 10]:
+            durations = {}
+            for name in ['lazy', 'flow', 'distance']:
+                model, cells = self._region_model(size, seed=size)
+                start_time = time.perf_counter()
+                if name == 'lazy':
+                    active = self._solve_lazy(model, cells)
+                else:
+                    active = self._solve_with_encoding(model, cells, getattr(ConnectivityConstraints, f"add_connected_cells_{name}"))
+                durations[name] = time.perf_counter() - start_time
+                if active is not None:
+                    self.assertEqual(1, len(self._connected_components(active)))
+            print(f"{size}x{size} connected region: " + ", ".join(f"{name} {duration:.2f}s" for name, duration in durations.items()))
+
+    def test_single_loop_benchmark(self):
+        for size in [6, 8, 10, 12]:
+            model = cp_model.CpModel()
+            edges = {}
+            for position in [Position(r, c) for r in range(size) for c in range(size)]:
+                for neighbor in [position.right, position.down]:
+                    if neighbor.r < size and neighbor.c < size:
+                        edges[frozenset([position, neighbor])] = model.NewBoolVar(f"{position}_{neighbor}")
+            visited = ConnectivityConstraints.add_single_loop(model, edges)
+            model.Add(sum(visited.values()) >= size * size * 3 // 4)
+            start_time = time.perf_counter()
+            status = cp_model.CpSolver().solve(model)
+            print(f"{size}x{size} single loop: {time.perf_counter() - start_time:.2f}s")
+            self.assertIn(status, (cp_model.OPTIMAL, cp_model.FEASIBLE))
+
+
+if __name__ == '__main__':
+    unittest.main()
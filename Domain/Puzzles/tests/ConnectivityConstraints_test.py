@@ -0,0 +1,91 @@
+import unittest
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+from parameterized import parameterized
+
+from Domain.Board.Grid import Grid
+from Domain.Board.Position import Position
+from Domain.Puzzles.ConnectivityConstraints import ConnectivityConstraints
+
+
+class SolutionsCounter(cp_model.CpSolverSolutionCallback):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def on_solution_callback(self):
+        self.count += 1
+
+
+def grid_edges(model: cp_model.CpModel, rows_number: int, columns_number: int) -> dict[frozenset[Position], cp_model.IntVar]:
+    edges = {}
+    for position in [Position(r, c) for r in range(rows_number) for c in range(columns_number)]:
+        for neighbor in [position.right, position.down]:
+            if neighbor.r < rows_number and neighbor.c < columns_number:
+                edges[frozenset([position, neighbor])] = model.NewBoolVar(f"{position}_{neighbor}")
+    return edges
+
+
+def count_solutions(model: cp_model.CpModel) -> int:
+    solver = cp_model.CpSolver()
+    solver.parameters.enumerate_all_solutions = True
+    counter = SolutionsCounter()
+    solver.solve(model, counter)
+    return counter.count
+
+
+class ConnectivityConstraintsTests(TestCase):
+    @parameterized.expand([
+        ('add_connected_cells_flow', [[1, 1, 0], [0, 1, 0], [0, 1, 1]], True),
+        ('add_connected_cells_flow', [[1, 0, 1], [1, 0, 1], [1, 1, 1]], True),
+        ('add_connected_cells_flow', [[1, 0, 1], [0, 0, 0], [1, 0, 1]], False),
+        ('add_connected_cells_flow', [[0, 0, 0], [0, 0, 0], [0, 0, 0]], True),
+        ('add_connected_cells_distance', [[1, 1, 0], [0, 1, 0], [0, 1, 1]], True),
+        ('add_connected_cells_distance', [[1, 0, 1], [1, 0, 1], [1, 1, 1]], True),
+        ('add_connected_cells_distance', [[1, 0, 1], [0, 0, 0], [1, 0, 1]], False),
+        ('add_connected_cells_distance', [[1, 1, 0], [0, 0, 1], [0, 1, 1]], False),
+    ])
+    def test_connected_cells(self, encoding: str, matrix: list[list[int]], expected_feasible: bool):
+        grid = Grid(matrix)
+        model = cp_model.CpModel()
+        cells = {position: model.NewBoolVar(f"{position}") for position, _ in grid}
+        getattr(ConnectivityConstraints, encoding)(model, cells)
+        for position, value in grid:
+            model.Add(cells[position] == value)
+        status = cp_model.CpSolver().solve(model)
+        self.assertEqual(expected_feasible, status in (cp_model.OPTIMAL, cp_model.FEASIBLE))
+
+    def test_connected_cells_accept_negated_literals(self):
+        model = cp_model.CpModel()
+        whites = {Position(r, c): model.NewBoolVar(f"{r}_{c}") for r in range(3) for c in range(3)}
+        ConnectivityConstraints.add_connected_cells_flow(model, {position: white.Not() for position, white in whites.items()})
+        model.Add(sum(whites.values()) == 1)
+        model.Add(whites[Position(1, 1)] == 1)
+        self.assertEqual(cp_model.OPTIMAL, cp_model.CpSolver().solve(model))
+
+    def test_single_loop_counts_each_cycle_in_both_orientations(self):
+        model = cp_model.CpModel()
+        ConnectivityConstraints.add_single_loop(model, grid_edges(model, 3, 3))
+        self.assertEqual(2 * 13 + 1, count_solutions(model))
+
+    def test_single_loop_forbids_two_loops(self):
+        model = cp_model.CpModel()
+        edges = grid_edges(model, 2, 5)
+        ConnectivityConstraints.add_single_loop(model, edges)
+        for edge in [frozenset([Position(0, 0), Position(0, 1)]), frozenset([Position(0, 3), Position(0, 4)])]:
+            model.Add(edges[edge] == 1)
+        model.Add(edges[frozenset([Position(0, 1), Position(0, 2)])] == 0)
+        model.Add(edges[frozenset([Position(1, 1), Position(1, 2)])] == 0)
+        self.assertEqual(cp_model.INFEASIBLE, cp_model.CpSolver().solve(model))
+
+    def test_single_path_between_corners(self):
+        model = cp_model.CpModel()
+        edges = grid_edges(model, 3, 4)
+        visited = {position: model.NewConstant(1) for edge in edges for position in edge}
+        ConnectivityConstraints.add_single_path(model, edges, Position(0, 0), Position(2, 3), visited)
+        self.assertEqual(4, count_solutions(model))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from Domain.Puzzles.LazyConstraintSolver import LazyConstraintSolver
+
+
+class LazyConstraintSolverTests(TestCase):
+    def setUp(self):
+        self.model = cp_model.CpModel()
+        self.variables = [self.model.NewBoolVar(f"x{i}") for i in range(4)]
+        self.model.Add(sum(self.variables) == 2)
+
+    def _extract(self, solver: cp_model.CpSolver) -> tuple[int, ...]:
+        return tuple(solver.Value(variable) for variable in self.variables)
+
+    def test_solution_without_cut_is_returned_at_first_iteration(self):
+        lazy_solver = LazyConstraintSolver(self.model)
+        solution = lazy_solver.solve(self._extract, lambda _: [])
+        self.assertEqual(2, sum(solution))
+        self.assertEqual(1, lazy_solver.iterations_count)
+        self.assertEqual(1, len(lazy_solver.iterations_durations))
+        self.assertEqual(0, lazy_solver.cuts_count)
+
+    def test_cuts_are_added_until_solution_is_accepted(self):
+        def forbid_first_variable(solution):
+            return [[self.variables[0].Not()]] if solution[0] else []
+
+        def forbid_solution_without_last_variable(solution):
+            return [[self.variables[3]]] if not solution[3] else []
+
+        lazy_solver = LazyConstraintSolver(self.model)
+        solution = lazy_solver.solve(self._extract, lambda current: forbid_first_variable(current) + forbid_solution_without_last_variable(current))
+        self.assertEqual(0, solution[0])
+        self.assertEqual(1, solution[3])
+        self.assertEqual(lazy_solver.iterations_count, len(lazy_solver.iterations_durations))
+        self.assertLessEqual(lazy_solver.iterations_count, 3)
+
+    def test_linear_cut(self):
+        lazy_solver = LazyConstraintSolver(self.model)
+        solution = lazy_solver.solve(self._extract, lambda current: [LazyConstraintSolver.cut_set(self.variables[2:])] if not any(current[2:]) else [])
+        self.assertTrue(solution[2] or solution[3])
+
+    def test_none_when_cuts_make_model_infeasible(self):
+        lazy_solver = LazyConstraintSolver(self.model)
+        solution = lazy_solver.solve(self._extract, lambda current: [LazyConstraintSolver.subtour_cut(self.variables, 2)])
+        self.assertIsNone(solution)
+        self.assertEqual(2, lazy_solver.iterations_count)
+
+    def test_region_cut(self):
+        cut = LazyConstraintSolver.region_cut(self.variables[:2], self.variables[2:])
+        self.assertEqual(4, len(cut))
+        self.assertEqual(self.variables[2:], cut[2:])
+
+
+if __name__ == '__main__':
+    unittest.main()
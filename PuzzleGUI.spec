@@ -76,6 +76,9 @@ if os.path.exists(ortools_libs_dir):
     for so in glob.glob(os.path.join(ortools_libs_dir, '*.so*')):
         binaries.append((so, 'ortools/.libs'))
 
+# Game configs are imported lazily through Run/GameManifest.py, so the analysis cannot discover them
+hiddenimports += [f"Run.Games.{os.path.splitext(os.path.basename(path))[0]}" for path in glob.glob(os.path.join('Run', 'Games', '*Config.py'))]
+
 # Add all Python packages from the project
 a = Analysis(
     ['Run/PuzzleGUI.py'],
@@ -0,0 +1,63 @@
+import json
+import os
+import threading
+from collections import Counter, defaultdict
+
+from Domain.Puzzles.GameSolver import GameSolver
+
+
+class BackendStatistics:
+    ENVIRONMENT_VARIABLE = 'PUZZLE_BACKEND_STATISTICS'
+
+    def __init__(self, path: str | None = None):
+        self._path = path
+        self._lock = threading.Lock()
+        self._wins: dict[str, dict[str, Counter]] = defaultdict(lambda: defaultdict(Counter))
+        if path is not None and os.path.exists(path):
+            self._load()
+
+    @classmethod
+    def from_environment(cls) -> 'BackendStatistics':
+        return cls(os.environ.get(cls.ENVIRONMENT_VARIABLE))
+
+    @staticmethod
+    def backend_name(backend: type[GameSolver]) -> str:
+        return backend.__module__.rsplit('.', 1)[-1]
+
+    @staticmethod
+    def size_key(data_game) -> str:
+        grid = data_game[0] if isinstance(data_game, tuple) else data_game
+        if hasattr(grid, 'rows_number') and hasattr(grid, 'columns_number'):
+            return f"{grid.rows_number}x{grid.columns_number}"
+        return 'unknown'
+
+    def record_win(self, game: str, size: str, backend: str):
+        with self._lock:
+            self._wins[game][size][backend] += 1
+            if self._path is not None:
+                self._save()
+
+    def wins(self, game: str) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {size: dict(counter) for size, counter in self._wins[game].items()}
+
+    def preferred_backend(self, game: str, size: str) -> str | None:
+        with self._lock:
+            counter = self._wins[game].get(size)
+            if not counter:
+                counter = sum(self._wins[game].values(), Counter())
+            if not counter:
+                return None
+            return counter.most_common(1)[0][0]
+
+    def _load(self):
+        with open(self._path) as file:
+            for game, sizes in json.load(file).items():
+                for size, counter in sizes.items():
+                    self._wins[game][size].update(counter)
+
+    def _save(self):
+        temporary_path = f"{self._path}.tmp"
+        with open(temporary_path, 'w') as file:
+            json.dump({game: {size: dict(counter) for size, counter in sizes.items()} for game, sizes in self._wins.items()}, file, indent=2, sort_keys=True)
+        os.replace(temporary_path, self._path)
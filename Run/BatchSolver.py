@@ -0,0 +1,60 @@
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Hashable, Iterable, Iterator
+
+from Domain.Puzzles.GameSolver import GameSolver
+from Run.SolverConfiguration import SolverConfiguration
+
+BatchTask = tuple[Hashable, type[GameSolver], Any, SolverConfiguration]
+BatchResult = tuple[Hashable, Any, str | None, float]
+
+
+def _solve_chunk(solver_class: type[GameSolver], chunk: list[tuple[Hashable, Any, SolverConfiguration]]) -> list[BatchResult]:
+    from Run.GameComponentFactory import GameComponentFactory
+    results = []
+    for key, data_game, configuration in chunk:
+        start = time.perf_counter()
+        try:
+            solution = GameComponentFactory.create_solver(solver_class, data_game, configuration).get_solution()
+            results.append((key, solution, None, time.perf_counter() - start))
+        except Exception as e:
+            results.append((key, None, repr(e), time.perf_counter() - start))
+    return results
+
+
+class BatchSolver:
+    def __init__(self, max_workers: int = os.cpu_count() or 1, chunk_size: int = 8):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+
+    @classmethod
+    def from_environment(cls) -> 'BatchSolver':
+        return cls(
+            max_workers=int(os.environ.get('PUZZLE_BATCH_WORKERS', os.cpu_count() or 1)),
+            chunk_size=int(os.environ.get('PUZZLE_BATCH_CHUNK_SIZE', 8)),
+        )
+
+    def solve(self, tasks: Iterable[BatchTask]) -> Iterator[BatchResult]:
+        chunks = self._chunks_by_solver_class(tasks)
+        if not chunks:
+            return
+        with ProcessPoolExecutor(max_workers=min(self._max_workers, len(chunks))) as executor:
+            futures = {executor.submit(_solve_chunk, solver_class, chunk): chunk for solver_class, chunk in chunks}
+            for future in as_completed(futures):
+                try:
+                    yield from future.result()
+                except Exception as e:
+                    for key, _, _ in futures[future]:
+                        yield key, None, repr(e), 0.0
+
+    def _chunks_by_solver_class(self, tasks: Iterable[BatchTask]) -> list[tuple[type[GameSolver], list]]:
+        groups: dict[type[GameSolver], list] = defaultdict(list)
+        for key, solver_class, data_game, configuration in tasks:
+            groups[solver_class].append((key, data_game, configuration))
+        return [(solver_class, group[start:start + self._chunk_size]) for solver_class, group in groups.items() for start in range(0, len(group), self._chunk_size)]
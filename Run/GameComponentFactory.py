@@ -1,9 +1,17 @@
-﻿from typing import Any
+﻿from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 
 from Domain.Puzzles.GameSolver import GameSolver
-from GridPlayers.Base.GridPlayer import GridPlayer
+from Run.BackendStatistics import BackendStatistics
+from Run.GameRegistry import GameRegistry
+from Run.PortfolioSolver import PortfolioSolver
+from Run.SolverConfiguration import SolverConfiguration
 from Run.UrlPatternMatcher import UrlPatternMatcher
 
+if TYPE_CHECKING:
+    from GridPlayers.Base.GridPlayer import GridPlayer
+
 
 class GameComponentFactory:
     def __init__(self):
@@ -18,10 +26,18 @@ class GameComponentFactory:
         return game_class, game_data, game_player, browser_context, playwright
     
     @staticmethod
-    def create_solver(solver_class: type[GameSolver], data_game: Any) -> GameSolver:
+    def create_solver(solver_class: type[GameSolver], data_game: Any, configuration: SolverConfiguration | None = None) -> GameSolver:
+        if configuration is None:
+            configuration = SolverConfiguration.from_environment()
+        if configuration.backend is not None:
+            backends = GameRegistry.get_backends(solver_class)
+            if configuration.backend == 'portfolio' and len(backends) > 1:
+                return PortfolioSolver(backends, data_game, configuration, GameRegistry.backend_statistics)
+            if configuration.backend == 'learned':
+                solver_class = GameRegistry.get_preferred_backend(solver_class, BackendStatistics.size_key(data_game))
         if isinstance(data_game, tuple):
             grid = data_game[0]
             extra_data = data_game[1:]
-            return solver_class(grid, *extra_data)
+            return configuration.apply(solver_class(grid, *extra_data))
 
-        return solver_class(data_game)
+        return configuration.apply(solver_class(data_game))
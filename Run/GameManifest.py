@@ -0,0 +1,125 @@
+# Generated by `python Run/GameManifestGenerator.py`, do not edit by hand.
+# Maps each URL pattern to the Run.Games config module registering it and to its solver class.
+GAME_MANIFEST: list[tuple[str, str, str]] = [
+    ('https://.*\\.puzzle-light-up\\.com', 'Run.Games.AkariConfig', 'Domain.Puzzles.Akari.AkariSolver.AkariSolver'),
+    ('https://lasergrids\\.puzzlebaron\\.com/init2\\.php', 'Run.Games.AkariConfig', 'Domain.Puzzles.Akari.AkariSolver.AkariSolver'),
+    ('https://vuqq\\.com/.*akari', 'Run.Games.AkariConfig', 'Domain.Puzzles.Akari.AkariSolver.AkariSolver'),
+    ('https://.*\\.puzzle-aquarium\\.com', 'Run.Games.AquariumConfig', 'Domain.Puzzles.Aquarium.AquariumSolver.AquariumSolver'),
+    ('https://.*gridpuzzle\\.com/arofuro', 'Run.Games.ArofuroConfig', 'Domain.Puzzles.Arofuro.ArofuroSolver.ArofuroSolver'),
+    ('https://.*gridpuzzle\\.com/balance-loop', 'Run.Games.BalanceLoopConfig', 'Domain.Puzzles.BalanceLoop.BalanceLoopSolver.BalanceLoopSolver'),
+    ('https://.*\\.puzzle-battleships\\.com', 'Run.Games.BimaruConfig', 'Domain.Puzzles.Bimaru.BimaruSolver.BimaruSolver'),
+    ('https://.*\\.puzzle-binairo\\.com', 'Run.Games.BinairoConfig', 'Domain.Puzzles.Binairo.BinairoSolver.BinairoSolver'),
+    ('https://www\\.linkedin\\.com/games/tango', 'Run.Games.BinairoPlusConfig', 'Domain.Puzzles.BinairoPlus.BinairoPlusSolver.BinairoPlusSolver'),
+    ('https://.*\\.puzzle-binairo\\.com.*binairo-plus.*', 'Run.Games.BinairoPlusConfig', 'Domain.Puzzles.BinairoPlus.BinairoPlusSolver.BinairoPlusSolver'),
+    ('https://.*gridpuzzle\\.com/bodaburokku', 'Run.Games.BorderBlockConfig', 'Domain.Puzzles.BorderBlock.BorderBlockSolver.BorderBlockSolver'),
+    ('https://.*gridpuzzle\\.com/chocona', 'Run.Games.ChoconaConfig', 'Domain.Puzzles.Chocona.ChoconaSolver.ChoconaSolver'),
+    ('https://.*gridpuzzle\\.com/clouds', 'Run.Games.CloudsConfig', 'Domain.Puzzles.Clouds.CloudsSolver.CloudsSolver'),
+    ('https://.*gridpuzzle\\.com/country-road', 'Run.Games.CountryRoadConfig', 'Domain.Puzzles.CountryRoad.CountryRoadSolver.CountryRoadSolver'),
+    ('https://.*gridpuzzle\\.com/creek', 'Run.Games.CreekConfig', 'Domain.Puzzles.Creek.CreekSolver.CreekSolver'),
+    ('https://.*\\.puzzle-dominosa\\.com', 'Run.Games.DominosaConfig', 'Domain.Puzzles.Dominosa.DominosaSolver.DominosaSolver'),
+    ('https://.*gridpuzzle\\.com/doppelblock', 'Run.Games.DoppelblockConfig', 'Domain.Puzzles.Doppelblock.DoppelblockSolver.DoppelblockSolver'),
+    ('https://.*gridpuzzle\\.com/dosun-fuwari', 'Run.Games.DosunFuwariConfig', 'Domain.Puzzles.DosunFuwari.DosunFuwariSolver.DosunFuwariSolver'),
+    ('https://.*gridpuzzle\\.com/dotchiloop', 'Run.Games.DotchiLoopConfig', 'Domain.Puzzles.DotchiLoop.DotchiLoopSolver.DotchiLoopSolver'),
+    ('https://.*gridpuzzle\\.com/every-second-turn', 'Run.Games.EverySecondTurnConfig', 'Domain.Puzzles.EverySecondTurn.EverySecondTurnSolver.EverySecondTurnSolver'),
+    ('https://.*gridpuzzle\\.com/fobidoshi', 'Run.Games.FobidoshiConfig', 'Domain.Puzzles.Fobidoshi.FobidoshiSolver.FobidoshiSolver'),
+    ('https://.*gridpuzzle\\.com/from1tox', 'Run.Games.From1ToXConfig', 'Domain.Puzzles.From1ToX.From1ToXSolver.From1ToXSolver'),
+    ('https://.*\\.puzzle-futoshiki\\.com', 'Run.Games.FutoshikiConfig', 'Domain.Puzzles.Futoshiki.FutoshikiSolver.FutoshikiSolver'),
+    ('https://.*gridpuzzle\\.com/gappy', 'Run.Games.GappyConfig', 'Domain.Puzzles.Gappy.GappySolver.GappySolver'),
+    ('https://.*gridpuzzle\\.com/straight-loop', 'Run.Games.GeradewegConfig', 'Domain.Puzzles.Geradeweg.GeradewegSolver.GeradewegSolver'),
+    ('https://.*gridpuzzle\\.com/grades', 'Run.Games.GradesConfig', 'Domain.Puzzles.Grades.GradesSolver.GradesSolver'),
+    ('https://.*gridpuzzle\\.com/grandtour', 'Run.Games.GrandTourConfig', 'Domain.Puzzles.GrandTour.GrandTourSolver.GrandTourSolver'),
+    ('https://.*gridpuzzle\\.com/gyokuseki', 'Run.Games.GyokusekiConfig', 'Domain.Puzzles.Gyokuseki.GyokusekiSolver.GyokusekiSolver'),
+    ('https://.*gridpuzzle\\.com/hakoiri', 'Run.Games.HakoiriConfig', 'Domain.Puzzles.Hakoiri.HakoiriSolver.HakoiriSolver'),
+    ('https://.*\\.puzzle-bridges\\.com', 'Run.Games.HashiConfig', 'Domain.Puzzles.Hashi.HashiSolver.HashiSolver'),
+    ('https://.*gridpuzzle\\.com/bridges', 'Run.Games.HashiConfig', 'Domain.Puzzles.Hashi.HashiSolver.HashiSolver'),
+    ('https://.*\\.puzzle-heyawake\\.com', 'Run.Games.HeyawakeConfig', 'Domain.Puzzles.Heyawake.HeyawakeSolver.HeyawakeSolver'),
+    ('https://gridgames.app/hidoku', 'Run.Games.HidokuConfig', 'Domain.Puzzles.Hidoku.HidokuSolver.HidokuSolver'),
+    ('https://.*\\.puzzle-hitori\\.com', 'Run.Games.HitoriConfig', 'Domain.Puzzles.Hitori.HitoriSolver.HitoriSolver'),
+    ('https://vuqq\\.com/.*hitori/.*', 'Run.Games.HitoriConfig', 'Domain.Puzzles.Hitori.HitoriSolver.HitoriSolver'),
+    ('https://.*\\.puzzle-jigsaw-sudoku\\.com', 'Run.Games.JigsawSudokuConfig', 'Domain.Puzzles.Sudoku.JigsawSudoku.JigsawSudokuSolver.JigsawSudokuSolver'),
+    ('https://.*\\.puzzle-kakurasu\\.com', 'Run.Games.KakurasuConfig', 'Domain.Puzzles.Kakurasu.KakurasuSolver.KakurasuSolver'),
+    ('https://.*\\.puzzle-kakuro\\.com', 'Run.Games.KakuroConfig', 'Domain.Puzzles.Kakuro.KakuroSolver.KakuroSolver'),
+    ('https://.*gridpuzzle\\.com/cocktail-lamp', 'Run.Games.KakuteruAnpuConfig', 'Domain.Puzzles.KakuteruAnpu.KakuteruAnpuSolver.KakuteruAnpuSolver'),
+    ('https://.*gridpuzzle\\.com/kanjo', 'Run.Games.KanjoConfig', 'Domain.Puzzles.Kanjo.KanjoSolver.KanjoSolver'),
+    ('https://www\\.20minutes\\.fr/services/jeux/kemaru', 'Run.Games.KemaruConfig', 'Domain.Puzzles.Kemaru.KemaruSolver.KemaruSolver'),
+    ('https://calcudoku\\.puzzlebaron\\.com/init2\\.php', 'Run.Games.KenKenConfig', 'Domain.Puzzles.KenKen.KenKenSolver.KenKenSolver'),
+    ('https://.*\\.puzzle-killer-sudoku\\.com', 'Run.Games.KillerSudokuConfig', 'Domain.Puzzles.Sudoku.KillerSudoku.KillerSudokuSolver.KillerSudokuSolver'),
+    ('https://.*gridpuzzle\\.com/koburin', 'Run.Games.KoburinConfig', 'Domain.Puzzles.Koburin.KoburinSolver.KoburinSolver'),
+    ('https://.*gridpuzzle\\.com/konarupu', 'Run.Games.KonarupuConfig', 'Domain.Puzzles.Konarupu.KonarupuSolver.KonarupuSolver'),
+    ('https://.*\\.puzzle-kurodoko\\.com', 'Run.Games.KurodokoConfig', 'Domain.Puzzles.Kurodoko.KurodokoSolver.KurodokoSolver'),
+    ('https://.*\\.puzzles-mobile\\.com/kurodoko', 'Run.Games.KurodokoConfig', 'Domain.Puzzles.Kurodoko.KurodokoSolver.KurodokoSolver'),
+    ('https://.*gridpuzzle\\.com/kuroshiro', 'Run.Games.KuroshiroConfig', 'Domain.Puzzles.Kuroshiro.KuroshiroSolver.KuroshiroSolver'),
+    ('https://.*gridpuzzle\\.com/linesweeper', 'Run.Games.LinesweeperConfig', 'Domain.Puzzles.Linesweeper.LinesweeperSolver.LinesweeperSolver'),
+    ('https://.*\\.puzzle-lits\\.com', 'Run.Games.LitsConfig', 'Domain.Puzzles.Lits.LitsSolver.LitsSolver'),
+    ('https://.*gridpuzzle\\.com/look-air', 'Run.Games.LookAirConfig', 'Domain.Puzzles.LookAir.LookAirSolver.LookAirSolver'),
+    ('https://.*\\.puzzle-masyu\\.com', 'Run.Games.MasyuConfig', 'Domain.Puzzles.Masyu.MasyuSolver.MasyuSolver'),
+    ('https://.*gridpuzzle\\.com/masyu', 'Run.Games.MasyuConfig', 'Domain.Puzzles.Masyu.MasyuSolver.MasyuSolver'),
+    ('https://.*gridpuzzle\\.com/meadows', 'Run.Games.MeadowsConfig', 'Domain.Puzzles.Meadows.MeadowsSolver.MeadowsSolver'),
+    ('https://.*gridpuzzle\\.com/mid-loop', 'Run.Games.MidLoopConfig', 'Domain.Puzzles.MidLoop.MidLoopSolver.MidLoopSolver'),
+    ('https://(?!.*mosaic)(?:.*\\.)?puzzle-minesweeper\\.com(?:/.*)?', 'Run.Games.MinesweeperConfig', 'Domain.Puzzles.Minesweeper.MinesweeperSolver.MinesweeperSolver'),
+    ('https://.*gridpuzzle\\.com/minesweeper', 'Run.Games.MinesweeperConfig', 'Domain.Puzzles.Minesweeper.MinesweeperSolver.MinesweeperSolver'),
+    ('https://(?:.*\\.)?puzzle-minesweeper\\.com/.*mosaic', 'Run.Games.MinesweeperMosaicConfig', 'Domain.Puzzles.MinesweeperMosaic.MinesweeperMosaicSolver.MinesweeperMosaicSolver'),
+    ('https://.*gridpuzzle\\.com/mintonette', 'Run.Games.MintonetteConfig', 'Domain.Puzzles.Mintonette.MintonetteSolver_or_tools.MintonetteSolver'),
+    ('https://.*gridpuzzle\\.com/miti', 'Run.Games.MitiConfig', 'Domain.Puzzles.Miti.MitiSolver.MitiSolver'),
+    ('https://.*gridpuzzle\\.com/moonsun', 'Run.Games.MoonsunConfig', 'Domain.Puzzles.Moonsun.MoonsunSolver.MoonsunSolver'),
+    ('https://.*gridpuzzle\\.com/nanro', 'Run.Games.NanroConfig', 'Domain.Puzzles.Nanro.NanroSolver.NanroSolver'),
+    ('https://.*gridpuzzle\\.com/neighbours', 'Run.Games.NeighboursConfig', 'Domain.Puzzles.Neighbours.NeighboursSolver.NeighboursSolver'),
+    ('https://.*gridpuzzle\\.com/no-four-in-row', 'Run.Games.No4InARowConfig', 'Domain.Puzzles.No4InARow.No4InARowSolver.No4InARowSolver'),
+    ('https://.*\\.puzzle-nonograms\\.com', 'Run.Games.NonogramConfig', 'Domain.Puzzles.Nonogram.NonogramSolver.NonogramSolver'),
+    ('https://.*\\.puzzle-norinori\\.com', 'Run.Games.NorinoriConfig', 'Domain.Puzzles.Norinori.NorinoriSolver.NorinoriSolver'),
+    ('https://.*gridpuzzle\\.com/number-chain', 'Run.Games.NumberChainConfig', 'Domain.Puzzles.NumberChain.NumberChainSolver.NumberChainSolver'),
+    ('https://.*gridpuzzle\\.com/number-cross', 'Run.Games.NumberCrossConfig', 'Domain.Puzzles.NumberCross.NumberCrossSolver.NumberCrossSolver'),
+    ('https://numberlinks\\.puzzlebaron\\.com/init2\\.php', 'Run.Games.NumberLinkConfig', 'Domain.Puzzles.NumberLink.NumberLinkSolver.NumberLinkSolver'),
+    ('https://.*\\.puzzle-nurikabe\\.com', 'Run.Games.NurikabeConfig', 'Domain.Puzzles.Nurikabe.NurikabeSolver.NurikabeSolver'),
+    ('https://.*gridpuzzle\\.com/pipelink', 'Run.Games.PipelinkConfig', 'Domain.Puzzles.Pipelink.PipelinkSolver.PipelinkSolver'),
+    ('https://.*\\.puzzle-pipes\\.com', 'Run.Games.PipesConfig', 'Domain.Puzzles.Pipes.PipesSolver.PipesSolver'),
+    ('https://vuqq\\.com/.*netwalk/.*', 'Run.Games.PipesConfig', 'Domain.Puzzles.Pipes.PipesSolver.PipesSolver'),
+    ('https://.*\\.puzzle-pipes\\.com/\\?size=\\\\d{2,}', 'Run.Games.PipesWrapConfig', 'Domain.Puzzles.PipesWrap.PipesWrapSolver.PipesWrapSolver'),
+    ('https://.*gridpuzzle\\.com/pure-loop', 'Run.Games.PurenrupuConfig', 'Domain.Puzzles.Purenrupu.PurenrupuSolver.PurenrupuSolver'),
+    ('https://.*gridpuzzle\\.com/regional-yajilin', 'Run.Games.RegionalYajilinConfig', 'Domain.Puzzles.RegionalYajilin.RegionalYajilinSolver.RegionalYajilinSolver'),
+    ('https://.*gridpuzzle\\.com/renkatsu', 'Run.Games.RenkatsuConfig', 'Domain.Puzzles.Renkatsu.RenkatsuSolver.RenkatsuSolver'),
+    ('https://.*\\.puzzle-futoshiki\\.com/.*renzoku', 'Run.Games.RenzokuConfig', 'Domain.Puzzles.Renzoku.RenzokuSolver.RenzokuSolver'),
+    ('https://.*gridpuzzle\\.com/round-trip', 'Run.Games.RoundTripConfig', 'Domain.Puzzles.RoundTrip.RoundTripSolver.RoundTripSolver'),
+    ('https://.*gridpuzzle\\.com/seethrough', 'Run.Games.SeeThroughConfig', 'Domain.Puzzles.SeeThrough.SeeThroughSolver.SeeThroughSolver'),
+    ('https://.*\\.puzzle-shakashaka\\.com', 'Run.Games.ShakashakaConfig', 'Domain.Puzzles.Shakashaka.ShakashakaSolver.ShakashakaSolver'),
+    ('https://.*\\.puzzle-shikaku\\.com', 'Run.Games.ShikakuConfig', 'Domain.Puzzles.Shikaku.ShikakuSolver.ShikakuSolver'),
+    ('https://.*\\.puzzle-shingoki\\.com', 'Run.Games.ShingokiConfig', 'Domain.Puzzles.Shingoki.ShingokiSolver.ShingokiSolver'),
+    ('https://.*gridpuzzle\\.com/traffic-lights', 'Run.Games.ShingokiConfig', 'Domain.Puzzles.Shingoki.ShingokiSolver.ShingokiSolver'),
+    ('https://.*gridpuzzle\\.com/shirokuro', 'Run.Games.ShirokuroConfig', 'Domain.Puzzles.Shirokuro.ShirokuroSolver.ShirokuroSolver'),
+    ('https://.*\\.puzzle-skyscrapers\\.com', 'Run.Games.SkyscrapersConfig', 'Domain.Puzzles.Skyscrapers.SkyscrapersSolver.SkyscrapersSolver'),
+    ('https://vuqq\\.com/.*skyscrapers/', 'Run.Games.SkyscrapersConfig', 'Domain.Puzzles.Skyscrapers.SkyscrapersSolver.SkyscrapersSolver'),
+    ('https://.*\\.puzzles-mobile\\.com/slant/.*', 'Run.Games.SlantConfig', 'Domain.Puzzles.Slant.SlantSolver.SlantSolver'),
+    ('https://.*\\.puzzle-slant\\.com', 'Run.Games.SlantConfig', 'Domain.Puzzles.Slant.SlantSolver.SlantSolver'),
+    ('https://.*gridpuzzle\\.com/snake', 'Run.Games.SnakeConfig', 'Domain.Puzzles.Snake.SnakeSolver.SnakeSolver'),
+    ('https://.*\\.puzzle-star-battle\\.com', 'Run.Games.StarBattleConfig', 'Domain.Puzzles.StarBattle.StarBattleSolver.StarBattleSolver'),
+    ('https://.*gridpuzzle\\.com/starbattle', 'Run.Games.StarBattleConfig', 'Domain.Puzzles.StarBattle.StarBattleSolver.StarBattleSolver'),
+    ('https://starbattle\\.puzzlebaron\\.com/init2\\.php', 'Run.Games.StarBattleConfig', 'Domain.Puzzles.StarBattle.StarBattleSolver.StarBattleSolver'),
+    ('https://www\\.linkedin\\.com/games/queens', 'Run.Games.StarBattleConfig', 'Domain.Puzzles.StarBattle.StarBattleSolver.StarBattleSolver'),
+    ('https://.*gridpuzzle\\.com/stars-and-arrows', 'Run.Games.StarsAndArrowsConfig', 'Domain.Puzzles.StarsAndArrows.StarsAndArrowsSolver.StarsAndArrowsSolver'),
+    ('https://.*\\.puzzle-stitches\\.com', 'Run.Games.StitchesConfig', 'Domain.Puzzles.Stitches.StitchesSolver.StitchesSolver'),
+    ('https://.*gridpuzzle\\.com/str8ts', 'Run.Games.Str8tsConfig', 'Domain.Puzzles.Str8ts.Str8tsSolver.Str8tsSolver'),
+    ('https://.*\\.puzzle-sudoku\\.com', 'Run.Games.SudokuConfig', 'Domain.Puzzles.Sudoku.Sudoku.SudokuSolver.SudokuSolver'),
+    ('https://escape-sudoku.com/', 'Run.Games.SudokuConfig', 'Domain.Puzzles.Sudoku.Sudoku.SudokuSolver.SudokuSolver'),
+    ('https://.*gridpuzzle\\.com/.*sudoku', 'Run.Games.SudokuConfig', 'Domain.Puzzles.Sudoku.Sudoku.SudokuSolver.SudokuSolver'),
+    ('https://vuqq\\.com/.*sudoku.*', 'Run.Games.SudokuConfig', 'Domain.Puzzles.Sudoku.Sudoku.SudokuSolver.SudokuSolver'),
+    ('https://playsumplete\\.com/', 'Run.Games.SumpleteConfig', 'Domain.Puzzles.Sumplete.SumpleteSolver.SumpleteSolver'),
+    ('https://.*gridpuzzle\\.com/slitherlink', 'Run.Games.SurizaConfig', 'Domain.Puzzles.Suriza.SurizaSolver.SurizaSolver'),
+    ('https://.*\\.puzzle-loop\\.com', 'Run.Games.SurizaConfig', 'Domain.Puzzles.Suriza.SurizaSolver.SurizaSolver'),
+    ('https://.*\\.puzzle-tapa\\.com', 'Run.Games.TapaConfig', 'Domain.Puzzles.Tapa.TapaSolver.TapaSolver'),
+    ('https://.*gridpuzzle\\.com/tasukuea', 'Run.Games.TasukueaConfig', 'Domain.Puzzles.Tasukuea.TasukueaSolver.TasukueaSolver'),
+    ('https://.*gridpuzzle\\.com/tatamibari', 'Run.Games.TatamibariConfig', 'Domain.Puzzles.Tatamibari.TatamibariSolver.TatamibariSolver'),
+    ('https://.*\\.puzzle-galaxies\\.com', 'Run.Games.TentaiShowConfig', 'Domain.Puzzles.TentaiShow.TentaiShowSolver.TentaiShowSolver'),
+    ('https://.*gridpuzzle\\.com/galaxies', 'Run.Games.TentaiShowConfig', 'Domain.Puzzles.TentaiShow.TentaiShowSolver.TentaiShowSolver'),
+    ('https://.*\\.puzzle-tents\\.com', 'Run.Games.TentsConfig', 'Domain.Puzzles.Tents.TentsSolver.TentsSolver'),
+    ('https://vuqq\\.com/.*tents.*', 'Run.Games.TentsConfig', 'Domain.Puzzles.Tents.TentsSolver.TentsSolver'),
+    ('https://campsites\\.puzzlebaron\\.com/init2\\.php', 'Run.Games.TentsConfig', 'Domain.Puzzles.Tents.TentsSolver.TentsSolver'),
+    ('https://.*\\.puzzle-thermometers\\.com', 'Run.Games.ThermometersConfig', 'Domain.Puzzles.Thermometers.ThermometersSolver.ThermometersSolver'),
+    ('https://.*gridpuzzle\\.com/tilepaint', 'Run.Games.TilePaintConfig', 'Domain.Puzzles.TilePaint.TilePaintSolver.TilePaintSolver'),
+    ('https://.*gridpuzzle\\.com/trilogy', 'Run.Games.TrilogyConfig', 'Domain.Puzzles.Trilogy.TrilogySolver.TrilogySolver'),
+    ('https://vectors\\.puzzlebaron\\.com/init2\\.php', 'Run.Games.VectorsConfig', 'Domain.Puzzles.Vectors.VectorsSolver.VectorsSolver'),
+    ('https://.*gridpuzzle\\.com/wamuzu', 'Run.Games.WamazuConfig', 'Domain.Puzzles.Wamuzu.WamazuSolver.WamazuSolver'),
+    ('https://.*gridpuzzle\\.com/yajikabe', 'Run.Games.YajikabeConfig', 'Domain.Puzzles.Yajikabe.YajilkabeSolver.YajikabeSolver'),
+    ('https://.*gridpuzzle\\.com/yajilin', 'Run.Games.YajilinConfig', 'Domain.Puzzles.Yajilin.YajilinSolver.YajilinSolver'),
+    ('https://.*\\.puzzle-yin-yang\\.com', 'Run.Games.YinYangConfig', 'Domain.Puzzles.YinYang.YinYangSolver.YinYangSolver'),
+    ('https://www\\.linkedin\\.com/games/zip', 'Run.Games.ZipConfig', 'Domain.Puzzles.Zip.ZipSolver.ZipSolver'),
+]
@@ -0,0 +1,52 @@
+import importlib
+import os
+import sys
+
+sys.path.append(os.getcwd())
+
+from Run.GameRegistry import GameRegistry
+
+
+class GameManifestGenerator:
+    GAMES_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Games')
+    MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'GameManifest.py')
+
+    @staticmethod
+    def config_modules() -> list[str]:
+        return sorted(f"Run.Games.{file_name[:-3]}" for file_name in os.listdir(GameManifestGenerator.GAMES_DIRECTORY) if file_name.endswith('Config.py'))
+
+    @staticmethod
+    def generate() -> list[tuple[str, str, str]]:
+        previous_registry = GameRegistry._registry
+        GameRegistry._registry = {}
+        manifest = []
+        try:
+            for config_module in GameManifestGenerator.config_modules():
+                registered_patterns = set(GameRegistry._registry)
+                importlib.import_module(config_module).register()
+                for pattern, (solver_class, _, _) in GameRegistry._registry.items():
+                    if pattern not in registered_patterns:
+                        manifest.append((pattern, config_module, f"{solver_class.__module__}.{solver_class.__qualname__}"))
+        finally:
+            GameRegistry._registry = {**previous_registry, **GameRegistry._registry}
+        return manifest
+
+    @staticmethod
+    def render(manifest: list[tuple[str, str, str]]) -> str:
+        lines = [
+            "# Generated by `python Run/GameManifestGenerator.py`, do not edit by hand.",
+            "# Maps each URL pattern to the Run.Games config module registering it and to its solver class.",
+            "GAME_MANIFEST: list[tuple[str, str, str]] = [",
+            *(f"    ({pattern!r}, {config_module!r}, {solver_name!r})," for pattern, config_module, solver_name in manifest),
+            "]",
+        ]
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def write():
+        with open(GameManifestGenerator.MANIFEST_PATH, 'w', encoding='utf-8') as file:
+            file.write(GameManifestGenerator.render(GameManifestGenerator.generate()))
+
+
+if __name__ == '__main__':
+    GameManifestGenerator.write()
@@ -1,28 +1,94 @@
-import re
-from typing import Optional
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import TYPE_CHECKING, Optional
 
 from Domain.Puzzles.GameSolver import GameSolver
-from GridPlayers.Base.GridPlayer import GridPlayer
-from GridProviders.GridProvider import GridProvider
+from Run.BackendStatistics import BackendStatistics
+from Run.UrlDispatcher import UrlDispatcher
+
+if TYPE_CHECKING:
+    from GridPlayers.Base.GridPlayer import GridPlayer
+    from GridProviders.GridProvider import GridProvider
 
 
 class GameRegistry:
     _registry: dict[str, tuple[type[GameSolver], type[GridProvider], type[GridPlayer] | None]] = {}
+    _dispatcher = UrlDispatcher()
+    _lazy_modules: dict[str, str] = {}
+    _solver_modules: dict[str, list[str]] = {}
+    _loaded_modules: set[str] = set()
+    _load_lock = threading.RLock()
+    _backends: dict[type[GameSolver], list[type[GameSolver]]] = {}
+    _symmetry_invariant: set[type[GameSolver]] = set()
+    backend_statistics = BackendStatistics.from_environment()
 
     @classmethod
     def register(cls, url_pattern: str, grid_provider: type[GridProvider], grid_player: type[GridPlayer] | None = None):
         def decorator(solver_class: type[GameSolver]):
+            cls._dispatcher.add(url_pattern)
             cls._registry[url_pattern] = (solver_class, grid_provider, grid_player)
             return solver_class
         return decorator
 
+    @classmethod
+    def register_lazy(cls, url_pattern: str, config_module: str, solver_name: str):
+        cls._dispatcher.add(url_pattern)
+        cls._lazy_modules[url_pattern] = config_module
+        solver_modules = cls._solver_modules.setdefault(solver_name, [])
+        if config_module not in solver_modules:
+            solver_modules.append(config_module)
+
+    @classmethod
+    def load_all(cls):
+        for config_module in dict.fromkeys(cls._lazy_modules.values()):
+            cls._load_module(config_module)
+
     @classmethod
     def get_components_for_url(cls, url: str) -> tuple[type[GameSolver], type[GridProvider], Optional[type[GridPlayer]]]:
-        for pattern, components in cls._registry.items():
-            if re.match(pattern, url):
-                return components
-        raise ValueError(f"No matching pattern found for URL: {url}")
+        pattern = cls._dispatcher.match(url)
+        if pattern is None:
+            raise ValueError(f"No matching pattern found for URL: {url}")
+        if pattern not in cls._registry:
+            cls._load_module(cls._lazy_modules[pattern])
+        return cls._registry[pattern]
+
+    @classmethod
+    def get_all_patterns(cls) -> list[str]:
+        return cls._dispatcher.patterns
+
+    @classmethod
+    def _load_module(cls, config_module: str):
+        with cls._load_lock:
+            if config_module not in cls._loaded_modules:
+                importlib.import_module(config_module).register()
+                cls._loaded_modules.add(config_module)
+
+    @classmethod
+    def _load_solver(cls, solver_class: type[GameSolver]):
+        for config_module in cls._solver_modules.get(f"{solver_class.__module__}.{solver_class.__qualname__}", []):
+            cls._load_module(config_module)
+
+    @classmethod
+    def register_backends(cls, solver_class: type[GameSolver], *alternative_backends: type[GameSolver]):
+        cls._backends[solver_class] = [solver_class, *alternative_backends]
+
+    @classmethod
+    def get_backends(cls, solver_class: type[GameSolver]) -> list[type[GameSolver]]:
+        cls._load_solver(solver_class)
+        return cls._backends.get(solver_class, [solver_class])
+
+    @classmethod
+    def get_preferred_backend(cls, solver_class: type[GameSolver], size: str) -> type[GameSolver]:
+        backend_name = cls.backend_statistics.preferred_backend(solver_class.__name__, size)
+        return next((backend for backend in cls.get_backends(solver_class) if BackendStatistics.backend_name(backend) == backend_name), solver_class)
+
+    @classmethod
+    def register_symmetry_invariant(cls, solver_class: type[GameSolver]):
+        cls._symmetry_invariant.add(solver_class)
 
     @classmethod
-    def get_all_patterns(cls):
-        return cls._registry
+    def is_symmetry_invariant(cls, solver_class: type[GameSolver]) -> bool:
+        cls._load_solver(solver_class)
+        return solver_class in cls._symmetry_invariant
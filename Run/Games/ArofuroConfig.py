@@ -1,4 +1,5 @@
 from Domain.Puzzles.Arofuro.ArofuroSolver import ArofuroSolver
+from Domain.Puzzles.Arofuro.ArofuroSolver_z3 import ArofuroSolver as ArofuroSolverZ3
 from GridPlayers.GridPuzzle.GridPuzzleArofuroPlayer import GridPuzzleArofuroPlayer
 from GridProviders.GridPuzzle.GridPuzzleArofuroGridProvider import GridPuzzleArofuroGridProvider
 from Run.GameRegistry import GameRegistry
@@ -10,3 +11,5 @@ def register():
         GridPuzzleArofuroGridProvider, 
         GridPuzzleArofuroPlayer
     )(ArofuroSolver)
+
+    GameRegistry.register_backends(ArofuroSolver, ArofuroSolverZ3)
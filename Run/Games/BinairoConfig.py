@@ -9,4 +9,6 @@ def register():
         r"https://.*\.puzzle-binairo\.com",
         PuzzleBinairoGridProvider,
         PuzzleBinairoPlayer
-    )(BinairoSolver)
\ No newline at end of file
+    )(BinairoSolver)
+
+    GameRegistry.register_symmetry_invariant(BinairoSolver)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from Domain.Puzzles.Doppelblock.DoppelblockSolver import DoppelblockSolver
+from Domain.Puzzles.Doppelblock.DoppelblockSolverZ3 import DoppelblockSolver as DoppelblockSolverZ3
 from GridPlayers.GridPuzzle.GridPuzzleDoppelblockPlayer import GridPuzzleDoppelblockPlayer
 from GridProviders.GridPuzzle.GridPuzzleDoppelblockGridProvider import GridPuzzleDoppelblockGridProvider
 from Run.GameRegistry import GameRegistry
@@ -9,4 +10,6 @@ def register():
         r"https://.*gridpuzzle\.com/doppelblock", 
         GridPuzzleDoppelblockGridProvider, 
         GridPuzzleDoppelblockPlayer
-    )(DoppelblockSolver)
\ No newline at end of file
+    )(DoppelblockSolver)
+
+    GameRegistry.register_backends(DoppelblockSolver, DoppelblockSolverZ3)
\ No newline at end of file
@@ -17,4 +17,6 @@ def register():
         r"https://vuqq\.com/.*hitori/.*",
         VuqqHitoriGridProvider,
         VuqqHitoriPlayer
-    )(HitoriSolver)
\ No newline at end of file
+    )(HitoriSolver)
+
+    GameRegistry.register_symmetry_invariant(HitoriSolver)
\ No newline at end of file
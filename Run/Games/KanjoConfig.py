@@ -1,4 +1,5 @@
 from Domain.Puzzles.Kanjo.KanjoSolver import KanjoSolver
+from Domain.Puzzles.Kanjo.KanjoSolver_z3 import KanjoSolver as KanjoSolverZ3
 from GridPlayers.GridPuzzle.GridPuzzleKanjoPlayer import GridPuzzleKanjoPlayer
 from GridProviders.GridPuzzle.GridPuzzleKanjoGridProvider import GridPuzzleKanjoGridProvider
 from Run.GameRegistry import GameRegistry
@@ -9,4 +10,6 @@ def register():
         r"https://.*gridpuzzle\.com/kanjo", 
         GridPuzzleKanjoGridProvider, 
         GridPuzzleKanjoPlayer
-    )(KanjoSolver)
\ No newline at end of file
+    )(KanjoSolver)
+
+    GameRegistry.register_backends(KanjoSolver, KanjoSolverZ3)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from Domain.Puzzles.Kurodoko.KurodokoSolver import KurodokoSolver
+from Domain.Puzzles.Kurodoko.KurodokoSolver_z3 import KurodokoSolver as KurodokoSolverZ3
 from GridPlayers.PuzzlesMobile.PuzzleKurodokoPlayer import PuzzleKurodokoPlayer
 from GridProviders.PuzzlesMobile.PuzzleKurodokoGridProvider import PuzzleKurodokoGridProvider
 from Run.GameRegistry import GameRegistry
@@ -16,3 +17,5 @@ def register():
         PuzzleKurodokoGridProvider,
         PuzzleKurodokoPlayer
     )(KurodokoSolver)
+
+    GameRegistry.register_backends(KurodokoSolver, KurodokoSolverZ3)
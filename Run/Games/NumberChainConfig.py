@@ -1,4 +1,5 @@
 from Domain.Puzzles.NumberChain.NumberChainSolver import NumberChainSolver
+from Domain.Puzzles.NumberChain.NumberChainSolverOrTools import NumberChainSolver as NumberChainSolverOrTools
 from GridPlayers.GridPuzzle.GridPuzzleNumberChainPlayer import GridPuzzleNumberChainPlayer
 from GridProviders.GridPuzzle.GridPuzzleNumberChainGridProvider import GridPuzzleNumberChainGridProvider
 from Run.GameRegistry import GameRegistry
@@ -9,4 +10,6 @@ def register():
         r"https://.*gridpuzzle\.com/number-chain", 
         GridPuzzleNumberChainGridProvider, 
         GridPuzzleNumberChainPlayer
-    )(NumberChainSolver)
\ No newline at end of file
+    )(NumberChainSolver)
+
+    GameRegistry.register_backends(NumberChainSolver, NumberChainSolverOrTools)
\ No newline at end of file
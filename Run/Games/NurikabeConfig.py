@@ -9,4 +9,6 @@ def register():
         r"https://.*\.puzzle-nurikabe\.com", 
         PuzzleNurikabeGridProvider, 
         PuzzleNurikabePlayer
-    )(NurikabeSolver)
\ No newline at end of file
+    )(NurikabeSolver)
+
+    GameRegistry.register_symmetry_invariant(NurikabeSolver)
\ No newline at end of file
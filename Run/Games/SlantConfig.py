@@ -1,4 +1,5 @@
 from Domain.Puzzles.Slant.SlantSolver import SlantSolver
+from Domain.Puzzles.Slant.SlantSolver_z3 import SlantSolver as SlantSolverZ3
 from GridPlayers.PuzzlesMobile.PuzzleSlantPlayer import PuzzleSlantPlayer
 from GridProviders.PuzzlesMobile.PuzzleSlantGridProvider import PuzzleSlantGridProvider
 from Run.GameRegistry import GameRegistry
@@ -16,3 +17,5 @@ def register():
         PuzzleSlantGridProvider,
         PuzzleSlantPlayer
     )(SlantSolver)
+
+    GameRegistry.register_backends(SlantSolver, SlantSolverZ3)
@@ -33,4 +33,6 @@ def register():
         r"https://www\.linkedin\.com/games/queens", 
         QueensGridProvider, 
         QueensPlayer
-    )(StarBattleSolver)
\ No newline at end of file
+    )(StarBattleSolver)
+
+    GameRegistry.register_symmetry_invariant(StarBattleSolver)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from Domain.Puzzles.Tatamibari.TatamibariSolver import TatamibariSolver
+from Domain.Puzzles.Tatamibari.TatamibariSolver_z3 import TatamibariSolver as TatamibariSolverZ3
 from GridPlayers.GridPuzzle.GridPuzzleTatamibariPlayer import GridPuzzleTatamibariPlayer
 from GridProviders.GridPuzzle.GridPuzzleTatamibariGridProvider import GridPuzzleTatamibariGridProvider
 from Run.GameRegistry import GameRegistry
@@ -9,4 +10,6 @@ def register():
         r"https://.*gridpuzzle\.com/tatamibari", 
         GridPuzzleTatamibariGridProvider, 
         GridPuzzleTatamibariPlayer
-    )(TatamibariSolver)
\ No newline at end of file
+    )(TatamibariSolver)
+
+    GameRegistry.register_backends(TatamibariSolver, TatamibariSolverZ3)
\ No newline at end of file
@@ -0,0 +1,280 @@
+import bisect
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable
+
+from Domain.Puzzles.GameSolver import GameSolver
+from Run.SolverConfiguration import SolverConfiguration
+
+
+def _run_job(solver_class: type[GameSolver], data_game: Any, configuration: SolverConfiguration, connection: Connection):
+    from Run.GameComponentFactory import GameComponentFactory
+    try:
+        solution = GameComponentFactory.create_solver(solver_class, data_game, configuration).get_solution()
+        connection.send((solution, None))
+    except Exception as e:
+        connection.send((None, repr(e)))
+    finally:
+        connection.close()
+
+
+class LatencyHistogram:
+    BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS):
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+
+    def observe(self, seconds: float):
+        self._counts[bisect.bisect_left(self._buckets, seconds)] += 1
+        self._sum += seconds
+
+    def snapshot(self) -> dict[str, Any]:
+        cumulative_counts = []
+        total = 0
+        for count in self._counts:
+            total += count
+            cumulative_counts.append(total)
+        bucket_names = [str(bucket) for bucket in self._buckets] + ['+Inf']
+        return {'buckets': dict(zip(bucket_names, cumulative_counts)), 'count': total, 'sum': self._sum}
+
+
+@dataclass
+class Job:
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+    TIMED_OUT = 'timed_out'
+    FINISHED_STATUSES = frozenset({SUCCEEDED, FAILED, CANCELLED, TIMED_OUT})
+
+    id: str
+    solver_class: type[GameSolver] | None
+    data_game: Any
+    configuration: SolverConfiguration | None
+    timeout: float | None
+    submitted_at: float
+    on_success: Callable[[Any], None] | None = None
+    status: str = QUEUED
+    result: Any = None
+    error: str | None = None
+    started_at: float | None = None
+    finished_at: float | None = None
+    process: Any = field(default=None, repr=False)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in self.FINISHED_STATUSES
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'id': self.id,
+            'status': self.status,
+            'error': self.error,
+            'timeout': self.timeout,
+            'queued_seconds': None if self.started_at is None else self.started_at - self.submitted_at,
+            'running_seconds': None if self.started_at is None or self.finished_at is None else self.finished_at - self.started_at,
+        }
+
+
+class JobQueueFullError(Exception):
+    pass
+
+
+class JobQueue:
+    def __init__(self, max_workers: int = os.cpu_count() or 1, max_queued_jobs: int = 1000, default_timeout: float | None = None, max_finished_jobs: int = 1000, clock: Callable[[], float] = time.monotonic):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        self._max_workers = max_workers
+        self._max_queued_jobs = max_queued_jobs
+        self._default_timeout = default_timeout
+        self._max_finished_jobs = max_finished_jobs
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._context = multiprocessing.get_context()
+        self._wakeup_reader, self._wakeup_writer = self._context.Pipe(duplex=False)
+        self._connections: dict[str, Connection] = {}
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._queued: OrderedDict[str, Job] = OrderedDict()
+        self._running: dict[str, Job] = {}
+        self._finished_counts = {status: 0 for status in Job.FINISHED_STATUSES}
+        self._queued_latency = LatencyHistogram()
+        self._running_latency = LatencyHistogram()
+        self._scheduler: threading.Thread | None = None
+        self._stopped = False
+
+    @classmethod
+    def from_environment(cls) -> 'JobQueue':
+        default_timeout = os.environ.get('PUZZLE_JOB_TIMEOUT')
+        return cls(
+            max_workers=int(os.environ.get('PUZZLE_JOB_WORKERS', os.cpu_count() or 1)),
+            max_queued_jobs=int(os.environ.get('PUZZLE_JOB_QUEUE_SIZE', 1000)),
+            default_timeout=float(default_timeout) if default_timeout else None,
+        )
+
+    def submit(self, solver_class: type[GameSolver], data_game: Any, configuration: SolverConfiguration, timeout: float | None = None, on_success: Callable[[Any], None] | None = None) -> Job:
+        timeout = self._default_timeout if timeout is None else timeout
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"timeout must be positive, got {timeout}")
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("Job queue is shut down")
+            if len(self._queued) >= self._max_queued_jobs:
+                raise JobQueueFullError(f"Job queue is full ({self._max_queued_jobs} queued jobs)")
+            job = Job(uuid.uuid4().hex, solver_class, data_game, configuration, timeout, self._clock(), on_success)
+            self._jobs[job.id] = job
+            self._queued[job.id] = job
+            self._ensure_scheduler()
+            self._wake_up()
+        return job
+
+    def add_finished(self, result: Any) -> Job:
+        with self._lock:
+            now = self._clock()
+            job = Job(uuid.uuid4().hex, None, None, None, None, now, status=Job.SUCCEEDED, result=result, started_at=now, finished_at=now)
+            self._jobs[job.id] = job
+            self._finished_counts[Job.SUCCEEDED] += 1
+            self._forget_old_jobs()
+            return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Job | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.is_finished:
+                return job
+            self._finish(job, Job.CANCELLED, error="Job was cancelled")
+            self._wake_up()
+        return job
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                'max_workers': self._max_workers,
+                'queue_depth': len(self._queued),
+                'running': len(self._running),
+                'finished': dict(self._finished_counts),
+                'queued_seconds': self._queued_latency.snapshot(),
+                'running_seconds': self._running_latency.snapshot(),
+            }
+
+    def shutdown(self):
+        with self._lock:
+            self._stopped = True
+            for job in list(self._queued.values()) + list(self._running.values()):
+                self._finish(job, Job.CANCELLED, error="Job queue is shut down")
+            self._wake_up()
+            scheduler = self._scheduler
+        if scheduler is not None:
+            scheduler.join()
+
+    def _ensure_scheduler(self):
+        if self._scheduler is None:
+            self._scheduler = threading.Thread(target=self._schedule, name='JobQueueScheduler', daemon=True)
+            self._scheduler.start()
+
+    def _wake_up(self):
+        self._wakeup_writer.send_bytes(b'')
+
+    def _schedule(self):
+        while True:
+            with self._lock:
+                self._close_finished_connections()
+                if self._stopped:
+                    return
+                self._start_queued_jobs()
+                wait_seconds = self._expire_running_jobs()
+                connections = {connection: job_id for job_id, connection in self._connections.items()}
+            for connection in wait([self._wakeup_reader, *connections], timeout=wait_seconds):
+                if connection is self._wakeup_reader:
+                    while self._wakeup_reader.poll():
+                        self._wakeup_reader.recv_bytes()
+                    continue
+                try:
+                    result, error = connection.recv()
+                except (EOFError, OSError):
+                    result, error = None, "Solver process exited without a result"
+                self._complete(connections[connection], result, error)
+
+    def _close_finished_connections(self):
+        for job_id, connection in list(self._connections.items()):
+            if self._jobs.get(job_id) is None or self._jobs[job_id].is_finished:
+                connection.close()
+                del self._connections[job_id]
+
+    def _start_queued_jobs(self):
+        while self._queued and len(self._running) < self._max_workers:
+            _, job = self._queued.popitem(last=False)
+            reader, writer = self._context.Pipe(duplex=False)
+            job.process = self._context.Process(target=_run_job, args=(job.solver_class, job.data_game, job.configuration, writer), daemon=True)
+            job.process.start()
+            writer.close()
+            self._connections[job.id] = reader
+            job.status = Job.RUNNING
+            job.started_at = self._clock()
+            self._running[job.id] = job
+            self._queued_latency.observe(job.started_at - job.submitted_at)
+
+    def _expire_running_jobs(self) -> float | None:
+        now = self._clock()
+        wait_seconds = None
+        for job in list(self._running.values()):
+            if job.timeout is None:
+                continue
+            if now - job.started_at >= job.timeout:
+                self._finish(job, Job.TIMED_OUT, error=f"Job exceeded its {job.timeout}s timeout")
+            else:
+                remaining_seconds = job.started_at + job.timeout - now
+                wait_seconds = remaining_seconds if wait_seconds is None else min(wait_seconds, remaining_seconds)
+        return wait_seconds
+
+    def _complete(self, job_id: str, result: Any, error: str | None):
+        with self._lock:
+            job = self._running.get(job_id)
+        if job is None:
+            return
+        if error is None and job.on_success is not None:
+            try:
+                job.on_success(result)
+            except Exception as e:
+                error = repr(e)
+        with self._lock:
+            if job.is_finished:
+                return
+            if error is not None:
+                self._finish(job, Job.FAILED, error=error)
+            else:
+                self._finish(job, Job.SUCCEEDED, result=result)
+
+    def _finish(self, job: Job, status: str, result: Any = None, error: str | None = None):
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = self._clock()
+        self._queued.pop(job.id, None)
+        if self._running.pop(job.id, None) is not None:
+            self._running_latency.observe(job.finished_at - job.started_at)
+        if job.process is not None:
+            if job.process.is_alive():
+                job.process.terminate()
+            job.process.join()
+            job.process = None
+        job.data_game = None
+        self._finished_counts[status] += 1
+        self._forget_old_jobs()
+
+    def _forget_old_jobs(self):
+        finished_ids = [job_id for job_id, job in self._jobs.items() if job.is_finished]
+        for job_id in finished_ids[:max(len(finished_ids) - self._max_finished_jobs, 0)]:
+            del self._jobs[job_id]
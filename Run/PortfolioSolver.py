@@ -0,0 +1,77 @@
+import multiprocessing
+import queue
+import time
+from dataclasses import replace
+from typing import Any
+
+from Domain.Board.Grid import Grid
+from Domain.Puzzles.GameSolver import GameSolver
+from Run.BackendStatistics import BackendStatistics
+from Run.SolverConfiguration import SolverConfiguration
+
+
+def _solve_with_backend(index: int, backend: type[GameSolver], data_game: Any, configuration: SolverConfiguration, results):
+    from Run.GameComponentFactory import GameComponentFactory
+    try:
+        solution = GameComponentFactory.create_solver(backend, data_game, configuration).get_solution()
+        results.put((index, solution, None))
+    except Exception as e:
+        results.put((index, None, repr(e)))
+
+
+class PortfolioSolver(GameSolver):
+    def __init__(self, backends: list[type[GameSolver]], data_game: Any, configuration: SolverConfiguration, statistics: BackendStatistics | None = None):
+        if len(backends) < 2:
+            raise ValueError("A portfolio needs at least two backends")
+        self._backends = backends
+        self._data_game = data_game
+        self._configuration = replace(configuration, backend=None)
+        self._statistics = statistics
+        self._winner_solver: GameSolver | None = None
+        self.winner: type[GameSolver] | None = None
+        self.errors: dict[str, str] = {}
+
+    def get_solution(self) -> Grid:
+        context = multiprocessing.get_context()
+        results = context.Queue()
+        processes = [context.Process(target=_solve_with_backend, args=(index, backend, self._data_game, self._configuration, results), daemon=True) for index, backend in enumerate(self._backends)]
+        for process in processes:
+            process.start()
+        deadline = None if self._configuration.max_time_in_seconds is None else time.monotonic() + self._configuration.max_time_in_seconds
+        try:
+            for _ in processes:
+                try:
+                    index, solution, error = results.get(timeout=None if deadline is None else max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if error is not None:
+                    self.errors[BackendStatistics.backend_name(self._backends[index])] = error
+                elif self._is_solution(solution):
+                    self._record_winner(self._backends[index])
+                    return solution
+            return Grid.empty()
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+    def get_other_solution(self) -> Grid:
+        if self.winner is None:
+            return self.get_solution()
+        if self._winner_solver is None:
+            from Run.GameComponentFactory import GameComponentFactory
+            self._winner_solver = GameComponentFactory.create_solver(self.winner, self._data_game, self._configuration)
+            self._winner_solver.get_solution()
+        return self._winner_solver.get_other_solution()
+
+    def _record_winner(self, backend: type[GameSolver]):
+        self.winner = backend
+        if self._statistics is not None:
+            self._statistics.record_win(self._backends[0].__name__, BackendStatistics.size_key(self._data_game), BackendStatistics.backend_name(backend))
+
+    @staticmethod
+    def _is_solution(solution) -> bool:
+        if solution is None:
+            return False
+        return not (hasattr(solution, 'is_empty') and solution.is_empty())
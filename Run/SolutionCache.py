@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from Domain.Puzzles.GameSolver import GameSolver
+
+
+class SolutionCache:
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float | None = None, path: str | None = None, max_disk_entries: int = 100_000, clock: Callable[[], float] = time.time):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._path = path
+        self._max_disk_entries = max_disk_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._counters = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'expirations': 0}
+        self._connection: sqlite3.Connection | None = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute("CREATE TABLE IF NOT EXISTS solutions (key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS solutions_accessed ON solutions (accessed)")
+            self._connection.commit()
+
+    @classmethod
+    def from_environment(cls) -> 'SolutionCache':
+        ttl_seconds = os.environ.get('PUZZLE_CACHE_TTL')
+        return cls(
+            max_entries=int(os.environ.get('PUZZLE_CACHE_SIZE', 1024)),
+            ttl_seconds=float(ttl_seconds) if ttl_seconds else None,
+            path=os.environ.get('PUZZLE_CACHE_PATH') or None,
+            max_disk_entries=int(os.environ.get('PUZZLE_CACHE_DISK_SIZE', 100_000)),
+        )
+
+    @staticmethod
+    def key(solver_class: type[GameSolver], game_input: Any, extra_data: Any = None) -> str:
+        payload = {'solver': f"{solver_class.__module__}.{solver_class.__qualname__}", 'input': game_input, 'extra_data': extra_data or []}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str).encode()).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            if entry is not None:
+                created, value = entry
+                if not self._is_expired(created, now):
+                    self._entries.move_to_end(key)
+                    self._counters['memory_hits'] += 1
+                    return value
+                del self._entries[key]
+                self._counters['expirations'] += 1
+            if self._connection is not None:
+                value = self._get_from_disk(key, now)
+                if value is not None:
+                    self._counters['disk_hits'] += 1
+                    return value
+            self._counters['misses'] += 1
+            return None
+
+    def put(self, key: str, value: Any):
+        with self._lock:
+            now = self._clock()
+            self._store_in_memory(key, now, value)
+            if self._connection is not None:
+                self._connection.execute("INSERT OR REPLACE INTO solutions (key, value, created, accessed) VALUES (?, ?, ?, ?)", (key, json.dumps(value, default=str), now, now))
+                self._evict_from_disk()
+                self._connection.commit()
+            self._counters['stores'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM solutions")
+                self._connection.commit()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._counters['memory_hits'] + self._counters['disk_hits'] + self._counters['misses']
+            hits = self._counters['memory_hits'] + self._counters['disk_hits']
+            stats = {**self._counters, 'hits': hits, 'hit_rate': hits / lookups if lookups else 0.0, 'memory_entries': len(self._entries), 'max_entries': self._max_entries, 'ttl_seconds': self._ttl_seconds}
+            if self._connection is not None:
+                stats['disk_entries'] = self._connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+                stats['max_disk_entries'] = self._max_disk_entries
+            return stats
+
+    def _is_expired(self, created: float, now: float) -> bool:
+        return self._ttl_seconds is not None and now - created > self._ttl_seconds
+
+    def _store_in_memory(self, key: str, created: float, value: Any):
+        self._entries[key] = (created, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._counters['evictions'] += 1
+
+    def _get_from_disk(self, key: str, now: float) -> Any | None:
+        row = self._connection.execute("SELECT value, created FROM solutions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        serialized_value, created = row
+        if self._is_expired(created, now):
+            self._connection.execute("DELETE FROM solutions WHERE key = ?", (key,))
+            self._connection.commit()
+            self._counters['expirations'] += 1
+            return None
+        self._connection.execute("UPDATE solutions SET accessed = ? WHERE key = ?", (now, key))
+        self._connection.commit()
+        value = json.loads(serialized_value)
+        self._store_in_memory(key, created, value)
+        return value
+
+    def _evict_from_disk(self):
+        excess = self._connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0] - self._max_disk_entries
+        if excess > 0:
+            self._connection.execute("DELETE FROM solutions WHERE key IN (SELECT key FROM solutions ORDER BY accessed LIMIT ?)", (excess,))
+            self._counters['evictions'] += excess
@@ -0,0 +1,94 @@
+import os
+from dataclasses import dataclass, fields, replace
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from Domain.Puzzles.GameSolver import GameSolver
+
+if TYPE_CHECKING:
+    from ortools.sat.python import cp_model
+
+
+@dataclass(frozen=True)
+class SolverConfiguration:
+    num_workers: int = os.cpu_count() or 1
+    max_time_in_seconds: float | None = None
+    random_seed: int | None = None
+    profile: str | None = None
+    backend: str | None = None
+
+    ENVIRONMENT_VARIABLES: ClassVar[dict[str, str]] = {
+        'num_workers': 'PUZZLE_SOLVER_WORKERS',
+        'max_time_in_seconds': 'PUZZLE_SOLVER_TIME_LIMIT',
+        'random_seed': 'PUZZLE_SOLVER_SEED',
+        'profile': 'PUZZLE_SOLVER_PROFILE',
+        'backend': 'PUZZLE_SOLVER_BACKEND',
+    }
+    BACKEND_MODES: ClassVar[set[str]] = {'portfolio', 'learned'}
+    PROFILES: ClassVar[dict[str, dict[str, Any]]] = {
+        'default': {},
+        'loop': {'linearization_level': 2},
+        'single_thread': {'num_workers': 1},
+    }
+    FAMILY_PROFILES: ClassVar[dict[str, str]] = {
+        'DetourSolver': 'loop',
+        'HashiSolver': 'loop',
+        'KoburinSolver': 'loop',
+        'MasyuSolver': 'loop',
+        'PipesSolver': 'loop',
+        'SurizaSolver': 'loop',
+    }
+
+    def __post_init__(self):
+        if self.num_workers < 1:
+            raise ValueError(f"num_workers must be positive, got {self.num_workers}")
+        if self.max_time_in_seconds is not None and self.max_time_in_seconds <= 0:
+            raise ValueError(f"max_time_in_seconds must be positive, got {self.max_time_in_seconds}")
+        if self.profile is not None and self.profile not in self.PROFILES:
+            raise ValueError(f"Unknown solver profile: {self.profile}")
+        if self.backend is not None and self.backend not in self.BACKEND_MODES:
+            raise ValueError(f"Unknown backend mode: {self.backend}")
+
+    @classmethod
+    def from_environment(cls) -> 'SolverConfiguration':
+        return cls().merged_with({name: os.environ[variable] for name, variable in cls.ENVIRONMENT_VARIABLES.items() if os.environ.get(variable)})
+
+    def merged_with(self, overrides: dict[str, Any] | None) -> 'SolverConfiguration':
+        if not overrides:
+            return self
+        types = {field.name: field.type for field in fields(self)}
+        unknown_names = set(overrides) - set(types)
+        if unknown_names:
+            raise ValueError(f"Unknown solver configuration fields: {', '.join(sorted(unknown_names))}")
+        return replace(self, **{name: self._parse(types[name], value) for name, value in overrides.items()})
+
+    @staticmethod
+    def _parse(field_type, value: Any) -> Any:
+        if value is None or field_type == str | None:
+            return value
+        if field_type == float | None:
+            return float(value)
+        return int(value)
+
+    def profile_for(self, solver_class: type[GameSolver]) -> str:
+        if self.profile is not None:
+            return self.profile
+        return self.FAMILY_PROFILES.get(solver_class.__name__, 'default')
+
+    def apply(self, game_solver: GameSolver) -> GameSolver:
+        from ortools.sat.python import cp_model
+        for value in vars(game_solver).values():
+            if isinstance(value, cp_model.CpSolver):
+                self.configure(value, type(game_solver))
+        return game_solver
+
+    def configure(self, cp_solver: 'cp_model.CpSolver', solver_class: type[GameSolver]):
+        parameters = cp_solver.parameters
+        profile_parameters = self.PROFILES[self.profile_for(solver_class)]
+        for name, value in profile_parameters.items():
+            setattr(parameters, name, value)
+        if 'num_workers' not in profile_parameters:
+            parameters.num_workers = self.num_workers
+        if self.max_time_in_seconds is not None:
+            parameters.max_time_in_seconds = self.max_time_in_seconds
+        if self.random_seed is not None:
+            parameters.random_seed = self.random_seed
@@ -0,0 +1,98 @@
+import re
+from re import _constants as constants, _parser as parser
+
+
+class AmbiguousUrlPatternError(ValueError):
+    pass
+
+
+class UrlDispatcher:
+    """Ordered URL patterns compiled into a single alternation; a pattern that only matches a subset of an earlier one is moved ahead of it."""
+
+    _CATEGORY_CHARACTERS = {
+        constants.CATEGORY_DIGIT: '0', constants.CATEGORY_NOT_DIGIT: 'a',
+        constants.CATEGORY_WORD: 'a', constants.CATEGORY_NOT_WORD: '-',
+        constants.CATEGORY_SPACE: ' ', constants.CATEGORY_NOT_SPACE: 'a',
+    }
+
+    def __init__(self, max_cached_urls: int = 4096):
+        self._patterns: list[str] = []
+        self._example_urls: dict[str, str | None] = {}
+        self._compiled: re.Pattern | None = None
+        self._max_cached_urls = max_cached_urls
+        self._cached_urls: dict[str, str | None] = {}
+
+    @property
+    def patterns(self) -> list[str]:
+        return list(self._patterns)
+
+    def add(self, pattern: str):
+        if pattern in self._example_urls:
+            return
+        example_url = self.example_url(pattern)
+        shadowing_indexes = [index for index, existing in enumerate(self._patterns) if example_url is not None and re.match(existing, example_url)]
+        shadowed_indexes = [index for index, existing in enumerate(self._patterns) if self._example_urls[existing] is not None and re.match(pattern, self._example_urls[existing])]
+        if set(shadowing_indexes) & set(shadowed_indexes):
+            overlapping_pattern = self._patterns[min(set(shadowing_indexes) & set(shadowed_indexes))]
+            raise AmbiguousUrlPatternError(f"URL pattern {pattern!r} is ambiguous with {overlapping_pattern!r}")
+        insert_index = min(shadowing_indexes, default=len(self._patterns))
+        if any(index >= insert_index for index in shadowed_indexes):
+            raise AmbiguousUrlPatternError(f"URL pattern {pattern!r} must precede {self._patterns[insert_index]!r} but follow {self._patterns[max(shadowed_indexes)]!r}")
+        self._patterns.insert(insert_index, pattern)
+        self._example_urls[pattern] = example_url
+        self._compiled = None
+        self._cached_urls.clear()
+
+    def match(self, url: str) -> str | None:
+        try:
+            return self._cached_urls[url]
+        except KeyError:
+            pass
+        if self._compiled is None:
+            self._compiled = re.compile('|'.join(f'(?P<p{index}>{pattern})' for index, pattern in enumerate(self._patterns)))
+        match = self._compiled.match(url)
+        pattern = None if match is None else self._patterns[int(match.lastgroup[1:])]
+        if len(self._cached_urls) >= self._max_cached_urls:
+            self._cached_urls.clear()
+        self._cached_urls[url] = pattern
+        return pattern
+
+    @classmethod
+    def example_url(cls, pattern: str) -> str | None:
+        try:
+            example_url = cls._example(parser.parse(pattern))
+        except (KeyError, ValueError, re.error):
+            return None
+        return example_url if re.match(pattern, example_url) else None
+
+    @classmethod
+    def _example(cls, items) -> str:
+        parts = []
+        for operation, argument in items:
+            if operation is constants.LITERAL:
+                parts.append(chr(argument))
+            elif operation is constants.ANY:
+                parts.append('a')
+            elif operation in (constants.MAX_REPEAT, constants.MIN_REPEAT):
+                parts.append(cls._example(argument[2]) * argument[0])
+            elif operation is constants.SUBPATTERN:
+                parts.append(cls._example(argument[3]))
+            elif operation is constants.BRANCH:
+                parts.append(cls._example(argument[1][0]))
+            elif operation is constants.IN:
+                parts.append(cls._example_character(*argument[0]))
+            elif operation is constants.CATEGORY:
+                parts.append(cls._CATEGORY_CHARACTERS[argument])
+            elif operation not in (constants.AT, constants.ASSERT, constants.ASSERT_NOT):
+                raise ValueError(f"Unsupported regular expression operation: {operation}")
+        return ''.join(parts)
+
+    @classmethod
+    def _example_character(cls, operation, argument) -> str:
+        if operation is constants.LITERAL:
+            return chr(argument)
+        if operation is constants.RANGE:
+            return chr(argument[0])
+        if operation is constants.CATEGORY:
+            return cls._CATEGORY_CHARACTERS[argument]
+        raise ValueError(f"Unsupported character set operation: {operation}")
@@ -0,0 +1,56 @@
+import unittest
+from unittest import TestCase
+
+from Domain.Board.Grid import Grid
+from Domain.Puzzles.GameSolver import GameSolver
+from Domain.Puzzles.Sudoku.Sudoku.SudokuSolver import SudokuSolver
+from Run.BatchSolver import BatchSolver
+from Run.SolverConfiguration import SolverConfiguration
+
+_ = SudokuSolver.empty
+
+
+class FailingSolver(GameSolver):
+    def __init__(self, grid: Grid):
+        pass
+
+    def get_solution(self) -> Grid:
+        raise ValueError("failing solver")
+
+    def get_other_solution(self) -> Grid:
+        return Grid.empty()
+
+
+class BatchSolverTests(TestCase):
+    def setUp(self):
+        self.configuration = SolverConfiguration(num_workers=1)
+        self.grid = Grid([
+            [_, 3, _, 4],
+            [2, _, 1, _],
+            [_, 2, _, 1],
+            [3, _, 4, _],
+        ])
+
+    def test_every_task_gets_a_result(self):
+        tasks = [(index, SudokuSolver, self.grid, self.configuration) for index in range(5)]
+        tasks.append(('failing', FailingSolver, self.grid, self.configuration))
+        results = {key: (solution, error) for key, solution, error, seconds in BatchSolver(max_workers=2, chunk_size=2).solve(tasks)}
+
+        self.assertEqual({0, 1, 2, 3, 4, 'failing'}, set(results))
+        for index in range(5):
+            solution, error = results[index]
+            self.assertIsNone(error)
+            self.assertEqual([[1, 3, 2, 4], [2, 4, 1, 3], [4, 2, 3, 1], [3, 1, 4, 2]], solution.matrix)
+        self.assertIn('failing solver', results['failing'][1])
+
+    def test_tasks_are_chunked_by_solver_class(self):
+        tasks = [(0, SudokuSolver, None, None), (1, FailingSolver, None, None), (2, SudokuSolver, None, None), (3, SudokuSolver, None, None)]
+        chunks = BatchSolver(chunk_size=2)._chunks_by_solver_class(tasks)
+        self.assertEqual([(SudokuSolver, [0, 2]), (SudokuSolver, [3]), (FailingSolver, [1])], [(solver_class, [key for key, _, _ in chunk]) for solver_class, chunk in chunks])
+
+    def test_empty_batch(self):
+        self.assertEqual([], list(BatchSolver().solve([])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import os
+import re
+import subprocess
+import sys
+import unittest
+from unittest import TestCase
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class GameManifestLongTests(TestCase):
+    @staticmethod
+    def _cold_import_seconds(script: str, working_directory: str = ROOT_DIRECTORY) -> float:
+        environment = {**os.environ, 'PYTHONPATH': ROOT_DIRECTORY}
+        stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', script], capture_output=True, text=True, check=True, cwd=working_directory, env=environment).stderr
+        top_level_imports = re.findall(r"^import time:\s+\d+ \|\s+(\d+) \| \S", stderr, re.MULTILINE)
+        return sum(int(microseconds) for microseconds in top_level_imports) / 1e6
+
+    def _assert_lazy_start_is_faster(self, name: str, import_script: str, working_directory: str = ROOT_DIRECTORY):
+        lazy_seconds = self._cold_import_seconds(import_script, working_directory)
+        eager_seconds = self._cold_import_seconds(f"{import_script}\nfrom Run.GameRegistry import GameRegistry\nfrom Run.UrlPatternMatcher import UrlPatternMatcher\nUrlPatternMatcher()\nGameRegistry.load_all()", working_directory)
+        print(f"{name}: lazy registry {lazy_seconds:.2f}s, all games loaded {eager_seconds:.2f}s")
+        self.assertLess(lazy_seconds, eager_seconds)
+
+    def test_api_cold_start(self):
+        self._assert_lazy_start_is_faster("Api/app.py", "import Api.app")
+
+    def test_console_cold_start(self):
+        self._assert_lazy_start_is_faster("Run/PuzzleMainConsole.py", "import PuzzleMainConsole", os.path.join(ROOT_DIRECTORY, 'Run'))
+
+
+if __name__ == '__main__':
+    unittest.main()
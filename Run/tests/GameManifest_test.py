@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+import unittest
+from unittest import TestCase
+
+from Domain.Puzzles.Slant.SlantSolver import SlantSolver
+from Domain.Puzzles.Slant.SlantSolver_z3 import SlantSolver as SlantSolverZ3
+from Run.GameManifest import GAME_MANIFEST
+from Run.GameManifestGenerator import GameManifestGenerator
+from Run.GameRegistry import GameRegistry
+from Run.UrlPatternMatcher import UrlPatternMatcher
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class GameManifestTests(TestCase):
+    def test_manifest_is_up_to_date(self):
+        self.assertEqual(GameManifestGenerator.generate(), GAME_MANIFEST, "Run/GameManifest.py is stale, run `python Run/GameManifestGenerator.py`")
+
+    def test_registry_lists_every_manifest_pattern(self):
+        UrlPatternMatcher()
+        self.assertEqual(sorted(pattern for pattern, _, _ in GAME_MANIFEST), sorted(GameRegistry.get_all_patterns()))
+
+    def test_solver_lookups_load_their_config(self):
+        UrlPatternMatcher()
+        self.assertEqual([SlantSolver, SlantSolverZ3], GameRegistry.get_backends(SlantSolver))
+
+    def test_config_modules_are_imported_on_first_match(self):
+        script = (
+            "import sys\n"
+            "from Run.UrlPatternMatcher import UrlPatternMatcher\n"
+            "matcher = UrlPatternMatcher()\n"
+            "loaded_before = [name for name in sys.modules if name.startswith('Run.Games.')]\n"
+            "solver_class = matcher.get_components_for_url('https://www.puzzle-sudoku.com/')[0]\n"
+            "loaded_after = [name for name in sys.modules if name.startswith('Run.Games.')]\n"
+            "print(loaded_before, loaded_after, solver_class.__name__, 'z3' in sys.modules)\n"
+        )
+        environment = {**os.environ, 'PYTHONPATH': ROOT_DIRECTORY}
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True, cwd=ROOT_DIRECTORY, env=environment).stdout.strip()
+        self.assertEqual("[] ['Run.Games.SudokuConfig'] SudokuSolver False", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
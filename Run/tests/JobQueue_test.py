@@ -0,0 +1,108 @@
+import time
+import unittest
+from unittest import TestCase
+
+from Domain.Board.Grid import Grid
+from Domain.Puzzles.GameSolver import GameSolver
+from Domain.Puzzles.Sudoku.Sudoku.SudokuSolver import SudokuSolver
+from Run.JobQueue import Job, JobQueue, JobQueueFullError, LatencyHistogram
+from Run.SolverConfiguration import SolverConfiguration
+
+_ = SudokuSolver.empty
+
+
+class SleepingSolver(GameSolver):
+    def __init__(self, seconds: float):
+        self._seconds = seconds
+
+    def get_solution(self) -> Grid:
+        time.sleep(self._seconds)
+        return Grid([[1]])
+
+    def get_other_solution(self) -> Grid:
+        return Grid.empty()
+
+
+class FailingSolver(GameSolver):
+    def __init__(self, grid: Grid):
+        pass
+
+    def get_solution(self) -> Grid:
+        raise ValueError("failing solver")
+
+    def get_other_solution(self) -> Grid:
+        return Grid.empty()
+
+
+class JobQueueTests(TestCase):
+    def setUp(self):
+        self.configuration = SolverConfiguration(num_workers=1)
+        self.job_queue = JobQueue(max_workers=1, max_queued_jobs=2)
+
+    def tearDown(self):
+        self.job_queue.shutdown()
+
+    def wait_until_finished(self, job: Job, timeout: float = 20) -> Job:
+        deadline = time.monotonic() + timeout
+        while not job.is_finished and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return job
+
+    def test_job_is_solved_in_worker_process(self):
+        grid = Grid([
+            [_, 3, _, 4],
+            [2, _, 1, _],
+            [_, 2, _, 1],
+            [3, _, 4, _],
+        ])
+        successes = []
+        job = self.job_queue.submit(SudokuSolver, grid, self.configuration, on_success=successes.append)
+        self.wait_until_finished(job)
+        self.assertEqual(Job.SUCCEEDED, job.status)
+        self.assertEqual([[1, 3, 2, 4], [2, 4, 1, 3], [4, 2, 3, 1], [3, 1, 4, 2]], job.result.matrix)
+        self.assertEqual([job.result], successes)
+        self.assertEqual(1, self.job_queue.metrics()['running_seconds']['count'])
+
+    def test_solver_error_fails_the_job(self):
+        job = self.wait_until_finished(self.job_queue.submit(FailingSolver, Grid([[0]]), self.configuration))
+        self.assertEqual(Job.FAILED, job.status)
+        self.assertIn('failing solver', job.error)
+
+    def test_job_exceeding_timeout_is_stopped(self):
+        job = self.wait_until_finished(self.job_queue.submit(SleepingSolver, 30, self.configuration, timeout=0.2))
+        self.assertEqual(Job.TIMED_OUT, job.status)
+        self.assertLess(job.finished_at - job.started_at, 5)
+
+    def test_jobs_wait_for_a_free_worker_and_can_be_cancelled(self):
+        running_job = self.job_queue.submit(SleepingSolver, 30, self.configuration)
+        queued_job = self.job_queue.submit(SleepingSolver, 30, self.configuration)
+        deadline = time.monotonic() + 10
+        while running_job.status != Job.RUNNING and time.monotonic() < deadline:
+            time.sleep(0.01)
+        metrics = self.job_queue.metrics()
+        self.assertEqual((1, 1), (metrics['running'], metrics['queue_depth']))
+        self.assertEqual(Job.QUEUED, queued_job.status)
+
+        self.job_queue.cancel(queued_job.id)
+        self.job_queue.cancel(running_job.id)
+        self.assertEqual((Job.CANCELLED, Job.CANCELLED), (running_job.status, queued_job.status))
+        self.assertIsNone(running_job.process)
+        metrics = self.job_queue.metrics()
+        self.assertEqual((0, 0, 2), (metrics['running'], metrics['queue_depth'], metrics['finished'][Job.CANCELLED]))
+
+    def test_full_queue_rejects_jobs(self):
+        self.job_queue._ensure_scheduler = lambda: None
+        for _ in range(2):
+            self.job_queue.submit(SleepingSolver, 30, self.configuration)
+        with self.assertRaises(JobQueueFullError):
+            self.job_queue.submit(SleepingSolver, 30, self.configuration)
+
+    def test_latency_histogram_is_cumulative(self):
+        histogram = LatencyHistogram((1.0, 10.0))
+        for seconds in (0.5, 1.0, 2.0, 20.0):
+            histogram.observe(seconds)
+        self.assertEqual({'buckets': {'1.0': 2, '10.0': 3, '+Inf': 4}, 'count': 4, 'sum': 23.5}, histogram.snapshot())
+
+
+if __name__ == '__main__':
+    unittest.main()
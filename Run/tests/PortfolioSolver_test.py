@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+from Domain.Board.Grid import Grid
+from Domain.Puzzles.GameSolver import GameSolver
+from Domain.Puzzles.Slant.SlantSolver import SlantSolver
+from Domain.Puzzles.Slant.SlantSolver_z3 import SlantSolver as SlantSolverZ3
+from Run.BackendStatistics import BackendStatistics
+from Run.GameComponentFactory import GameComponentFactory
+from Run.GameRegistry import GameRegistry
+from Run.PortfolioSolver import PortfolioSolver
+from Run.SolverConfiguration import SolverConfiguration
+from Run.UrlPatternMatcher import UrlPatternMatcher
+
+_ = SlantSolver.empty
+
+
+class FailingSolver(GameSolver):
+    def __init__(self, grid: Grid):
+        pass
+
+    def get_solution(self) -> Grid:
+        raise ValueError("failing backend")
+
+    def get_other_solution(self) -> Grid:
+        raise ValueError("failing backend")
+
+
+class PortfolioSolverTests(TestCase):
+    def setUp(self):
+        self.grid = Grid([
+            [1, 1, 1, _, 2, _],
+            [_, _, 2, 2, _, _],
+            [_, 2, 2, _, _, 1],
+            [0, 3, 2, 3, _, 1],
+            [_, _, _, _, 1, _],
+            [_, 1, 2, _, _, _],
+        ])
+        self.expected_solution_str = (
+            '╲╲╲╱╲\n'
+            '╲╲╲╱╲\n'
+            '╲╲╲╱╲\n'
+            '╱╲╲╲╲\n'
+            '╲╲╱╲╱\n'
+        )
+
+    def test_first_solution_is_returned_and_winner_recorded(self):
+        statistics = BackendStatistics()
+        solver = PortfolioSolver([SlantSolver, SlantSolverZ3], self.grid, SolverConfiguration(num_workers=1), statistics)
+        solution = solver.get_solution()
+        self.assertEqual(self.expected_solution_str, str(solution))
+        self.assertIn(solver.winner, [SlantSolver, SlantSolverZ3])
+        self.assertEqual({'6x6': {BackendStatistics.backend_name(solver.winner): 1}}, statistics.wins('SlantSolver'))
+
+    def test_failing_backend_is_ignored(self):
+        solver = PortfolioSolver([FailingSolver, SlantSolver], self.grid, SolverConfiguration(num_workers=1))
+        self.assertEqual(self.expected_solution_str, str(solver.get_solution()))
+        self.assertIs(SlantSolver, solver.winner)
+        self.assertIn('failing backend', solver.errors[BackendStatistics.backend_name(FailingSolver)])
+
+    def test_other_solution_uses_winner(self):
+        solver = PortfolioSolver([SlantSolver, SlantSolverZ3], self.grid, SolverConfiguration(num_workers=1))
+        solver.get_solution()
+        self.assertEqual(Grid.empty(), solver.get_other_solution())
+
+    def test_portfolio_needs_two_backends(self):
+        with self.assertRaises(ValueError):
+            PortfolioSolver([SlantSolver], self.grid, SolverConfiguration())
+
+    def test_factory_creates_portfolio_for_games_with_several_backends(self):
+        UrlPatternMatcher()
+        self.assertEqual([SlantSolver, SlantSolverZ3], GameRegistry.get_backends(SlantSolver))
+        solver = GameComponentFactory.create_solver(SlantSolver, self.grid, SolverConfiguration(backend='portfolio'))
+        self.assertIsInstance(solver, PortfolioSolver)
+
+
+class BackendStatisticsTests(TestCase):
+    def test_preferred_backend_by_size_then_overall(self):
+        statistics = BackendStatistics()
+        statistics.record_win('SlantSolver', '5x5', 'SlantSolver')
+        statistics.record_win('SlantSolver', '10x10', 'SlantSolver_z3')
+        statistics.record_win('SlantSolver', '10x10', 'SlantSolver_z3')
+        self.assertEqual('SlantSolver', statistics.preferred_backend('SlantSolver', '5x5'))
+        self.assertEqual('SlantSolver_z3', statistics.preferred_backend('SlantSolver', '10x10'))
+        self.assertEqual('SlantSolver_z3', statistics.preferred_backend('SlantSolver', '20x20'))
+        self.assertIsNone(statistics.preferred_backend('KanjoSolver', '5x5'))
+
+    def test_statistics_are_persisted(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'backends.json')
+            BackendStatistics(path).record_win('SlantSolver', '5x5', 'SlantSolver_z3')
+            self.assertEqual({'5x5': {'SlantSolver_z3': 1}}, BackendStatistics(path).wins('SlantSolver'))
+
+    def test_learned_backend_is_used_by_factory(self):
+        UrlPatternMatcher()
+        previous_statistics = GameRegistry.backend_statistics
+        GameRegistry.backend_statistics = BackendStatistics()
+        try:
+            GameRegistry.backend_statistics.record_win('SlantSolver', '6x6', 'SlantSolver_z3')
+            solver = GameComponentFactory.create_solver(SlantSolver, Grid([[_] * 6 for _ in range(6)]), SolverConfiguration(backend='learned'))
+            self.assertIsInstance(solver, SlantSolverZ3)
+        finally:
+            GameRegistry.backend_statistics = previous_statistics
+
+
+if __name__ == '__main__':
+    unittest.main()
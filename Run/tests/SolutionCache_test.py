@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+from Domain.Puzzles.Slant.SlantSolver import SlantSolver
+from Domain.Puzzles.Sudoku.Sudoku.SudokuSolver import SudokuSolver
+from Run.SolutionCache import SolutionCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SolutionCacheTests(TestCase):
+    def test_key_depends_on_solver_and_content_only(self):
+        key = SolutionCache.key(SudokuSolver, [[1, 2], [3, 4]], [])
+        self.assertEqual(key, SolutionCache.key(SudokuSolver, [[1, 2], [3, 4]], None))
+        self.assertNotEqual(key, SolutionCache.key(SudokuSolver, [[1, 2], [4, 3]], []))
+        self.assertNotEqual(key, SolutionCache.key(SlantSolver, [[1, 2], [3, 4]], []))
+        self.assertNotEqual(key, SolutionCache.key(SudokuSolver, [[1, 2], [3, 4]], [[1]]))
+
+    def test_miss_then_hit(self):
+        cache = SolutionCache()
+        self.assertIsNone(cache.get('key'))
+        cache.put('key', {'status': 'solved'})
+        self.assertEqual({'status': 'solved'}, cache.get('key'))
+        stats = cache.stats()
+        self.assertEqual(1, stats['memory_hits'])
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(0.5, stats['hit_rate'])
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = SolutionCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(1, cache.get('a'))
+        self.assertEqual(3, cache.get('c'))
+        self.assertEqual(1, cache.stats()['evictions'])
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = SolutionCache(ttl_seconds=60, clock=clock)
+        cache.put('key', 1)
+        clock.now += 59
+        self.assertEqual(1, cache.get('key'))
+        clock.now += 2
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(1, cache.stats()['expirations'])
+
+    def test_disk_tier_survives_new_cache_instance(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'solutions.sqlite')
+            SolutionCache(path=path).put('key', {'solution': [[1, 2]]})
+            cache = SolutionCache(path=path)
+            self.assertEqual({'solution': [[1, 2]]}, cache.get('key'))
+            self.assertEqual(1, cache.stats()['disk_hits'])
+            self.assertEqual({'solution': [[1, 2]]}, cache.get('key'))
+            self.assertEqual(1, cache.stats()['memory_hits'])
+
+    def test_disk_tier_is_bounded_and_expires(self):
+        clock = FakeClock()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'solutions.sqlite')
+            cache = SolutionCache(max_entries=1, ttl_seconds=100, path=path, max_disk_entries=2, clock=clock)
+            for index, key in enumerate(['a', 'b', 'c']):
+                clock.now += 1
+                cache.put(key, index)
+            self.assertEqual(2, cache.stats()['disk_entries'])
+            self.assertIsNone(SolutionCache(path=path).get('a'))
+            clock.now += 200
+            self.assertIsNone(cache.get('b'))
+
+    def test_clear(self):
+        cache = SolutionCache()
+        cache.put('key', 1)
+        cache.clear()
+        self.assertIsNone(cache.get('key'))
+
+
+if __name__ == '__main__':
+    unittest.main()
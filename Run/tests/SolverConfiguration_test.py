@@ -0,0 +1,61 @@
+import os
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+
+from Domain.Board.Grid import Grid
+from Domain.Puzzles.Masyu.MasyuSolver import MasyuSolver
+from Domain.Puzzles.Sudoku.Sudoku.SudokuSolver import SudokuSolver
+from Run.GameComponentFactory import GameComponentFactory
+from Run.SolverConfiguration import SolverConfiguration
+
+
+class SolverConfigurationTests(TestCase):
+    def test_environment_variables(self):
+        environment = {'PUZZLE_SOLVER_WORKERS': '16', 'PUZZLE_SOLVER_TIME_LIMIT': '2.5', 'PUZZLE_SOLVER_SEED': '7', 'PUZZLE_SOLVER_PROFILE': 'single_thread'}
+        with patch.dict(os.environ, environment):
+            configuration = SolverConfiguration.from_environment()
+        self.assertEqual(SolverConfiguration(16, 2.5, 7, 'single_thread'), configuration)
+
+    def test_merged_with_overrides_only_given_fields(self):
+        configuration = SolverConfiguration(num_workers=4, random_seed=3).merged_with({'max_time_in_seconds': 10})
+        self.assertEqual(SolverConfiguration(4, 10.0, 3, None), configuration)
+
+    def test_merged_with_rejects_unknown_fields(self):
+        with self.assertRaises(ValueError):
+            SolverConfiguration().merged_with({'workers': 4})
+
+    def test_invalid_values_are_rejected(self):
+        with self.assertRaises(ValueError):
+            SolverConfiguration(num_workers=0)
+        with self.assertRaises(ValueError):
+            SolverConfiguration(max_time_in_seconds=-1)
+        with self.assertRaises(ValueError):
+            SolverConfiguration(profile='unknown')
+
+    def test_profile_by_puzzle_family(self):
+        self.assertEqual('loop', SolverConfiguration().profile_for(MasyuSolver))
+        self.assertEqual('default', SolverConfiguration().profile_for(SudokuSolver))
+        self.assertEqual('single_thread', SolverConfiguration(profile='single_thread').profile_for(MasyuSolver))
+
+    def test_create_solver_applies_configuration(self):
+        grid = Grid([[-1] * 4 for _ in range(4)])
+        solver = GameComponentFactory.create_solver(SudokuSolver, grid, SolverConfiguration(num_workers=3, max_time_in_seconds=5, random_seed=11))
+        parameters = solver._solver.parameters
+        self.assertEqual(3, parameters.num_workers)
+        self.assertEqual(5, parameters.max_time_in_seconds)
+        self.assertEqual(11, parameters.random_seed)
+        self.assertNotEqual(Grid.empty(), solver.get_solution())
+
+    def test_family_profile_is_applied(self):
+        solver = GameComponentFactory.create_solver(MasyuSolver, Grid([[' '] * 4 for _ in range(4)]), SolverConfiguration(num_workers=2))
+        self.assertEqual(2, solver._solver.parameters.linearization_level)
+        self.assertEqual(2, solver._solver.parameters.num_workers)
+
+    def test_profile_can_fix_workers(self):
+        solver = GameComponentFactory.create_solver(MasyuSolver, Grid([[' '] * 4 for _ in range(4)]), SolverConfiguration(num_workers=8, profile='single_thread'))
+        self.assertEqual(1, solver._solver.parameters.num_workers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import re
+import time
+import unittest
+from unittest import TestCase
+
+from Run.GameRegistry import GameRegistry
+from Run.UrlDispatcher import UrlDispatcher
+from Run.UrlPatternMatcher import UrlPatternMatcher
+
+
+class UrlDispatcherLongTests(TestCase):
+    @staticmethod
+    def _linear_scan(patterns: list[str], url: str) -> str | None:
+        return next((pattern for pattern in patterns if re.match(pattern, url)), None)
+
+    @staticmethod
+    def _time_per_lookup(lookup, urls: list[str], repetitions: int = 200) -> float:
+        start = time.perf_counter()
+        for _ in range(repetitions):
+            for url in urls:
+                lookup(url)
+        return (time.perf_counter() - start) / (repetitions * len(urls))
+
+    def test_compiled_dispatch_is_faster_than_linear_scan(self):
+        UrlPatternMatcher()
+        patterns = GameRegistry._dispatcher.patterns
+        urls = [f"{UrlDispatcher.example_url(pattern)}/puzzle-{index}" for index, pattern in enumerate(patterns)]
+        uncached_dispatcher = UrlDispatcher(max_cached_urls=0)
+        for pattern in patterns:
+            uncached_dispatcher.add(pattern)
+
+        linear_seconds = self._time_per_lookup(lambda url: self._linear_scan(patterns, url), urls)
+        compiled_seconds = self._time_per_lookup(uncached_dispatcher.match, urls)
+        cached_seconds = self._time_per_lookup(GameRegistry._dispatcher.match, urls)
+        print(f"{len(patterns)} patterns: linear {linear_seconds * 1e6:.1f}µs, compiled {compiled_seconds * 1e6:.1f}µs, cached {cached_seconds * 1e6:.2f}µs per lookup")
+        self.assertLess(compiled_seconds, linear_seconds)
+        self.assertLess(cached_seconds, compiled_seconds)
+
+
+if __name__ == '__main__':
+    unittest.main()
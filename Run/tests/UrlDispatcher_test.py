@@ -0,0 +1,50 @@
+import re
+import unittest
+from unittest import TestCase
+
+from Run.GameRegistry import GameRegistry
+from Run.UrlDispatcher import AmbiguousUrlPatternError, UrlDispatcher
+from Run.UrlPatternMatcher import UrlPatternMatcher
+
+
+class UrlDispatcherTests(TestCase):
+    def test_example_url_matches_its_pattern(self):
+        self.assertEqual('https://.puzzle-sudoku.com', UrlDispatcher.example_url(r"https://.*\.puzzle-sudoku\.com"))
+        self.assertEqual('https://puzzle-minesweeper.com', UrlDispatcher.example_url(r"https://(?!.*mosaic)(?:.*\.)?puzzle-minesweeper\.com(?:/.*)?"))
+        self.assertEqual('https://a.com/00', UrlDispatcher.example_url(r"https://[a-z]+\.com/\d{2}"))
+
+    def test_more_specific_pattern_is_matched_first(self):
+        dispatcher = UrlDispatcher()
+        dispatcher.add(r"https://.*\.puzzle-futoshiki\.com")
+        dispatcher.add(r"https://.*\.puzzle-futoshiki\.com/.*renzoku")
+        self.assertEqual(r"https://.*\.puzzle-futoshiki\.com/.*renzoku", dispatcher.match("https://www.puzzle-futoshiki.com/renzoku-5x5-easy/"))
+        self.assertEqual(r"https://.*\.puzzle-futoshiki\.com", dispatcher.match("https://www.puzzle-futoshiki.com/"))
+        self.assertIsNone(dispatcher.match("https://www.puzzle-sudoku.com/"))
+
+    def test_ambiguous_patterns_are_rejected(self):
+        dispatcher = UrlDispatcher()
+        dispatcher.add(r"https://.*\.puzzle-sudoku\.com")
+        with self.assertRaises(AmbiguousUrlPatternError):
+            dispatcher.add(r"https://.*[.]puzzle-sudoku[.]com")
+
+    def test_registering_again_keeps_the_order(self):
+        dispatcher = UrlDispatcher()
+        dispatcher.add("https://a")
+        dispatcher.add("https://b")
+        dispatcher.add("https://a")
+        self.assertEqual(["https://a", "https://b"], dispatcher.patterns)
+
+    def test_registry_dispatch_matches_linear_scan_for_registered_games(self):
+        UrlPatternMatcher()
+        patterns = GameRegistry.get_all_patterns()
+        for pattern in patterns:
+            example_url = UrlDispatcher.example_url(pattern)
+            self.assertIsNotNone(example_url, pattern)
+            expected_pattern = next(candidate for candidate in patterns if re.match(candidate, example_url))
+            self.assertEqual(pattern, expected_pattern)
+            components = GameRegistry.get_components_for_url(example_url)
+            self.assertIs(GameRegistry._registry[pattern], components)
+
+
+if __name__ == '__main__':
+    unittest.main()